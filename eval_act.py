@@ -28,12 +28,84 @@ class EvalConfig:
     fps: int = 30
     duration: int = 120
     device: str | None = None
+    # Compile the ACT model with torch.compile (CUDA only); opt-in, as compiling adds startup time
+    compile_policy: bool = False
+    warmup_steps: int = 3
 
     @classmethod
     def __get_path_fields__(cls) -> list[str]:
         return ["policy"]
 
 
+class ObservationStager:
+    """Reusable host/device buffers for the per-step observation upload.
+
+    On CUDA the host buffers are pinned so the host-to-device copy can be issued with
+    `non_blocking=True`; on other devices this simply avoids reallocating every frame.
+    """
+
+    def __init__(self, device: str):
+        self.device = torch.device(device)
+        self.pin_memory = self.device.type == "cuda"
+        self._host: dict[str, torch.Tensor] = {}
+        self._device: dict[str, torch.Tensor] = {}
+        self._image: dict[str, torch.Tensor] = {}
+
+    def to_device(self, name: str, tensor: torch.Tensor) -> torch.Tensor:
+        buffer = self._device.get(name)
+        if buffer is None or buffer.shape != tensor.shape or buffer.dtype != tensor.dtype:
+            self._host[name] = torch.empty(tensor.shape, dtype=tensor.dtype, pin_memory=self.pin_memory)
+            buffer = torch.empty(tensor.shape, dtype=tensor.dtype, device=self.device)
+            self._device[name] = buffer
+
+        host = self._host[name]
+        host.copy_(tensor)
+        buffer.copy_(host, non_blocking=self.pin_memory)
+        return buffer
+
+    def image_to_device(self, name: str, frame: torch.Tensor) -> torch.Tensor:
+        """Upload a uint8 (1, H, W, C) frame and return it as float32 (1, C, H, W) in [0, 1].
+
+        The channel-first float buffer is allocated once per key; `copy_` does the layout
+        change and dtype cast in a single pass, avoiding the permute/contiguous temporaries.
+        """
+        frame = self.to_device(name, frame).permute(0, 3, 1, 2)
+        out = self._image.get(name)
+        if out is None or out.shape != frame.shape:
+            out = torch.empty(frame.shape, dtype=torch.float32, device=self.device)
+            self._image[name] = out
+        out.copy_(frame)
+        return out.div_(255.0)
+
+
+def prepare_observation(
+    obs, obs_processor, dataset_features, stager, camera_keys, image_keys
+) -> dict[str, torch.Tensor]:
+    """Convert a raw robot observation into a batched policy input on the stager's device.
+
+    `camera_keys` are the raw observation keys holding HWC frames and `image_keys` the
+    corresponding dataset frame keys; both are computed once outside the control loop.
+    """
+    # Resize images to match model expectations (640x480) if needed
+    for key in camera_keys:
+        h, w = obs[key].shape[:2]
+        if h != 480 or w != 640:
+            obs[key] = cv2.resize(obs[key], (640, 480))
+    obs_processed = obs_processor(obs)
+
+    obs_dict = build_dataset_frame(dataset_features, obs_processed, prefix="observation")
+
+    for name in obs_dict:
+        # Images are uploaded as uint8 HWC; layout change and normalization run on the device.
+        tensor = torch.from_numpy(obs_dict[name]).unsqueeze(0)
+        if name in image_keys:
+            obs_dict[name] = stager.image_to_device(name, tensor)
+        else:
+            obs_dict[name] = stager.to_device(name, tensor)
+
+    return obs_dict
+
+
 @wrap()
 def eval_act(cfg: EvalConfig):
     # Determine device
@@ -54,6 +126,11 @@ def eval_act(cfg: EvalConfig):
     policy = ACTPolicy.from_pretrained(pretrained_path)
     policy = policy.to(device)
     policy.eval()
+    # Any CUDA device, including an explicit index such as "cuda:1"
+    compile_policy = cfg.compile_policy and torch.device(device).type == "cuda"
+    if compile_policy:
+        # Only the inner model is compiled; select_action keeps its Python-side action queue.
+        policy.model = torch.compile(policy.model, mode="reduce-overhead", fullgraph=False)
     print("Policy loaded!")
 
     # Load preprocessor/postprocessor
@@ -74,11 +151,32 @@ def eval_act(cfg: EvalConfig):
     action_processor = make_default_robot_action_processor()
 
     dataset_features = hw_to_dataset_features(robot.observation_features, "observation")
+    stager = ObservationStager(device)
+    action_keys = list(robot.action_features)
+    camera_keys = [
+        key
+        for key, ft in robot.observation_features.items()
+        if isinstance(ft, tuple) and len(ft) == 3 and "image" in key
+    ]
+    image_keys = frozenset(key for key in dataset_features if "image" in key)
 
     action_interval = 1.0 / cfg.fps
     action_count = 0
     chunk_size = policy.config.chunk_size
 
+    if compile_policy:
+        # The first compiled calls trigger compilation and CUDA graph capture; run them on a real
+        # observation before the timed loop so they don't stall the control cadence.
+        print(f"Warming up compiled policy ({cfg.warmup_steps} steps)...")
+        obs_dict = prepare_observation(
+            robot.get_observation(), obs_processor, dataset_features, stager, camera_keys, image_keys
+        )
+        with torch.inference_mode():
+            preprocessed = preprocessor(obs_dict)
+            for _ in range(cfg.warmup_steps):
+                policy.predict_action_chunk(preprocessed)
+        policy.reset()
+
     print(f"Running for {cfg.duration}s at {cfg.fps} FPS (chunk_size={chunk_size})")
     print("Press Ctrl+C to stop\n")
 
@@ -88,33 +186,20 @@ def eval_act(cfg: EvalConfig):
             step_start = time.perf_counter()
 
             # Get observation
-            obs = robot.get_observation()
-            # Resize images to match model expectations (640x480) if needed
-            for key in obs:
-                if hasattr(obs[key], 'shape') and len(obs[key].shape) == 3 and 'image' in key:
-                    h, w = obs[key].shape[:2]
-                    if h != 480 or w != 640:
-                        obs[key] = cv2.resize(obs[key], (640, 480))
-            obs_processed = obs_processor(obs)
-
-            obs_dict = build_dataset_frame(dataset_features, obs_processed, prefix="observation")
-
-            for name in obs_dict:
-                obs_dict[name] = torch.from_numpy(obs_dict[name])
-                if "image" in name:
-                    obs_dict[name] = obs_dict[name].float() / 255.0
-                    obs_dict[name] = obs_dict[name].permute(2, 0, 1).contiguous()
-                obs_dict[name] = obs_dict[name].unsqueeze(0).to(device)
+            obs_dict = prepare_observation(
+                robot.get_observation(), obs_processor, dataset_features, stager, camera_keys, image_keys
+            )
 
             # select_action returns a single action (1, action_dim);
             # the policy internally manages its own action chunk buffer
-            with torch.no_grad():
+            with torch.inference_mode():
                 preprocessed = preprocessor(obs_dict)
                 action = policy.select_action(preprocessed)
                 action = postprocessor(action)
 
-            action = action.squeeze(0).cpu()
-            action_dict = {key: action[i].item() for i, key in enumerate(robot.action_features)}
+            # Single device-to-host readback for the whole action vector
+            action_values = action.squeeze(0).cpu().numpy().tolist()
+            action_dict = dict(zip(action_keys, action_values))
             action_out = action_processor((action_dict, None))
             robot.send_action(action_out)
 
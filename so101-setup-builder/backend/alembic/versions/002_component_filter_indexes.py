@@ -0,0 +1,48 @@
+"""Component filter indexes
+
+Revision ID: 002
+Revises: 001
+Create Date: 2026-10-15
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+revision: str = '002'
+down_revision: Union[str, None] = '001'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.execute('CREATE EXTENSION IF NOT EXISTS pg_trgm')
+
+    # Matches the common list_components WHERE shape
+    op.create_index(
+        'ix_components_cat_arm_default',
+        'components',
+        ['category_id', 'arm_type', 'is_default_for_so101']
+    )
+
+    # Make ILIKE '%search%' indexable
+    op.create_index(
+        'ix_components_name_trgm',
+        'components',
+        ['name'],
+        postgresql_using='gin',
+        postgresql_ops={'name': 'gin_trgm_ops'}
+    )
+    op.create_index(
+        'ix_components_description_trgm',
+        'components',
+        ['description'],
+        postgresql_using='gin',
+        postgresql_ops={'description': 'gin_trgm_ops'}
+    )
+
+
+def downgrade() -> None:
+    op.drop_index('ix_components_description_trgm', table_name='components')
+    op.drop_index('ix_components_name_trgm', table_name='components')
+    op.drop_index('ix_components_cat_arm_default', table_name='components')
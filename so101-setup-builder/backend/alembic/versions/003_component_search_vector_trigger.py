@@ -0,0 +1,40 @@
+"""Maintain components.search_vector with a trigger
+
+Revision ID: 003
+Revises: 002
+Create Date: 2026-10-15
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+revision: str = '003'
+down_revision: Union[str, None] = '002'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.execute(
+        """
+        CREATE TRIGGER components_search_vector_update
+        BEFORE INSERT OR UPDATE ON components
+        FOR EACH ROW EXECUTE FUNCTION
+        tsvector_update_trigger(search_vector, 'pg_catalog.english', name, description)
+        """
+    )
+
+    # Backfill existing rows
+    op.execute(
+        """
+        UPDATE components
+        SET search_vector = to_tsvector(
+            'pg_catalog.english', coalesce(name, '') || ' ' || coalesce(description, '')
+        )
+        """
+    )
+
+
+def downgrade() -> None:
+    op.execute('DROP TRIGGER IF EXISTS components_search_vector_update ON components')
@@ -0,0 +1,32 @@
+"""Setup components covering index
+
+Revision ID: 005
+Revises: 004
+Create Date: 2026-10-15
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+revision: str = '005'
+down_revision: Union[str, None] = '004'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Same key as ix_setup_components_setup_id, but lookups by setup can be index-only
+    op.create_index(
+        'ix_setup_components_setup_covering',
+        'setup_components',
+        ['setup_id'],
+        postgresql_include=['id', 'component_id', 'quantity', 'selected_vendor_id', 'notes']
+    )
+    op.drop_index('ix_setup_components_setup_id', table_name='setup_components')
+    op.execute('ANALYZE setup_components')
+
+
+def downgrade() -> None:
+    op.create_index('ix_setup_components_setup_id', 'setup_components', ['setup_id'])
+    op.drop_index('ix_setup_components_setup_covering', table_name='setup_components')
@@ -0,0 +1,33 @@
+"""Component price in integer cents
+
+Revision ID: 006
+Revises: 005
+Create Date: 2026-10-15
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+revision: str = '006'
+down_revision: Union[str, None] = '005'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Generated from price, so existing writers keep working unchanged
+    op.add_column(
+        'component_prices',
+        sa.Column(
+            'price_cents',
+            sa.BigInteger(),
+            sa.Computed('round(price * 100)::bigint', persisted=True),
+            nullable=False
+        )
+    )
+
+
+def downgrade() -> None:
+    op.drop_column('component_prices', 'price_cents')
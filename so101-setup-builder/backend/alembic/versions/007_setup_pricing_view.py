@@ -0,0 +1,28 @@
+"""Setup pricing materialized view
+
+Revision ID: 007
+Revises: 006
+Create Date: 2026-10-15
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+from app.db.views import SETUP_PRICING_MV_INDEX_SQL, SETUP_PRICING_MV_SQL
+
+revision: str = '007'
+down_revision: Union[str, None] = '006'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Same definition create_all() uses, so the two cannot drift
+    op.execute(SETUP_PRICING_MV_SQL)
+    # Required for REFRESH MATERIALIZED VIEW CONCURRENTLY
+    op.execute(SETUP_PRICING_MV_INDEX_SQL)
+
+
+def downgrade() -> None:
+    op.execute('DROP MATERIALIZED VIEW IF EXISTS setup_pricing_mv')
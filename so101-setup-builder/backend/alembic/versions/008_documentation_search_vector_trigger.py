@@ -0,0 +1,40 @@
+"""Documentation search_vector trigger
+
+Revision ID: 008
+Revises: 007
+Create Date: 2026-10-15
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+revision: str = '008'
+down_revision: Union[str, None] = '007'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.execute(
+        """
+        CREATE TRIGGER documentation_search_vector_update
+        BEFORE INSERT OR UPDATE ON documentation
+        FOR EACH ROW EXECUTE FUNCTION
+        tsvector_update_trigger(search_vector, 'pg_catalog.english', title, content)
+        """
+    )
+
+    # Backfill existing rows
+    op.execute(
+        """
+        UPDATE documentation
+        SET search_vector = to_tsvector(
+            'pg_catalog.english', coalesce(title, '') || ' ' || coalesce(content, '')
+        )
+        """
+    )
+
+
+def downgrade() -> None:
+    op.execute('DROP TRIGGER IF EXISTS documentation_search_vector_update ON documentation')
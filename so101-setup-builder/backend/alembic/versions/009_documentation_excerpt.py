@@ -0,0 +1,35 @@
+"""Documentation excerpt column
+
+Revision ID: 009
+Revises: 008
+Create Date: 2026-10-15
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+revision: str = '009'
+down_revision: Union[str, None] = '008'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.add_column('documentation', sa.Column('excerpt', sa.String(220), nullable=True))
+
+    # Backfill with the same rule as make_excerpt()
+    op.execute(
+        """
+        UPDATE documentation
+        SET excerpt = CASE
+            WHEN length(content) > 200 THEN substr(content, 1, 200) || '...'
+            ELSE content
+        END
+        """
+    )
+
+
+def downgrade() -> None:
+    op.drop_column('documentation', 'excerpt')
@@ -0,0 +1,31 @@
+"""Partial index on setups.expires_at
+
+Revision ID: 010
+Revises: 009
+Create Date: 2026-10-15
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+revision: str = '010'
+down_revision: Union[str, None] = '009'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_index(
+        'ix_setups_expires_at_active',
+        'setups',
+        ['expires_at'],
+        postgresql_where=sa.text('expires_at IS NOT NULL')
+    )
+    op.drop_index('ix_setups_expires_at', table_name='setups')
+
+
+def downgrade() -> None:
+    op.create_index('ix_setups_expires_at', 'setups', ['expires_at'])
+    op.drop_index('ix_setups_expires_at_active', table_name='setups')
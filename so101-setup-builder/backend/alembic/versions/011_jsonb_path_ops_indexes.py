@@ -0,0 +1,45 @@
+"""GIN jsonb_path_ops indexes on JSONB columns
+
+Revision ID: 011
+Revises: 010
+Create Date: 2026-10-15
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+revision: str = '011'
+down_revision: Union[str, None] = '010'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_index(
+        'ix_components_specs_gin',
+        'components',
+        ['specifications'],
+        postgresql_using='gin',
+        postgresql_ops={'specifications': 'jsonb_path_ops'}
+    )
+    op.create_index(
+        'ix_documentation_tags_gin',
+        'documentation',
+        ['tags'],
+        postgresql_using='gin',
+        postgresql_ops={'tags': 'jsonb_path_ops'}
+    )
+    op.create_index(
+        'ix_documentation_metadata_gin',
+        'documentation',
+        ['metadata'],
+        postgresql_using='gin',
+        postgresql_ops={'metadata': 'jsonb_path_ops'}
+    )
+
+
+def downgrade() -> None:
+    op.drop_index('ix_documentation_metadata_gin', table_name='documentation')
+    op.drop_index('ix_documentation_tags_gin', table_name='documentation')
+    op.drop_index('ix_components_specs_gin', table_name='components')
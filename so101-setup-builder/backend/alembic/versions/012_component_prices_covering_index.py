@@ -0,0 +1,29 @@
+"""Component prices covering index
+
+Revision ID: 012
+Revises: 011
+Create Date: 2026-10-15
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+revision: str = '012'
+down_revision: Union[str, None] = '011'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_index(
+        'ix_component_prices_component_price',
+        'component_prices',
+        ['component_id', 'price'],
+        postgresql_include=['vendor_id', 'in_stock', 'price_cents']
+    )
+    op.execute('ANALYZE component_prices')
+
+
+def downgrade() -> None:
+    op.drop_index('ix_component_prices_component_price', table_name='component_prices')
@@ -0,0 +1,67 @@
+"""Generate components.search_vector instead of maintaining it with a trigger
+
+Revision ID: 013
+Revises: 012
+Create Date: 2026-10-15
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+revision: str = '013'
+down_revision: Union[str, None] = '012'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.execute('DROP TRIGGER IF EXISTS components_search_vector_update ON components')
+    op.drop_index('ix_components_search_vector', table_name='components')
+    op.drop_column('components', 'search_vector')
+
+    # A stored generated column is filled for existing rows as part of the ALTER
+    op.add_column(
+        'components',
+        sa.Column(
+            'search_vector',
+            postgresql.TSVECTOR(),
+            sa.Computed(
+                "to_tsvector('pg_catalog.english', name || ' ' || coalesce(description, ''))",
+                persisted=True
+            ),
+            nullable=True
+        )
+    )
+    op.create_index(
+        'ix_components_search_vector', 'components', ['search_vector'], postgresql_using='gin'
+    )
+
+
+def downgrade() -> None:
+    op.drop_index('ix_components_search_vector', table_name='components')
+    op.drop_column('components', 'search_vector')
+    op.add_column(
+        'components', sa.Column('search_vector', postgresql.TSVECTOR(), nullable=True)
+    )
+    op.create_index(
+        'ix_components_search_vector', 'components', ['search_vector'], postgresql_using='gin'
+    )
+    op.execute(
+        """
+        CREATE TRIGGER components_search_vector_update
+        BEFORE INSERT OR UPDATE ON components
+        FOR EACH ROW EXECUTE FUNCTION
+        tsvector_update_trigger(search_vector, 'pg_catalog.english', name, description)
+        """
+    )
+    op.execute(
+        """
+        UPDATE components
+        SET search_vector = to_tsvector(
+            'pg_catalog.english', coalesce(name, '') || ' ' || coalesce(description, '')
+        )
+        """
+    )
@@ -0,0 +1,51 @@
+"""Server-side timestamptz created_at/updated_at
+
+Revision ID: 014
+Revises: 013
+Create Date: 2026-10-15
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+revision: str = '014'
+down_revision: Union[str, None] = '013'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# Existing values were written as naive UTC
+TIMESTAMP_COLUMNS = {
+    'categories': ['created_at', 'updated_at'],
+    'vendors': ['created_at', 'updated_at'],
+    'components': ['created_at', 'updated_at'],
+    'component_prices': ['price_fetched_at', 'created_at', 'updated_at'],
+    'setups': ['created_at', 'updated_at'],
+    'setup_components': ['created_at'],
+    'documentation': ['created_at', 'updated_at'],
+}
+
+
+def upgrade() -> None:
+    for table, columns in TIMESTAMP_COLUMNS.items():
+        for column in columns:
+            op.alter_column(
+                table,
+                column,
+                type_=sa.DateTime(timezone=True),
+                postgresql_using=f"{column} AT TIME ZONE 'UTC'",
+                server_default=sa.text('now()')
+            )
+
+
+def downgrade() -> None:
+    for table, columns in TIMESTAMP_COLUMNS.items():
+        for column in columns:
+            op.alter_column(
+                table,
+                column,
+                type_=sa.DateTime(),
+                postgresql_using=f"{column} AT TIME ZONE 'UTC'",
+                server_default=None
+            )
@@ -0,0 +1,38 @@
+"""Cascade setup deletes to setup_components in the database
+
+Revision ID: 015
+Revises: 014
+Create Date: 2026-10-15
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+revision: str = '015'
+down_revision: Union[str, None] = '014'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.drop_constraint(
+        'setup_components_setup_id_fkey', 'setup_components', type_='foreignkey'
+    )
+    op.create_foreign_key(
+        'setup_components_setup_id_fkey',
+        'setup_components',
+        'setups',
+        ['setup_id'],
+        ['id'],
+        ondelete='CASCADE'
+    )
+
+
+def downgrade() -> None:
+    op.drop_constraint(
+        'setup_components_setup_id_fkey', 'setup_components', type_='foreignkey'
+    )
+    op.create_foreign_key(
+        'setup_components_setup_id_fkey', 'setup_components', 'setups', ['setup_id'], ['id']
+    )
@@ -0,0 +1,30 @@
+"""Documentation content hash column
+
+Revision ID: 016
+Revises: 015
+Create Date: 2026-10-15
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+revision: str = '016'
+down_revision: Union[str, None] = '015'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.add_column('documentation', sa.Column('content_sha256', sa.String(64), nullable=True))
+
+    # Backfill with the same digest sync_docs computes (SHA-256 of the UTF-8 content)
+    op.execute(
+        "UPDATE documentation "
+        "SET content_sha256 = encode(sha256(convert_to(content, 'UTF8')), 'hex')"
+    )
+
+
+def downgrade() -> None:
+    op.drop_column('documentation', 'content_sha256')
@@ -0,0 +1,73 @@
+"""Generate documentation.search_vector instead of maintaining it with a trigger
+
+Revision ID: 017
+Revises: 016
+Create Date: 2026-10-15
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+revision: str = '017'
+down_revision: Union[str, None] = '016'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.execute('DROP TRIGGER IF EXISTS documentation_search_vector_update ON documentation')
+    op.drop_index('ix_documentation_search_vector', table_name='documentation')
+    op.drop_column('documentation', 'search_vector')
+
+    # A stored generated column is filled for existing rows as part of the ALTER
+    op.add_column(
+        'documentation',
+        sa.Column(
+            'search_vector',
+            postgresql.TSVECTOR(),
+            sa.Computed(
+                "to_tsvector('pg_catalog.english', title || ' ' || content)",
+                persisted=True
+            ),
+            nullable=True
+        )
+    )
+    op.create_index(
+        'ix_documentation_search_vector',
+        'documentation',
+        ['search_vector'],
+        postgresql_using='gin'
+    )
+
+
+def downgrade() -> None:
+    op.drop_index('ix_documentation_search_vector', table_name='documentation')
+    op.drop_column('documentation', 'search_vector')
+    op.add_column(
+        'documentation', sa.Column('search_vector', postgresql.TSVECTOR(), nullable=True)
+    )
+    op.create_index(
+        'ix_documentation_search_vector',
+        'documentation',
+        ['search_vector'],
+        postgresql_using='gin'
+    )
+    op.execute(
+        """
+        CREATE TRIGGER documentation_search_vector_update
+        BEFORE INSERT OR UPDATE ON documentation
+        FOR EACH ROW EXECUTE FUNCTION
+        tsvector_update_trigger(search_vector, 'pg_catalog.english', title, content)
+        """
+    )
+    op.execute(
+        """
+        UPDATE documentation
+        SET search_vector = to_tsvector(
+            'pg_catalog.english', coalesce(title, '') || ' ' || coalesce(content, '')
+        )
+        """
+    )
@@ -0,0 +1,42 @@
+"""Normalize stored wizard budgets
+
+Revision ID: 018
+Revises: 017
+Create Date: 2026-10-15
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+revision: str = '018'
+down_revision: Union[str, None] = '017'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Step answers used to be stored as sent; store budgets as the integer WizardProfile
+    # coerces them to (e.g. "500" or 500.0 -> 500), as update_wizard_step now does
+    op.execute(
+        "UPDATE setups "
+        "SET wizard_profile = jsonb_set("
+        "wizard_profile, '{budget}', to_jsonb(trim(wizard_profile->>'budget')::integer)"
+        ") "
+        "WHERE jsonb_typeof(wizard_profile->'budget') = 'string' "
+        "AND wizard_profile->>'budget' ~ '^\\s*\\d+\\s*$'"
+    )
+    op.execute(
+        "UPDATE setups "
+        "SET wizard_profile = jsonb_set("
+        "wizard_profile, '{budget}', to_jsonb((wizard_profile->>'budget')::numeric::integer)"
+        ") "
+        "WHERE jsonb_typeof(wizard_profile->'budget') = 'number' "
+        "AND scale((wizard_profile->>'budget')::numeric) > 0 "
+        "AND (wizard_profile->>'budget')::numeric = trunc((wizard_profile->>'budget')::numeric)"
+    )
+
+
+def downgrade() -> None:
+    # Normalized values are valid under the old code as well
+    pass
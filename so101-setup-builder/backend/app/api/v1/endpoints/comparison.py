@@ -1,3 +1,4 @@
+from collections import defaultdict
 from decimal import Decimal
 
 from fastapi import APIRouter, Depends, HTTPException, status
@@ -12,7 +13,8 @@ from app.api.v1.schemas.comparison import (
     SpecificationComparison,
 )
 from app.db.database import get_db
-from app.db.models import Component, ComponentPrice
+from app.db.models import Component
+from app.db.queries import lowest_price_subquery
 
 router = APIRouter()
 
@@ -52,14 +54,18 @@ async def compare_components(
             detail="Maximum 5 components can be compared at once",
         )
 
-    # Fetch all components
-    query = select(Component).options(
-        selectinload(Component.category),
-        selectinload(Component.prices).selectinload(ComponentPrice.vendor),
-    ).where(Component.id.in_(request.component_ids))
+    # Fetch all components with their lowest price aggregated in SQL
+    lowest = lowest_price_subquery(request.component_ids)
+    query = (
+        select(Component, lowest.c.lowest_price)
+        .outerjoin(lowest, lowest.c.component_id == Component.id)
+        .options(selectinload(Component.category))
+        .where(Component.id.in_(request.component_ids))
+    )
 
     result = await db.execute(query)
-    components = result.scalars().unique().all()
+    rows = result.all()
+    components = [component for component, _ in rows]
 
     if len(components) != len(request.component_ids):
         found_ids = {c.id for c in components}
@@ -71,17 +77,14 @@ async def compare_components(
 
     # Build comparison items and collect all spec keys
     comparison_items = []
-    all_specs = {}
+    all_specs = defaultdict(dict)
     price_comparison = {}
 
-    for component in components:
-        # Get lowest price
-        lowest_price = None
-        if component.prices:
-            lowest_price = min(p.price for p in component.prices)
-
+    # Response models are built with model_construct: every value comes straight from
+    # typed ORM columns, so field validation would only re-check known-good data
+    for component, lowest_price in rows:
         comparison_items.append(
-            ComparisonItem(
+            ComparisonItem.model_construct(
                 id=component.id,
                 name=component.name,
                 slug=component.slug,
@@ -98,8 +101,6 @@ async def compare_components(
 
         # Collect all specification keys
         for key, value in (component.specifications or {}).items():
-            if key not in all_specs:
-                all_specs[key] = {}
             all_specs[key][component.id] = value
 
     # Build specification comparisons
@@ -110,7 +111,7 @@ async def compare_components(
     for key, values in all_specs.items():
         display_name = SPEC_DISPLAY_NAMES.get(key, key.replace("_", " ").title())
 
-        spec_comparison = SpecificationComparison(
+        spec_comparison = SpecificationComparison.model_construct(
             key=key,
             display_name=display_name,
             values=values,
@@ -118,9 +119,16 @@ async def compare_components(
         )
         specifications.append(spec_comparison)
 
-        # Check if values are common or differ
-        unique_values = set(str(v) for v in values.values())
-        if len(unique_values) == 1 and len(values) == len(components):
+        # Check if values are common or differ (a spec is common only if every
+        # component has it with the same value)
+        if len(values) == len(components):
+            it = iter(values.values())
+            first = str(next(it))
+            is_common = all(str(v) == first for v in it)
+        else:
+            is_common = False
+
+        if is_common:
             common_specs.append(key)
         else:
             differing_specs.append(key)
@@ -2,7 +2,8 @@ from decimal import Decimal
 from typing import Optional
 
 from fastapi import APIRouter, Depends, HTTPException, Query, status
-from sqlalchemy import select, func, or_
+from fastapi.responses import Response
+from sqlalchemy import select, func, or_, exists
 from sqlalchemy.orm import selectinload
 from sqlalchemy.ext.asyncio import AsyncSession
 
@@ -13,18 +14,44 @@ from app.api.v1.schemas.component import (
     CategoryInfo,
     VendorPriceInfo,
 )
+from app.cache import ORJSONResponse, RedisResponseCache, TTLCache, hash_key
+from app.config import get_settings
 from app.db.database import get_db
 from app.db.models import Component, Category, ComponentPrice, Vendor
+from app.db.queries import lowest_price_subquery
 
 router = APIRouter()
 
+# Categories change rarely; serve the serialized list from memory for a minute
+_categories_cache = TTLCache(ttl=60)
+
+# Serialized list pages keyed by their filters; dropped when components or prices change
+component_list_cache = RedisResponseCache(
+    "components:list", ttl=get_settings().response_cache_ttl_seconds
+)
+
+
+def component_to_response(
+    component: Component,
+    lowest_price: Decimal | None = None,
+    category: Category | None = None,
+    component_prices: list[ComponentPrice] | None = None,
+) -> ComponentResponse:
+    """Convert a Component model to response schema.
+
+    ``lowest_price`` can be passed in when it was already aggregated in SQL, and
+    ``category``/``component_prices`` when they are already known, so the unloaded
+    relationships are never touched.
+    """
+    if category is None:
+        category = component.category
+    if component_prices is None:
+        component_prices = component.prices
 
-def component_to_response(component: Component) -> ComponentResponse:
-    """Convert a Component model to response schema."""
     prices = []
-    lowest = None
+    lowest = lowest_price
 
-    for price in component.prices:
+    for price in component_prices:
         prices.append(
             VendorPriceInfo(
                 vendor_id=price.vendor_id,
@@ -37,7 +64,7 @@ def component_to_response(component: Component) -> ComponentResponse:
                 price_fetched_at=price.price_fetched_at,
             )
         )
-        if lowest is None or price.price < lowest:
+        if lowest_price is None and (lowest is None or price.price < lowest):
             lowest = price.price
 
     return ComponentResponse(
@@ -51,10 +78,10 @@ def component_to_response(component: Component) -> ComponentResponse:
         arm_type=component.arm_type,
         image_url=component.image_url,
         category=CategoryInfo(
-            id=component.category.id,
-            name=component.category.name,
-            slug=component.category.slug,
-            icon=component.category.icon,
+            id=category.id,
+            name=category.name,
+            slug=category.slug,
+            icon=category.icon,
         ),
         prices=prices,
         lowest_price=lowest,
@@ -78,76 +105,117 @@ async def list_components(
     db: AsyncSession = Depends(get_db),
 ):
     """List components with filters and pagination."""
-    query = select(Component).options(
-        selectinload(Component.category),
-        selectinload(Component.prices).selectinload(ComponentPrice.vendor),
-    )
-
-    # Apply filters
-    if category_id:
-        query = query.where(Component.category_id == category_id)
-
-    if category_slug:
-        query = query.join(Category).where(Category.slug == category_slug)
-
-    if search:
-        search_filter = or_(
-            Component.name.ilike(f"%{search}%"),
-            Component.description.ilike(f"%{search}%"),
-        )
-        query = query.where(search_filter)
+    cache_key = hash_key("page", [
+        category_id, category_slug, search, min_price, max_price,
+        is_default_for_so101, arm_type, in_stock_only, page, page_size,
+    ])
+    generation = await component_list_cache.generation()
+    cached = await component_list_cache.get(generation, cache_key)
+    if cached is not None:
+        return Response(content=cached, media_type="application/json")
+
+    def apply_filters(q):
+        if category_id:
+            q = q.where(Component.category_id == category_id)
+
+        if category_slug:
+            q = q.join(Category).where(Category.slug == category_slug)
+
+        if search:
+            if len(search) < 3:
+                # Too short for meaningful full-text terms; trigram-indexed substring match
+                search_filter = or_(
+                    Component.name.ilike(f"%{search}%"),
+                    Component.description.ilike(f"%{search}%"),
+                )
+            else:
+                # GIN-indexed full-text match, plus a trigram-indexed name match so partial
+                # model numbers (e.g. "sts32") still hit
+                search_filter = or_(
+                    Component.search_vector.op("@@")(
+                        func.websearch_to_tsquery("english", search)
+                    ),
+                    Component.name.ilike(f"%{search}%"),
+                )
+            q = q.where(search_filter)
+
+        if is_default_for_so101 is not None:
+            q = q.where(Component.is_default_for_so101 == is_default_for_so101)
+
+        if arm_type:
+            q = q.where(or_(Component.arm_type == arm_type, Component.arm_type == "both"))
+
+        # Stock filtering (components without any listed price are kept)
+        if in_stock_only:
+            has_prices = exists().where(ComponentPrice.component_id == Component.id)
+            has_stock = exists().where(
+                ComponentPrice.component_id == Component.id,
+                ComponentPrice.in_stock.is_(True),
+            )
+            q = q.where(or_(~has_prices, has_stock))
 
-    if is_default_for_so101 is not None:
-        query = query.where(Component.is_default_for_so101 == is_default_for_so101)
+        return q
 
-    if arm_type:
-        query = query.where(
-            or_(Component.arm_type == arm_type, Component.arm_type == "both")
+    offset = (page - 1) * page_size
+    price_filtered = min_price is not None or max_price is not None
+
+    # Aggregate prices only for the components that can appear: the filtered ones when
+    # filtering on price, otherwise just this page's
+    price_scope = apply_filters(select(Component.id))
+    if not price_filtered:
+        price_scope = price_scope.order_by(Component.id).offset(offset).limit(page_size)
+    lowest = lowest_price_subquery(price_scope)
+
+    def apply_price_filters(q):
+        # Price filtering against the SQL-aggregated lowest price
+        if min_price is not None:
+            q = q.where(lowest.c.lowest_price >= min_price)
+
+        if max_price is not None:
+            q = q.where(lowest.c.lowest_price <= max_price)
+
+        return q
+
+    query = apply_price_filters(apply_filters(
+        select(Component, lowest.c.lowest_price)
+        .outerjoin(lowest, lowest.c.component_id == Component.id)
+        .options(
+            selectinload(Component.category),
+            selectinload(Component.prices).selectinload(ComponentPrice.vendor),
         )
-
-    # Count total
-    count_query = select(func.count()).select_from(query.subquery())
-    total_result = await db.execute(count_query)
+    ))
+
+    # Count total with a plain count over the filtered components (no eager loads or
+    # subquery wrap); the price aggregate is only joined when a price filter needs it
+    count_query = select(func.count(Component.id)).select_from(Component)
+    if price_filtered:
+        count_query = count_query.join(lowest, lowest.c.component_id == Component.id)
+    total_result = await db.execute(apply_price_filters(apply_filters(count_query)))
     total = total_result.scalar() or 0
 
-    # Apply pagination
-    offset = (page - 1) * page_size
-    query = query.offset(offset).limit(page_size)
+    # Apply pagination, in the same id order the page's price aggregate was scoped by
+    query = query.order_by(Component.id).offset(offset).limit(page_size)
 
-    result = await db.execute(query)
-    components = result.scalars().unique().all()
-
-    # Filter by price if needed (after fetching to include price data)
-    items = []
-    for component in components:
-        response = component_to_response(component)
-
-        # Price filtering
-        if min_price is not None and (
-            response.lowest_price is None or response.lowest_price < min_price
-        ):
-            continue
-        if max_price is not None and (
-            response.lowest_price is None or response.lowest_price > max_price
-        ):
-            continue
-
-        # Stock filtering
-        if in_stock_only and response.prices:
-            if not any(p.in_stock for p in response.prices):
-                continue
-
-        items.append(response)
+    # Stream the page and build response items as rows arrive (yield_per batches the
+    # selectin loads) instead of materializing the whole result first
+    result = await db.stream(query.execution_options(yield_per=page_size))
+    items = [
+        component_to_response(component, lowest_price)
+        async for component, lowest_price in result
+    ]
 
     total_pages = (total + page_size - 1) // page_size
 
-    return ComponentListResponse(
+    content = ComponentListResponse(
         items=items,
         total=total,
         page=page,
         page_size=page_size,
         total_pages=total_pages,
-    )
+    ).model_dump_json()
+    await component_list_cache.set(generation, cache_key, content)
+
+    return Response(content=content, media_type="application/json")
 
 
 @router.get("/so101-defaults")
@@ -166,18 +234,15 @@ async def get_so101_defaults(
             or_(Component.arm_type == "follower", Component.arm_type == "both")
         )
 
-    result = await db.execute(query)
-    components = result.scalars().unique().all()
-
-    items = [component_to_response(c) for c in components]
+    result = await db.stream_scalars(query)
+    items = [component_to_response(c) async for c in result]
 
     # Calculate totals
     total_cost = Decimal("0")
     for item in items:
         if item.lowest_price:
-            total_cost += item.lowest_price * item.quantity_per_arm
-            if arm_type == "dual" and item.arm_type in ("leader", "follower"):
-                total_cost += item.lowest_price * item.quantity_per_arm
+            multiplier = 2 if arm_type == "dual" and item.arm_type in ("leader", "follower") else 1
+            total_cost += item.lowest_price * item.quantity_per_arm * multiplier
 
     return {
         "arm_type": arm_type,
@@ -190,18 +255,23 @@ async def get_so101_defaults(
 @router.get("/categories")
 async def list_categories(db: AsyncSession = Depends(get_db)):
     """List all component categories."""
-    result = await db.execute(select(Category).order_by(Category.sort_order))
-    categories = result.scalars().all()
-
-    return [
-        CategoryInfo(
-            id=c.id,
-            name=c.name,
-            slug=c.slug,
-            icon=c.icon,
-        )
-        for c in categories
-    ]
+    cached = _categories_cache.get()
+    if cached is None:
+        result = await db.execute(select(Category).order_by(Category.sort_order))
+        categories = result.scalars().all()
+
+        cached = [
+            CategoryInfo(
+                id=c.id,
+                name=c.name,
+                slug=c.slug,
+                icon=c.icon,
+            ).model_dump()
+            for c in categories
+        ]
+        _categories_cache.set(None, cached)
+
+    return ORJSONResponse(content=cached)
 
 
 @router.get("/{component_id}", response_model=ComponentResponse)
@@ -233,11 +303,9 @@ async def create_component(
     db: AsyncSession = Depends(get_db),
 ):
     """Create a new component (admin only in production)."""
-    # Check category exists
-    cat_result = await db.execute(
-        select(Category).where(Category.id == component.category_id)
-    )
-    if not cat_result.scalar_one_or_none():
+    # Check category exists; the loaded row is reused for the response
+    category = await db.get(Category, component.category_id)
+    if not category:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail="Category not found",
@@ -255,16 +323,10 @@ async def create_component(
         image_url=component.image_url,
     )
     db.add(db_component)
+    # The INSERT returns the new id and server-side timestamps, and all other columns
+    # have client-side defaults the ORM keeps on the instance, so no refresh is needed
     await db.commit()
-    await db.refresh(db_component)
-
-    # Reload with relationships
-    query = select(Component).options(
-        selectinload(Component.category),
-        selectinload(Component.prices),
-    ).where(Component.id == db_component.id)
-
-    result = await db.execute(query)
-    component = result.scalar_one()
+    await component_list_cache.invalidate_all()
 
-    return component_to_response(component)
+    # A new component has no prices yet and its category was fetched above
+    return component_to_response(db_component, category=category, component_prices=[])
@@ -1,84 +1,147 @@
 from typing import Optional
 
-from fastapi import APIRouter, Depends, HTTPException, Query, status
-from sqlalchemy import select, func, or_
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, status
+from sqlalchemy import case, select, func, literal, literal_column, or_
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.db.database import get_db
+from app.cache import TTLCache, cacheable_response, make_etag, not_modified
+from app.db.database import get_readonly_db
 from app.db.models import Documentation
 
 router = APIRouter()
 
+# Categories only change when docs are synced; keep (payload, etag) in memory for a minute
+_categories_cache = TTLCache(ttl=60)
+
 
 @router.get("")
 async def list_documentation(
+    request: Request,
     category: Optional[str] = None,
     search: Optional[str] = None,
     page: int = Query(1, ge=1),
     page_size: int = Query(20, ge=1, le=100),
-    db: AsyncSession = Depends(get_db),
+    after_id: Optional[int] = Query(None, ge=0),
+    db: AsyncSession = Depends(get_readonly_db),
 ):
-    """List documentation with optional filtering."""
-    query = select(Documentation)
+    """List documentation with optional filtering.
+
+    Pass ``after_id`` (the previous response's ``next_after_id``) for keyset pagination;
+    that mode returns ``has_more`` instead of a ``total`` and ignores ``page``.
+    """
+    filters = []
 
     if category:
-        query = query.where(Documentation.category == category)
+        filters.append(Documentation.category == category)
 
     if search:
-        search_filter = or_(
-            Documentation.title.ilike(f"%{search}%"),
-            Documentation.content.ilike(f"%{search}%"),
+        filters.append(
+            or_(
+                Documentation.title.ilike(f"%{search}%"),
+                Documentation.content.ilike(f"%{search}%"),
+            )
+        )
+
+    columns = (
+        Documentation.id,
+        Documentation.title,
+        Documentation.slug,
+        Documentation.category,
+        Documentation.tags,
+        # Precomputed at sync; content is only read for rows synced before that
+        func.coalesce(Documentation.excerpt, head_excerpt(Documentation.content)).label(
+            "excerpt"
+        ),
+    )
+
+    if after_id is not None:
+        # Keyset page: seek past the cursor instead of walking offset rows, and fetch
+        # one extra row to learn whether another page follows (no count)
+        query = (
+            select(*columns)
+            .where(*filters, Documentation.id > after_id)
+            .order_by(Documentation.id)
+            .limit(page_size + 1)
         )
-        query = query.where(search_filter)
+        result = await db.execute(query)
+        rows = result.all()
+        has_more = len(rows) > page_size
+        rows = rows[:page_size]
 
-    # Count total
-    count_query = select(func.count()).select_from(query.subquery())
-    total_result = await db.execute(count_query)
-    total = total_result.scalar() or 0
+        return cacheable_response(request, {
+            "items": [_listing_item(doc) for doc in rows],
+            "page_size": page_size,
+            "has_more": has_more,
+            "next_after_id": rows[-1].id if has_more else None,
+        })
 
-    # Apply pagination
+    # The total rides along on every row via count(*) OVER (), so the filtered scan
+    # runs once instead of once more for a separate count query
     offset = (page - 1) * page_size
-    query = query.offset(offset).limit(page_size)
+    query = (
+        select(*columns, func.count().over().label("total_count"))
+        .where(*filters)
+        .order_by(Documentation.id)
+        .offset(offset)
+        .limit(page_size)
+    )
 
     result = await db.execute(query)
-    docs = result.scalars().all()
+    rows = result.all()
 
-    return {
-        "items": [
-            {
-                "id": doc.id,
-                "title": doc.title,
-                "slug": doc.slug,
-                "category": doc.category,
-                "tags": doc.tags,
-                "excerpt": doc.content[:200] + "..." if len(doc.content) > 200 else doc.content,
-            }
-            for doc in docs
-        ],
+    if rows:
+        total = rows[0].total_count
+    elif offset == 0:
+        total = 0
+    else:
+        # Page past the end: only then count separately
+        count_query = select(func.count(Documentation.id)).where(*filters)
+        total = (await db.execute(count_query)).scalar() or 0
+
+    return cacheable_response(request, {
+        "items": [_listing_item(doc) for doc in rows],
         "total": total,
         "page": page,
         "page_size": page_size,
-    }
+    })
 
 
 @router.get("/categories")
-async def list_doc_categories(db: AsyncSession = Depends(get_db)):
+async def list_doc_categories(request: Request, db: AsyncSession = Depends(get_readonly_db)):
     """List available documentation categories."""
-    query = select(Documentation.category).distinct().where(
-        Documentation.category.is_not(None)
-    )
-    result = await db.execute(query)
-    categories = result.scalars().all()
+    cached = _categories_cache.get()
+    if cached is None:
+        query = select(Documentation.category).distinct().where(
+            Documentation.category.is_not(None)
+        )
+        result = await db.execute(query)
+        categories = result.scalars().all()
 
-    return {"categories": list(categories)}
+        payload = {"categories": list(categories)}
+        cached = (payload, make_etag(payload))
+        _categories_cache.set(None, cached)
+
+    payload, etag = cached
+    return cacheable_response(request, payload, etag)
 
 
 @router.get("/{slug}")
 async def get_documentation(
+    request: Request,
     slug: str,
-    db: AsyncSession = Depends(get_db),
+    db: AsyncSession = Depends(get_readonly_db),
 ):
     """Get a single documentation page by slug."""
+    # Revalidation only needs the version columns, not the page content
+    if "if-none-match" in request.headers:
+        version = (await db.execute(
+            select(Documentation.id, Documentation.updated_at).where(Documentation.slug == slug)
+        )).one_or_none()
+        if version:
+            response = not_modified(request, make_etag([version.id, version.updated_at]))
+            if response:
+                return response
+
     query = select(Documentation).where(Documentation.slug == slug)
     result = await db.execute(query)
     doc = result.scalar_one_or_none()
@@ -89,7 +152,7 @@ async def get_documentation(
             detail="Documentation not found",
         )
 
-    return {
+    return cacheable_response(request, {
         "id": doc.id,
         "title": doc.title,
         "slug": doc.slug,
@@ -100,26 +163,40 @@ async def get_documentation(
         "metadata": doc.doc_metadata,
         "source_path": doc.source_path,
         "updated_at": doc.updated_at,
-    }
+    }, etag=make_etag([doc.id, doc.updated_at]))
 
 
 @router.get("/search/fulltext")
 async def fulltext_search(
-    q: str = Query(..., min_length=2),
+    q: str = Query(..., min_length=3),  # trigram indexes need at least 3 characters
     limit: int = Query(10, ge=1, le=50),
-    db: AsyncSession = Depends(get_db),
+    db: AsyncSession = Depends(get_readonly_db),
 ):
-    """Full-text search across documentation."""
-    # Simple ILIKE search for now (full-text search requires proper setup)
-    query = select(Documentation).where(
-        or_(
-            Documentation.title.ilike(f"%{q}%"),
-            Documentation.content.ilike(f"%{q}%"),
-        )
-    ).limit(limit)
+    """Full-text search across documentation.
 
-    result = await db.execute(query)
-    docs = result.scalars().all()
+    Ranked tsvector search first; falls back to substring matching (trigram-indexed
+    ILIKE) when the stemmed query finds nothing, e.g. for partial words.
+    """
+    tsquery = func.websearch_to_tsquery("english", q)
+    docs = await _search_documentation(
+        db,
+        q,
+        Documentation.search_vector.op("@@")(tsquery),
+        func.ts_rank(Documentation.search_vector, tsquery),
+        limit,
+    )
+
+    if not docs:
+        docs = await _search_documentation(
+            db,
+            q,
+            or_(
+                Documentation.title.ilike(f"%{q}%"),
+                Documentation.content.ilike(f"%{q}%"),
+            ),
+            literal_column("0"),  # unranked
+            limit,
+        )
 
     return {
         "query": q,
@@ -129,7 +206,7 @@ async def fulltext_search(
                 "title": doc.title,
                 "slug": doc.slug,
                 "category": doc.category,
-                "excerpt": extract_excerpt(doc.content, q),
+                "excerpt": doc.excerpt,
             }
             for doc in docs
         ],
@@ -137,22 +214,67 @@ async def fulltext_search(
     }
 
 
-def extract_excerpt(content: str, query: str, context_chars: int = 100) -> str:
-    """Extract a relevant excerpt from content around the query."""
-    lower_content = content.lower()
-    lower_query = query.lower()
+def _listing_item(doc) -> dict:
+    """Listing entry for a row selected with the listing columns."""
+    return {
+        "id": doc.id,
+        "title": doc.title,
+        "slug": doc.slug,
+        "category": doc.category,
+        "tags": doc.tags,
+        "excerpt": doc.excerpt,
+    }
+
 
-    pos = lower_content.find(lower_query)
-    if pos == -1:
-        return content[:200] + "..." if len(content) > 200 else content
+async def _search_documentation(db: AsyncSession, q: str, condition, rank, limit: int):
+    """Top ``limit`` docs matching ``condition`` by ``rank``, with an excerpt around ``q``."""
+    matches = select(
+        Documentation.id,
+        Documentation.title,
+        Documentation.slug,
+        Documentation.category,
+        Documentation.content,
+        func.strpos(func.lower(Documentation.content), func.lower(literal(q))).label("pos"),
+        func.length(Documentation.content).label("length"),
+        rank.label("rank"),
+    ).where(condition).order_by(rank.desc()).limit(limit).subquery()
 
-    start = max(0, pos - context_chars)
-    end = min(len(content), pos + len(query) + context_chars)
+    # Only the excerpt leaves the database, not the full content
+    query = select(
+        matches.c.id,
+        matches.c.title,
+        matches.c.slug,
+        matches.c.category,
+        query_excerpt(matches.c.content, matches.c.pos, matches.c.length, len(q)).label("excerpt"),
+    ).order_by(matches.c.rank.desc())
+
+    result = await db.execute(query)
+    return result.all()
 
-    excerpt = content[start:end]
-    if start > 0:
-        excerpt = "..." + excerpt
-    if end < len(content):
-        excerpt = excerpt + "..."
 
-    return excerpt
+def head_excerpt(content, max_chars: int = 200):
+    """SQL expression for the first ``max_chars`` characters of ``content``."""
+    return case(
+        (func.length(content) > max_chars, func.concat(func.substr(content, 1, max_chars), "...")),
+        else_=content,
+    )
+
+
+def query_excerpt(content, pos, length, query_length: int, context_chars: int = 100):
+    """SQL expression for an excerpt of ``content`` around a match.
+
+    ``pos`` is the 1-based match position (0 when absent, as returned by ``strpos``) and
+    ``length`` the content length; pass them as precomputed columns so each is evaluated
+    once per row. Falls back to :func:`head_excerpt` when there is no match.
+    """
+    start = func.greatest(0, pos - 1 - context_chars)
+    end = func.least(length, pos - 1 + query_length + context_chars)
+
+    return case(
+        (pos == 0, head_excerpt(content)),
+        else_=func.concat(
+            case((start > 0, "..."), else_=""),
+            func.substr(content, start + 1, end - start),
+            case((end < length, "..."), else_=""),
+        ),
+    )
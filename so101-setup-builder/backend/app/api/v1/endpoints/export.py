@@ -1,67 +1,118 @@
-import json
 from datetime import datetime
-from uuid import UUID
+from uuid import UUID, uuid4
 
-from fastapi import APIRouter, Depends, HTTPException, status
+import orjson
+from fastapi import APIRouter, BackgroundTasks, Depends, HTTPException, status
 from fastapi.responses import Response
-from sqlalchemy import select
-from sqlalchemy.orm import selectinload
+from sqlalchemy import exists, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.api.v1.schemas.export import (
     ExportFormat,
+    ExportJobResponse,
+    ExportJobStatus,
     ExportRequest,
     ExportResponse,
     ShoppingListItem,
     ShoppingListResponse,
 )
-from app.db.database import get_db
-from app.db.models import Setup, SetupComponent, Component, ComponentPrice
+from app.cache import get_redis
+from app.config import get_settings
+from app.db.database import async_session, get_db
+from app.db.models import Setup
+from app.db.queries import (
+    get_best_prices,
+    get_recommended_components,
+    get_setup_with_components,
+    get_shopping_list_rows,
+)
 from app.services.export_service import ExportService
 
+settings = get_settings()
+
 router = APIRouter()
 
 
-@router.post("/pdf")
+@router.post(
+    "/pdf",
+    response_model=ExportJobResponse,
+    status_code=status.HTTP_202_ACCEPTED,
+)
 async def export_pdf(
     request: ExportRequest,
+    background_tasks: BackgroundTasks,
     db: AsyncSession = Depends(get_db),
 ):
-    """Generate PDF export of setup."""
-    setup = await get_setup_with_components(request.setup_id, db)
+    """Start rendering a PDF export of setup; poll ``poll_url`` until it is done."""
+    setup_exists = await db.scalar(select(exists().where(Setup.id == request.setup_id)))
 
-    if not setup:
+    if not setup_exists:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Setup not found",
         )
 
-    export_service = ExportService()
+    job_id = uuid4().hex
+    redis = get_redis(decode_responses=False)
+    await redis.hset(_pdf_job_key(job_id), mapping={"status": ExportJobStatus.PENDING.value})
+    await redis.expire(_pdf_job_key(job_id), settings.export_job_ttl_seconds)
 
-    try:
-        pdf_content = await export_service.generate_pdf(
-            setup=setup,
-            include_prices=request.include_prices,
-            include_recommendations=request.include_recommendations,
-            include_alternatives=request.include_alternatives,
-        )
+    # Rendering takes seconds; run it after the response has been sent
+    background_tasks.add_task(_render_pdf_job, job_id, request)
+
+    return ExportJobResponse(
+        job_id=job_id,
+        status=ExportJobStatus.PENDING,
+        poll_url=_pdf_status_path(job_id),
+    )
 
-        filename = f"so101-setup-{setup.id}-{datetime.utcnow().strftime('%Y%m%d')}.pdf"
 
-        return Response(
-            content=pdf_content,
-            media_type="application/pdf",
-            headers={
-                "Content-Disposition": f'attachment; filename="{filename}"',
-            },
+@router.get("/pdf/status/{job_id}", response_model=ExportJobResponse)
+async def get_pdf_export_status(job_id: str):
+    """Status of a PDF export job, with a download URL once it is done."""
+    redis = get_redis(decode_responses=False)
+    job_status, error = await redis.hmget(_pdf_job_key(job_id), ["status", "error"])
+
+    if job_status is None:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Export job not found",
         )
 
-    except Exception as e:
+    job_status = ExportJobStatus(job_status.decode())
+    download_url = None
+    if job_status == ExportJobStatus.DONE:
+        download_url = f"/export/pdf/download/{job_id}"
+
+    return ExportJobResponse(
+        job_id=job_id,
+        status=job_status,
+        poll_url=_pdf_status_path(job_id),
+        download_url=download_url,
+        error=error.decode() if error else None,
+    )
+
+
+@router.get("/pdf/download/{job_id}")
+async def download_pdf_export(job_id: str):
+    """Download the PDF rendered by a finished export job."""
+    redis = get_redis(decode_responses=False)
+    pdf_content, filename = await redis.hmget(_pdf_job_key(job_id), ["content", "filename"])
+
+    if pdf_content is None:
         raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail=f"Failed to generate PDF: {str(e)}",
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Export not found or not ready",
         )
 
+    return Response(
+        content=pdf_content,
+        media_type="application/pdf",
+        headers={
+            "Content-Disposition": f'attachment; filename="{filename.decode()}"',
+        },
+    )
+
 
 @router.post("/json", response_model=ExportResponse)
 async def export_json(
@@ -89,15 +140,13 @@ async def export_json(
         "recommendations": setup.recommendations,
     }
 
+    best_prices = {}
+    if request.include_prices:
+        best_prices = await get_best_prices(db, (sc.component_id for sc in setup.components))
+
     # Add components if present
     for sc in setup.components:
-        comp_query = select(Component).options(
-            selectinload(Component.category),
-            selectinload(Component.prices).selectinload(ComponentPrice.vendor),
-        ).where(Component.id == sc.component_id)
-
-        comp_result = await db.execute(comp_query)
-        component = comp_result.scalar_one_or_none()
+        component = sc.component
 
         if component:
             comp_data = {
@@ -108,26 +157,30 @@ async def export_json(
                 "specifications": component.specifications,
             }
 
-            if request.include_prices and component.prices:
-                best_price = min(component.prices, key=lambda p: p.price)
+            best_price = best_prices.get(component.id)
+            if best_price:
                 comp_data["price"] = {
                     "amount": float(best_price.price),
                     "currency": best_price.currency,
-                    "vendor": best_price.vendor.name if best_price.vendor else None,
+                    "vendor": best_price.vendor_name,
                     "url": best_price.product_url,
                 }
 
             config["components"].append(comp_data)
 
-    content = json.dumps(config, indent=2, default=str)
+    content = orjson.dumps(
+        config,
+        default=str,
+        option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS,
+    )
     filename = f"so101-setup-{setup.id}.json"
 
     return ExportResponse(
         setup_id=setup.id,
         format=ExportFormat.JSON,
         filename=filename,
-        content=content,
-        file_size=len(content.encode()),
+        content=content.decode(),
+        file_size=len(content),
     )
 
 
@@ -137,9 +190,9 @@ async def export_shopping_list(
     db: AsyncSession = Depends(get_db),
 ):
     """Generate shopping list with vendor links."""
-    setup = await get_setup_with_components(setup_id, db)
+    recommended = await get_recommended_components(setup_id, db)
 
-    if not setup:
+    if recommended is None:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Setup not found",
@@ -150,46 +203,27 @@ async def export_shopping_list(
     total_cost = 0.0
 
     # Process setup components
-    for sc in setup.components:
-        comp_query = select(Component).options(
-            selectinload(Component.prices).selectinload(ComponentPrice.vendor),
-        ).where(Component.id == sc.component_id)
-
-        comp_result = await db.execute(comp_query)
-        component = comp_result.scalar_one_or_none()
-
-        if not component:
-            continue
-
-        # Find best price
-        best_price = None
-        if component.prices:
-            best_price = min(component.prices, key=lambda p: p.price)
-
-        vendor_name = best_price.vendor.name if best_price and best_price.vendor else "Unknown"
-        price = float(best_price.price) if best_price else 0.0
+    for row in await get_shopping_list_rows(setup_id, db):
+        vendor_name = row.vendor_name or "Unknown"
+        price = float(row.price) if row.price is not None else 0.0
 
         item = ShoppingListItem(
-            component_name=component.name,
-            quantity=sc.quantity,
+            component_name=row.component_name,
+            quantity=row.quantity,
             vendor=vendor_name,
-            price=price * sc.quantity,
+            price=price * row.quantity,
             currency="USD",
-            product_url=best_price.product_url if best_price else None,
-            notes=sc.notes,
+            product_url=row.product_url,
+            notes=row.notes,
         )
 
         items.append(item)
         total_cost += item.price
-
-        # Group by vendor
-        if vendor_name not in by_vendor:
-            by_vendor[vendor_name] = []
-        by_vendor[vendor_name].append(item)
+        by_vendor.setdefault(vendor_name, []).append(item)
 
     # If no explicit components, use recommendations
-    if not items and setup.recommendations:
-        for rec in setup.recommendations.get("components", []):
+    if not items:
+        for rec in recommended:
             item = ShoppingListItem(
                 component_name=rec.get("component_name", "Unknown"),
                 quantity=rec.get("quantity", 1),
@@ -210,14 +244,45 @@ async def export_shopping_list(
     )
 
 
-async def get_setup_with_components(
-    setup_id: UUID,
-    db: AsyncSession,
-) -> Setup | None:
-    """Helper to fetch setup with components."""
-    query = select(Setup).options(
-        selectinload(Setup.components),
-    ).where(Setup.id == setup_id)
-
-    result = await db.execute(query)
-    return result.scalar_one_or_none()
+# Job URLs are relative to the /api/v1 mount, which is the frontend client's base URL
+def _pdf_status_path(job_id: str) -> str:
+    return f"/export/pdf/status/{job_id}"
+
+
+def _pdf_job_key(job_id: str) -> str:
+    return f"export:pdf:{job_id}"
+
+
+async def _render_pdf_job(job_id: str, request: ExportRequest) -> None:
+    """Render a PDF export in the background and store the result in Redis."""
+    redis = get_redis(decode_responses=False)
+    key = _pdf_job_key(job_id)
+
+    try:
+        async with async_session() as db:
+            setup = await get_setup_with_components(request.setup_id, db)
+
+        if not setup:
+            raise ValueError("Setup not found")
+
+        pdf_content = await ExportService().generate_pdf(
+            setup=setup,
+            include_prices=request.include_prices,
+            include_recommendations=request.include_recommendations,
+            include_alternatives=request.include_alternatives,
+        )
+        filename = f"so101-setup-{setup.id}-{datetime.utcnow().strftime('%Y%m%d')}.pdf"
+
+        await redis.hset(key, mapping={
+            "status": ExportJobStatus.DONE.value,
+            "content": pdf_content,
+            "filename": filename,
+        })
+
+    except Exception as e:
+        await redis.hset(key, mapping={
+            "status": ExportJobStatus.FAILED.value,
+            "error": f"Failed to generate PDF: {str(e)}",
+        })
+
+    await redis.expire(key, settings.export_job_ttl_seconds)
@@ -1,39 +1,117 @@
+import asyncio
 from datetime import datetime
 from decimal import Decimal
 from uuid import UUID
 
-from fastapi import APIRouter, Depends, HTTPException, status
-from sqlalchemy import select
-from sqlalchemy.orm import selectinload
+from fastapi import (
+    APIRouter,
+    BackgroundTasks,
+    Depends,
+    HTTPException,
+    Request,
+    Response,
+    status,
+)
+from sqlalchemy import BigInteger, Text, cast, exists, func, select
+from sqlalchemy.dialects.postgresql import JSONB, aggregate_order_by
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.api.v1.schemas.pricing import (
     PriceResponse,
-    VendorPrice,
     PricingSearchRequest,
     PricingSearchResult,
     SetupPricingResponse,
     ComponentCostItem,
 )
-from app.db.database import get_db
-from app.db.models import Component, ComponentPrice, Setup, SetupComponent
+from app.api.v1.endpoints.components import component_list_cache
+from app.cache import RedisResponseCache, cacheable_json
+from app.config import get_settings
+from app.db.database import async_session, get_db, get_readonly_db
+from app.db.models import Component, ComponentPrice, Vendor
+from app.db.queries import (
+    get_recommended_components,
+    get_setup_best_prices,
+    get_setup_with_components,
+)
+from app.db.views import get_setup_pricing_row, refresh_setup_pricing
 from app.services.pricing_service import PricingService
 
 router = APIRouter()
 
+# Serialized breakdowns from setup_pricing_mv; they only change when the view is
+# refreshed, which drops the whole namespace
+setup_pricing_cache = RedisResponseCache(
+    "pricing:setup", ttl=get_settings().response_cache_ttl_seconds
+)
+
+# Set when a rebuild of setup_pricing_mv is requested; the running rebuild (if any)
+# picks it up, so refreshes that arrive during a rebuild share one more rebuild
+_view_refresh_pending = False
+_view_refresh_lock = asyncio.Lock()
+
+
+async def refresh_setup_pricing_view() -> None:
+    """Rebuild setup_pricing_mv on its own session, then drop the cached breakdowns.
+
+    Runs as a background task after the price changes are committed.
+    """
+    global _view_refresh_pending
+    _view_refresh_pending = True
+    if _view_refresh_lock.locked():
+        return
+
+    async with _view_refresh_lock:
+        while _view_refresh_pending:
+            _view_refresh_pending = False
+            async with async_session() as session:
+                await refresh_setup_pricing(session)
+                await session.commit()
+            await setup_pricing_cache.invalidate_all()
+
 
 @router.get("/component/{component_id}", response_model=PriceResponse)
 async def get_component_prices(
+    request: Request,
     component_id: int,
     db: AsyncSession = Depends(get_db),
 ):
     """Get all vendor prices for a component."""
-    query = select(Component).options(
-        selectinload(Component.prices).selectinload(ComponentPrice.vendor),
-    ).where(Component.id == component_id)
+    # One row: the statistics are aggregated in SQL and the vendor prices arrive as a
+    # JSON array. Amounts are rendered as text so they reach the Decimal fields without
+    # a detour through float.
+    vendor_price = func.jsonb_build_object(
+        "vendor_id", ComponentPrice.vendor_id,
+        "vendor_name", Vendor.name,
+        "vendor_slug", Vendor.slug,
+        "price", cast(ComponentPrice.price, Text),
+        "currency", ComponentPrice.currency,
+        "original_price", cast(ComponentPrice.original_price, Text),
+        "shipping_cost", cast(ComponentPrice.shipping_cost, Text),
+        "product_url", ComponentPrice.product_url,
+        "in_stock", ComponentPrice.in_stock,
+        "stock_quantity", ComponentPrice.stock_quantity,
+        "price_fetched_at", ComponentPrice.price_fetched_at,
+    )
+    query = (
+        select(
+            Component.id,
+            Component.name,
+            func.count(ComponentPrice.id).label("price_count"),
+            func.min(ComponentPrice.price_cents).label("lowest_cents"),
+            func.max(ComponentPrice.price_cents).label("highest_cents"),
+            cast(func.sum(ComponentPrice.price_cents), BigInteger).label("total_cents"),
+            func.jsonb_agg(aggregate_order_by(vendor_price, ComponentPrice.price), type_=JSONB)
+            .filter(ComponentPrice.id.is_not(None))
+            .label("prices"),
+        )
+        .outerjoin(ComponentPrice, ComponentPrice.component_id == Component.id)
+        .outerjoin(Vendor, Vendor.id == ComponentPrice.vendor_id)
+        .where(Component.id == component_id)
+        .group_by(Component.id)
+    )
 
     result = await db.execute(query)
-    component = result.scalar_one_or_none()
+    component = result.one_or_none()
 
     if not component:
         raise HTTPException(
@@ -41,41 +119,24 @@ async def get_component_prices(
             detail="Component not found",
         )
 
-    prices = []
-    for price in component.prices:
-        prices.append(
-            VendorPrice(
-                vendor_id=price.vendor_id,
-                vendor_name=price.vendor.name,
-                vendor_slug=price.vendor.slug,
-                price=price.price,
-                currency=price.currency,
-                original_price=price.original_price,
-                shipping_cost=price.shipping_cost,
-                product_url=price.product_url,
-                in_stock=price.in_stock,
-                stock_quantity=price.stock_quantity,
-                price_fetched_at=price.price_fetched_at,
-            )
-        )
-
-    # Calculate statistics
-    if prices:
-        price_values = [p.price for p in prices]
-        lowest = min(price_values)
-        highest = max(price_values)
-        average = sum(price_values) / len(price_values)
-    else:
-        lowest = highest = average = None
-
-    return PriceResponse(
-        component_id=component.id,
-        component_name=component.name,
-        prices=prices,
-        lowest_price=lowest,
-        highest_price=highest,
-        average_price=Decimal(str(round(average, 2))) if average else None,
-    )
+    # Statistics in integer cents
+    lowest = highest = average = None
+    if component.price_count:
+        lowest = cents_to_decimal(component.lowest_cents)
+        highest = cents_to_decimal(component.highest_cents)
+        # Decimal round() rounds half to even, as the mean of the prices always was
+        average = round(cents_to_decimal(component.total_cents) / component.price_count, 2)
+
+    # Validated and serialized through the response model, like any other endpoint
+    content = PriceResponse.model_validate({
+        "component_id": component.id,
+        "component_name": component.name,
+        "prices": component.prices or [],
+        "lowest_price": lowest,
+        "highest_price": highest,
+        "average_price": average,
+    }).model_dump_json()
+    return cacheable_json(request, content)
 
 
 @router.post("/search", response_model=list[PricingSearchResult])
@@ -105,12 +166,50 @@ async def search_prices(
 async def get_setup_pricing(
     setup_id: UUID,
     db: AsyncSession = Depends(get_db),
+    prices_db: AsyncSession = Depends(get_readonly_db),
 ):
     """Get total cost breakdown for a setup."""
-    # Get setup with components
-    query = select(Setup).where(Setup.id == setup_id)
-    result = await db.execute(query)
-    setup = result.scalar_one_or_none()
+    generation = await setup_pricing_cache.generation()
+    cached = await setup_pricing_cache.get(generation, str(setup_id))
+    if cached is not None:
+        return Response(content=cached, media_type="application/json")
+
+    # Precomputed breakdown, refreshed whenever prices are refreshed
+    pricing = await get_setup_pricing_row(setup_id, db)
+
+    if pricing:
+        content = SetupPricingResponse(
+            setup_id=setup_id,
+            components=[
+                ComponentCostItem(
+                    component_id=item["component_id"],
+                    component_name=item["component_name"],
+                    quantity=item["quantity"],
+                    unit_price=cents_to_decimal(item["unit_cents"]),
+                    total_price=cents_to_decimal(item["total_cents"]),
+                    vendor_name=item["vendor_name"],
+                    product_url=item["product_url"],
+                )
+                for item in pricing.components
+            ],
+            subtotal=cents_to_decimal(pricing.subtotal_cents),
+            estimated_shipping=None,
+            total=cents_to_decimal(pricing.subtotal_cents),
+            currency="USD",
+            calculated_at=pricing.refreshed_at,
+            cost_by_category={k: cents_to_decimal(v) for k, v in pricing.cost_by_category.items()},
+            vendors_used=pricing.vendors_used,
+        ).model_dump_json()
+        await setup_pricing_cache.set(generation, str(setup_id), content)
+        return Response(content=content, media_type="application/json")
+
+    # Not in the view yet: price it live. The setup (with components and categories) and
+    # the best price per component (or the selected vendor's price) are independent
+    # queries, so run them concurrently on two connections
+    setup, best_prices = await asyncio.gather(
+        get_setup_with_components(setup_id, db, with_recommendations=False),
+        get_setup_best_prices(setup_id, prices_db),
+    )
 
     if not setup:
         raise HTTPException(
@@ -118,73 +217,51 @@ async def get_setup_pricing(
             detail="Setup not found",
         )
 
-    # Get setup components with prices
-    components_query = select(SetupComponent).where(
-        SetupComponent.setup_id == setup_id
-    )
-    components_result = await db.execute(components_query)
-    setup_components = components_result.scalars().all()
-
     component_items = []
-    subtotal = Decimal("0")
-    cost_by_category = {}
+    subtotal_cents = 0
+    cost_by_category_cents: dict[str, int] = {}
     vendors_used = set()
 
-    for sc in setup_components:
-        # Get component with prices
-        comp_query = select(Component).options(
-            selectinload(Component.category),
-            selectinload(Component.prices).selectinload(ComponentPrice.vendor),
-        ).where(Component.id == sc.component_id)
-
-        comp_result = await db.execute(comp_query)
-        component = comp_result.scalar_one_or_none()
+    for sc in setup.components:
+        component = sc.component
 
         if not component:
             continue
 
-        # Find best price (or selected vendor)
-        best_price = None
+        best_price = best_prices.get(component.id)
         vendor_name = None
         product_url = None
 
-        for price in component.prices:
-            if sc.selected_vendor_id and price.vendor_id == sc.selected_vendor_id:
-                best_price = price
-                break
-            if best_price is None or price.price < best_price.price:
-                best_price = price
-
         if best_price:
-            unit_price = best_price.price
-            vendor_name = best_price.vendor.name
+            unit_cents = best_price.price_cents
+            vendor_name = best_price.vendor_name
             product_url = best_price.product_url
             vendors_used.add(vendor_name)
         else:
-            unit_price = Decimal("0")
+            unit_cents = 0
 
-        total_price = unit_price * sc.quantity
-        subtotal += total_price
+        total_cents = unit_cents * sc.quantity
+        subtotal_cents += total_cents
 
         # Track by category
         cat_name = component.category.name if component.category else "Other"
-        cost_by_category[cat_name] = cost_by_category.get(cat_name, Decimal("0")) + total_price
+        cost_by_category_cents[cat_name] = cost_by_category_cents.get(cat_name, 0) + total_cents
 
         component_items.append(
             ComponentCostItem(
                 component_id=component.id,
                 component_name=component.name,
                 quantity=sc.quantity,
-                unit_price=unit_price,
-                total_price=total_price,
+                unit_price=cents_to_decimal(unit_cents),
+                total_price=cents_to_decimal(total_cents),
                 vendor_name=vendor_name,
                 product_url=product_url,
             )
         )
 
     # If no explicit components, use recommendations
-    if not component_items and setup.recommendations:
-        for rec in setup.recommendations.get("components", []):
+    if not component_items:
+        for rec in await get_recommended_components(setup_id, db) or []:
             component_items.append(
                 ComponentCostItem(
                     component_id=rec.get("component_id", 0),
@@ -197,6 +274,8 @@ async def get_setup_pricing(
                 )
             )
 
+    subtotal = cents_to_decimal(subtotal_cents)
+
     return SetupPricingResponse(
         setup_id=setup_id,
         components=component_items,
@@ -205,7 +284,7 @@ async def get_setup_pricing(
         total=subtotal,
         currency="USD",
         calculated_at=datetime.utcnow(),
-        cost_by_category={k: v for k, v in cost_by_category.items()},
+        cost_by_category={k: cents_to_decimal(v) for k, v in cost_by_category_cents.items()},
         vendors_used=list(vendors_used),
     )
 
@@ -213,14 +292,15 @@ async def get_setup_pricing(
 @router.post("/refresh/{component_id}")
 async def refresh_component_prices(
     component_id: int,
+    background_tasks: BackgroundTasks,
     db: AsyncSession = Depends(get_db),
 ):
     """Trigger a refresh of prices for a component."""
-    query = select(Component).where(Component.id == component_id)
-    result = await db.execute(query)
-    component = result.scalar_one_or_none()
+    component_exists = await db.scalar(
+        select(exists().where(Component.id == component_id))
+    )
 
-    if not component:
+    if not component_exists:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Component not found",
@@ -230,6 +310,13 @@ async def refresh_component_prices(
 
     try:
         updated_prices = await pricing_service.refresh_prices(component_id, db)
+        # Commit before bumping the cache generation, so a concurrent reader cannot
+        # cache the old prices under the new generation
+        await db.commit()
+        await component_list_cache.invalidate_all()
+        # The setup pricing view covers every setup; rebuild it after the response
+        if updated_prices:
+            background_tasks.add_task(refresh_setup_pricing_view)
         return {
             "message": "Prices refreshed successfully",
             "component_id": component_id,
@@ -240,3 +327,8 @@ async def refresh_component_prices(
             status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
             detail=f"Failed to refresh prices: {str(e)}",
         )
+
+
+def cents_to_decimal(cents: int) -> Decimal:
+    """Integer cents to a two-place Decimal amount for responses."""
+    return Decimal(cents).scaleb(-2)
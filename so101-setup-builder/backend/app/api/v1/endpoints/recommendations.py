@@ -1,7 +1,7 @@
+from functools import lru_cache
 from uuid import UUID
 
 from fastapi import APIRouter, Depends, HTTPException, status
-from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.api.v1.schemas.recommendation import (
@@ -12,6 +12,7 @@ from app.api.v1.schemas.recommendation import (
     ChatResponse,
 )
 from app.db.database import get_db
+from app.api.v1.endpoints.wizard import invalidate_wizard_summary
 from app.db.models import Setup
 from app.services.gemini_service import GeminiService
 
@@ -24,8 +25,7 @@ async def generate_recommendations(
     db: AsyncSession = Depends(get_db),
 ):
     """Generate AI-powered component recommendations based on wizard profile."""
-    result = await db.execute(select(Setup).where(Setup.id == request.setup_id))
-    setup = result.scalar_one_or_none()
+    setup = await db.get(Setup, request.setup_id)
 
     if not setup:
         raise HTTPException(
@@ -56,6 +56,7 @@ async def generate_recommendations(
             "notes": recommendations.get("notes", []),
         }
         await db.commit()
+        await invalidate_wizard_summary(setup.id)
 
         return RecommendationResponse(
             setup_id=setup.id,
@@ -79,8 +80,7 @@ async def chat_with_assistant(
     db: AsyncSession = Depends(get_db),
 ):
     """Interactive Q&A about the setup."""
-    result = await db.execute(select(Setup).where(Setup.id == request.setup_id))
-    setup = result.scalar_one_or_none()
+    setup = await db.get(Setup, request.setup_id)
 
     if not setup:
         raise HTTPException(
@@ -96,6 +96,7 @@ async def chat_with_assistant(
             history=request.history,
             profile=setup.wizard_profile,
             current_recommendations=setup.recommendations,
+            context_version=(setup.id, setup.updated_at),
         )
 
         return ChatResponse(
@@ -120,8 +121,28 @@ async def get_default_recommendations(
     db: AsyncSession,
 ) -> RecommendationResponse:
     """Return default SO-101 recommendations when AI is unavailable."""
-    arm_type = profile.get("arm_type", "single")
+    arm_type = str(profile.get("arm_type", "single"))
+    camera_pref = str(profile.get("camera_preference", "basic"))
 
+    summary = f"Default SO-101 {'dual-arm (leader + follower)' if arm_type == 'dual' else 'single-arm (follower)'} build configuration."
+
+    return RecommendationResponse(
+        setup_id=setup_id,
+        recommendations=list(_default_recommendation_items(arm_type, camera_pref)),
+        summary=summary,
+        notes=[
+            "These are the standard components recommended in the LeRobot documentation.",
+            "Prices may vary by vendor - check multiple sources for best deals.",
+        ],
+    )
+
+
+@lru_cache(maxsize=8)
+def _default_recommendation_items(
+    arm_type: str,
+    camera_pref: str,
+) -> tuple[ComponentRecommendation, ...]:
+    """Static default component list; pure in its arguments, so built once per combination."""
     recommendations = []
 
     # Motors
@@ -201,7 +222,6 @@ async def get_default_recommendations(
     ])
 
     # Camera based on preference
-    camera_pref = profile.get("camera_preference", "basic")
     if camera_pref == "basic":
         recommendations.append(
             ComponentRecommendation(
@@ -225,14 +245,4 @@ async def get_default_recommendations(
             )
         )
 
-    summary = f"Default SO-101 {'dual-arm (leader + follower)' if arm_type == 'dual' else 'single-arm (follower)'} build configuration."
-
-    return RecommendationResponse(
-        setup_id=setup_id,
-        recommendations=recommendations,
-        summary=summary,
-        notes=[
-            "These are the standard components recommended in the LeRobot documentation.",
-            "Prices may vary by vendor - check multiple sources for best deals.",
-        ],
-    )
+    return tuple(recommendations)
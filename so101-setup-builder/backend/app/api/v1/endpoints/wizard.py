@@ -1,16 +1,24 @@
 from datetime import datetime, timedelta
+from enum import IntEnum
 from uuid import UUID
 
-from fastapi import APIRouter, Depends, HTTPException, status
-from sqlalchemy import select
+from fastapi import APIRouter, Depends, HTTPException, Path, Request, status
+from fastapi.exceptions import RequestValidationError
+from fastapi.responses import Response
+from pydantic import ValidationError
+from redis.exceptions import RedisError
+from sqlalchemy import case, delete, func, literal, or_, update
+from sqlalchemy.dialects.postgresql import JSONB
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.api.v1.endpoints.pricing import setup_pricing_cache
 from app.api.v1.schemas.wizard import (
     WizardStartResponse,
     WizardStepUpdate,
     WizardProfile,
     WizardSummary,
 )
+from app.cache import PRIVATE_REVALIDATE_CACHE_CONTROL, cacheable_json, get_redis
 from app.config import get_settings
 from app.db.database import get_db
 from app.db.models import Setup
@@ -18,13 +26,69 @@ from app.db.models import Setup
 router = APIRouter()
 settings = get_settings()
 
-WIZARD_STEPS = {
-    1: "experience",
-    2: "budget",
-    3: "use_case",
-    4: "compute_platform",
-    5: "camera_preference",
-}
+
+class WizardStep(IntEnum):
+    EXPERIENCE = 1
+    BUDGET = 2
+    USE_CASE = 3
+    COMPUTE_PLATFORM = 4
+    CAMERA_PREFERENCE = 5
+
+
+def _step_values(step: WizardStep) -> dict:
+    """Progress columns for saving ``step``; only the profile merge varies per request."""
+    # Advance past the step unless the user went back to an earlier one
+    current_step = case(
+        (Setup.current_step <= step, step + 1),
+        else_=Setup.current_step,
+    )
+    return {
+        "current_step": current_step,
+        # Mark as completed once the last step is saved
+        "wizard_completed": or_(Setup.wizard_completed, current_step > len(WizardStep)),
+    }
+
+
+# Built once per step at import instead of on every PUT
+STEP_VALUES = {step: _step_values(step) for step in WizardStep}
+
+# Serialized WizardSummary per setup; the frontend polls the summary between steps
+WIZARD_SUMMARY_TTL_SECONDS = 60
+
+
+def _summary_cache_key(setup_id: UUID) -> str:
+    return f"wiz:sum:{setup_id}"
+
+
+async def invalidate_wizard_summary(setup_id: UUID) -> None:
+    """Drop the cached summary after the setup changes (best-effort)."""
+    try:
+        await get_redis().delete(_summary_cache_key(setup_id))
+    except RedisError:
+        pass
+
+
+def _summary_json(setup: Setup, with_recommendations: bool = True) -> str:
+    """Serialized WizardSummary for a setup row.
+
+    Profiles are validated before they are stored (see ``update_wizard_step``), so the
+    models are built with ``model_construct`` from the columns used instead of a
+    validating pass, and serialized once with pydantic's compiled serializer rather than
+    re-validated by FastAPI against ``response_model``.
+    """
+    recommendations = setup.recommendations if with_recommendations else None
+    summary = WizardSummary.model_construct(
+        setup_id=setup.id,
+        profile=WizardProfile.model_construct(**(setup.wizard_profile or {})),
+        current_step=setup.current_step,
+        wizard_completed=setup.wizard_completed,
+        recommended_components=(recommendations or {}).get("components"),
+        created_at=setup.created_at,
+        updated_at=setup.updated_at,
+    )
+    # Constructed enum fields hold their plain string values, which serialize the same,
+    # so skip the type-mismatch warnings
+    return summary.model_dump_json(warnings=False)
 
 
 @router.post("/start", response_model=WizardStartResponse)
@@ -36,8 +100,9 @@ async def start_wizard(db: AsyncSession = Depends(get_db)):
         expires_at=datetime.utcnow() + timedelta(days=settings.session_expiry_days),
     )
     db.add(setup)
+    # The timestamps come back from the INSERT's RETURNING and expire_on_commit is off,
+    # so no refresh needed
     await db.commit()
-    await db.refresh(setup)
 
     return WizardStartResponse(
         setup_id=setup.id,
@@ -49,18 +114,41 @@ async def start_wizard(db: AsyncSession = Depends(get_db)):
 @router.put("/{setup_id}/step/{step_number}", response_model=WizardSummary)
 async def update_wizard_step(
     setup_id: UUID,
-    step_number: int,
     step_update: WizardStepUpdate,
+    step_number: WizardStep = Path(...),
     db: AsyncSession = Depends(get_db),
 ):
     """Save answer for a wizard step."""
-    if step_number < 1 or step_number > 5:
-        raise HTTPException(
-            status_code=status.HTTP_400_BAD_REQUEST,
-            detail="Step number must be between 1 and 5",
+    # Store the validated answer, not the raw one: coerced values (e.g. "500" for the
+    # budget) are saved in their normalized form, so the merged profile returned below
+    # can be built without a second validation pass
+    try:
+        step_data = WizardProfile.model_validate(step_update.step_data).model_dump(
+            mode="json", exclude_unset=True
         )
+    except ValidationError as e:
+        raise RequestValidationError(e.errors())
+
+    values = {
+        **STEP_VALUES[step_number],
+        # Merge step data into the profile server-side (shallow, like dict.update)
+        "wizard_profile": func.coalesce(Setup.wizard_profile, literal({}, JSONB)).op("||")(
+            literal(step_data, JSONB)
+        ),
+    }
 
-    result = await db.execute(select(Setup).where(Setup.id == setup_id))
+    # Handle arm_type from profile
+    if "arm_type" in step_data:
+        values["arm_type"] = step_data["arm_type"]
+
+    # One round-trip: UPDATE ... RETURNING instead of SELECT, then UPDATE, then SELECT
+    result = await db.execute(
+        update(Setup)
+        .where(Setup.id == setup_id)
+        .values(**values)
+        .returning(Setup)
+        .execution_options(synchronize_session=False)
+    )
     setup = result.scalar_one_or_none()
 
     if not setup:
@@ -69,44 +157,35 @@ async def update_wizard_step(
             detail="Setup not found",
         )
 
-    # Update wizard profile with step data
-    profile = setup.wizard_profile or {}
-    profile.update(step_update.step_data)
-    setup.wizard_profile = profile
-
-    # Update current step (allow going back)
-    if step_number >= setup.current_step:
-        setup.current_step = min(step_number + 1, 6)
-
-    # Mark as completed if all steps done
-    if setup.current_step > 5:
-        setup.wizard_completed = True
-
-    # Handle arm_type from profile
-    if "arm_type" in step_update.step_data:
-        setup.arm_type = step_update.step_data["arm_type"]
-
     await db.commit()
-    await db.refresh(setup)
+    await invalidate_wizard_summary(setup_id)
 
-    return WizardSummary(
-        setup_id=setup.id,
-        profile=WizardProfile(**setup.wizard_profile),
-        current_step=setup.current_step,
-        wizard_completed=setup.wizard_completed,
-        created_at=setup.created_at,
-        updated_at=setup.updated_at,
-    )
+    content = _summary_json(setup, with_recommendations=False)
+    return Response(content=content, media_type="application/json")
 
 
 @router.get("/{setup_id}/summary", response_model=WizardSummary)
 async def get_wizard_summary(
+    request: Request,
     setup_id: UUID,
     db: AsyncSession = Depends(get_db),
 ):
-    """Get the full wizard profile and setup summary."""
-    result = await db.execute(select(Setup).where(Setup.id == setup_id))
-    setup = result.scalar_one_or_none()
+    """Get the full wizard profile and setup summary.
+
+    Polling clients should send the last ``ETag`` in ``If-None-Match``; an unchanged
+    summary is answered with 304 and no body.
+    """
+    redis = get_redis()
+    cache_key = _summary_cache_key(setup_id)
+
+    try:
+        cached = await redis.get(cache_key)
+    except RedisError:
+        cached = None
+    if cached is not None:
+        return cacheable_json(request, cached, PRIVATE_REVALIDATE_CACHE_CONTROL)
+
+    setup = await db.get(Setup, setup_id)
 
     if not setup:
         raise HTTPException(
@@ -114,15 +193,14 @@ async def get_wizard_summary(
             detail="Setup not found",
         )
 
-    return WizardSummary(
-        setup_id=setup.id,
-        profile=WizardProfile(**(setup.wizard_profile or {})),
-        current_step=setup.current_step,
-        wizard_completed=setup.wizard_completed,
-        recommended_components=setup.recommendations,
-        created_at=setup.created_at,
-        updated_at=setup.updated_at,
-    )
+    content = _summary_json(setup)
+
+    try:
+        await redis.set(cache_key, content, ex=WIZARD_SUMMARY_TTL_SECONDS)
+    except RedisError:
+        pass
+
+    return cacheable_json(request, content, PRIVATE_REVALIDATE_CACHE_CONTROL)
 
 
 @router.delete("/{setup_id}")
@@ -131,16 +209,19 @@ async def delete_setup(
     db: AsyncSession = Depends(get_db),
 ):
     """Delete a setup and all associated data."""
-    result = await db.execute(select(Setup).where(Setup.id == setup_id))
-    setup = result.scalar_one_or_none()
+    # One round-trip; its setup_components rows go with it through ON DELETE CASCADE
+    result = await db.execute(
+        delete(Setup).where(Setup.id == setup_id).returning(Setup.id)
+    )
 
-    if not setup:
+    if result.scalar_one_or_none() is None:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Setup not found",
         )
 
-    await db.delete(setup)
     await db.commit()
+    await invalidate_wizard_summary(setup_id)
+    await setup_pricing_cache.invalidate(str(setup_id))
 
     return {"message": "Setup deleted successfully"}
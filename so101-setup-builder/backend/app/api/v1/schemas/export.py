@@ -31,6 +31,22 @@ class ExportResponse(BaseModel):
     file_size: int | None = None
 
 
+class ExportJobStatus(str, Enum):
+    PENDING = "pending"
+    DONE = "done"
+    FAILED = "failed"
+
+
+class ExportJobResponse(BaseModel):
+    """Status of a background export job."""
+
+    job_id: str
+    status: ExportJobStatus
+    poll_url: str
+    download_url: str | None = None
+    error: str | None = None
+
+
 class ShoppingListItem(BaseModel):
     """Single item in a shopping list."""
 
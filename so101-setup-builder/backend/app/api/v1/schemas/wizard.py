@@ -83,6 +83,3 @@ class WizardSummary(BaseModel):
     estimated_cost: float | None = None
     created_at: datetime
     updated_at: datetime
-
-    class Config:
-        from_attributes = True
@@ -0,0 +1,202 @@
+import hashlib
+import time
+from collections.abc import Hashable
+from decimal import Decimal
+from functools import lru_cache
+from typing import Any
+
+import orjson
+from fastapi import Request, status
+from fastapi.responses import JSONResponse, Response
+from redis.asyncio import Redis
+from redis.exceptions import RedisError
+
+from app.config import get_settings
+
+
+class TTLCache:
+    """Small in-process cache with a fixed time-to-live per entry.
+
+    Intended for rarely-changing, cheap-to-serialize payloads (category lists, etc.).
+    Each worker process keeps its own copy, so entries may be stale for up to ``ttl``
+    seconds after a write made through another process.
+    """
+
+    def __init__(self, ttl: float, maxsize: int = 128):
+        self.ttl = ttl
+        self.maxsize = maxsize
+        self._data: dict[Hashable, tuple[float, Any]] = {}
+
+    def get(self, key: Hashable = None, default: Any = None) -> Any:
+        entry = self._data.get(key)
+        if entry is None:
+            return default
+        expires_at, value = entry
+        if time.monotonic() >= expires_at:
+            self._data.pop(key, None)
+            return default
+        return value
+
+    def set(self, key: Hashable, value: Any) -> None:
+        if key not in self._data and len(self._data) >= self.maxsize:
+            # Evict the oldest entry (dicts keep insertion order)
+            self._data.pop(next(iter(self._data)))
+        self._data[key] = (time.monotonic() + self.ttl, value)
+
+    def invalidate(self, key: Hashable = None) -> None:
+        self._data.pop(key, None)
+
+    def clear(self) -> None:
+        self._data.clear()
+
+
+def _orjson_default(value: Any) -> Any:
+    # Amounts keep their exact decimal digits instead of going through float
+    if isinstance(value, Decimal):
+        return str(value)
+    raise TypeError(f"Object of type {type(value).__name__} is not JSON serializable")
+
+
+class ORJSONResponse(JSONResponse):
+    """``JSONResponse`` rendered by orjson, which natively handles UUID and datetime.
+
+    For hand-built payloads; routes returning pydantic models already serialize
+    through pydantic's own JSON encoder.
+    """
+
+    def render(self, content: Any) -> bytes:
+        return orjson.dumps(content, default=_orjson_default, option=orjson.OPT_NON_STR_KEYS)
+
+
+def _canonical_json(payload: Any) -> bytes:
+    return orjson.dumps(
+        payload, default=str, option=orjson.OPT_SORT_KEYS | orjson.OPT_NON_STR_KEYS
+    )
+
+
+def body_etag(body: str | bytes) -> str:
+    """Strong ETag for an already-serialized response body."""
+    if isinstance(body, str):
+        body = body.encode()
+    return f'"{hashlib.blake2b(body, digest_size=8).hexdigest()}"'
+
+
+def make_etag(payload: Any) -> str:
+    """Strong ETag for a JSON-serializable payload."""
+    return body_etag(_canonical_json(payload))
+
+
+# For read-mostly GET responses; clients revalidate with If-None-Match once stale
+PUBLIC_CACHE_CONTROL = "public, max-age=60, stale-while-revalidate=300"
+
+# For per-session state that changes on writes; clients always revalidate
+PRIVATE_REVALIDATE_CACHE_CONTROL = "private, no-cache"
+
+
+def not_modified(
+    request: Request, etag: str, cache_control: str = PUBLIC_CACHE_CONTROL
+) -> Response | None:
+    """304 response if the client already holds ``etag``, otherwise ``None``."""
+    if request.headers.get("if-none-match") != etag:
+        return None
+    return Response(
+        status_code=status.HTTP_304_NOT_MODIFIED,
+        headers={"ETag": etag, "Cache-Control": cache_control},
+    )
+
+
+def cacheable_response(request: Request, payload: Any, etag: str | None = None) -> Response:
+    """JSON response with ``ETag`` and ``Cache-Control``, or 304 when the ETag matches.
+
+    The ETag defaults to a hash of ``payload``.
+    """
+    if etag is None:
+        etag = make_etag(payload)
+    return not_modified(request, etag) or ORJSONResponse(
+        content=payload,
+        headers={"ETag": etag, "Cache-Control": PUBLIC_CACHE_CONTROL},
+    )
+
+
+def cacheable_json(
+    request: Request, content: str | bytes, cache_control: str = PUBLIC_CACHE_CONTROL
+) -> Response:
+    """Like ``cacheable_response`` for a body that is already serialized JSON."""
+    etag = body_etag(content)
+    return not_modified(request, etag, cache_control) or Response(
+        content=content,
+        media_type="application/json",
+        headers={"ETag": etag, "Cache-Control": cache_control},
+    )
+
+
+def hash_key(prefix: str, payload: Any) -> str:
+    """Stable cache key for a JSON-serializable payload."""
+    body = _canonical_json(payload)
+    return f"{prefix}:{hashlib.blake2b(body, digest_size=16).hexdigest()}"
+
+
+@lru_cache
+def get_redis(decode_responses: bool = True) -> Redis:
+    """Shared Redis client; connections are opened lazily on first command.
+
+    Pass ``decode_responses=False`` for a client that stores and returns raw bytes.
+    """
+    return Redis.from_url(get_settings().redis_url, decode_responses=decode_responses)
+
+
+class RedisResponseCache:
+    """Serialized responses in Redis under a namespace that can be dropped at once.
+
+    Entries live at ``{namespace}:v{generation}:{key}``. ``invalidate_all`` bumps the
+    generation instead of scanning for keys, so entries from older generations are
+    never read again and simply expire. Read the generation before building a
+    response and store under that same generation, so a response computed before an
+    invalidation cannot land in the new one. Redis errors are treated as misses.
+    """
+
+    def __init__(self, namespace: str, ttl: int):
+        self.namespace = namespace
+        self.ttl = ttl
+        self._generation_key = f"{namespace}:generation"
+
+    async def generation(self) -> str | None:
+        try:
+            return await get_redis().get(self._generation_key) or "0"
+        except RedisError:
+            return None
+
+    def _key(self, generation: str, key: str) -> str:
+        return f"{self.namespace}:v{generation}:{key}"
+
+    async def get(self, generation: str | None, key: str) -> str | None:
+        if generation is None:
+            return None
+        try:
+            return await get_redis().get(self._key(generation, key))
+        except RedisError:
+            return None
+
+    async def set(self, generation: str | None, key: str, value: str) -> None:
+        if generation is None:
+            return
+        try:
+            await get_redis().set(self._key(generation, key), value, ex=self.ttl)
+        except RedisError:
+            pass
+
+    async def invalidate(self, key: str) -> None:
+        """Drop one entry of the current generation."""
+        generation = await self.generation()
+        if generation is None:
+            return
+        try:
+            await get_redis().delete(self._key(generation, key))
+        except RedisError:
+            pass
+
+    async def invalidate_all(self) -> None:
+        try:
+            await get_redis().incr(self._generation_key)
+        except RedisError:
+            pass
@@ -9,9 +9,21 @@ class Settings(BaseSettings):
 
     # Database
     database_url: str = "postgresql://postgres:postgres@db:5432/so101_builder"
+    db_pool_size: int = 20
+    db_max_overflow: int = 10
+    db_pool_timeout: float = 30.0
+    db_pool_recycle: int = 1800  # seconds before a pooled connection is replaced
+    db_query_cache_size: int = 1000  # SQLAlchemy compiled-statement LRU per engine
+    db_prepared_statement_cache_size: int = 1024  # asyncpg prepared statements per connection
 
     # Redis
     redis_url: str = "redis://redis:6379/0"
+    llm_cache_ttl_seconds: int = 24 * 60 * 60
+    response_cache_ttl_seconds: int = 15 * 60  # pricing and component list pages
+    export_job_ttl_seconds: int = 60 * 60  # rendered PDFs are kept this long
+
+    # Gemini
+    gemini_max_concurrency: int = 4  # in-flight Gemini requests per worker
 
     # API Keys
     gemini_api_key: Optional[str] = None
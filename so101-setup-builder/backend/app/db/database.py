@@ -1,5 +1,6 @@
 from typing import AsyncGenerator
 
+from sqlalchemy import DDL, event
 from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine, async_sessionmaker
 from sqlalchemy.orm import DeclarativeBase
 
@@ -14,6 +15,18 @@ engine = create_async_engine(
     database_url,
     echo=settings.debug,
     future=True,
+    pool_size=settings.db_pool_size,
+    max_overflow=settings.db_max_overflow,
+    pool_timeout=settings.db_pool_timeout,
+    pool_recycle=settings.db_pool_recycle,
+    pool_pre_ping=True,
+    # Cache compiled SQL for the recurring endpoint query shapes, and keep the matching
+    # server-side prepared statements around on each pooled connection
+    query_cache_size=settings.db_query_cache_size,
+    connect_args={
+        "statement_cache_size": settings.db_prepared_statement_cache_size,
+        "prepared_statement_cache_size": settings.db_prepared_statement_cache_size,
+    },
 )
 
 async_session = async_sessionmaker(
@@ -22,11 +35,22 @@ async_session = async_sessionmaker(
     expire_on_commit=False,
 )
 
+# Read-only endpoints skip the BEGIN/COMMIT round-trips around each request
+readonly_session = async_sessionmaker(
+    engine.execution_options(isolation_level="AUTOCOMMIT"),
+    class_=AsyncSession,
+    expire_on_commit=False,
+)
+
 
 class Base(DeclarativeBase):
     pass
 
 
+# Trigram indexes need pg_trgm before metadata.create_all() builds them
+event.listen(Base.metadata, "before_create", DDL("CREATE EXTENSION IF NOT EXISTS pg_trgm"))
+
+
 async def get_db() -> AsyncGenerator[AsyncSession, None]:
     """Dependency for getting async database sessions."""
     async with async_session() as session:
@@ -38,3 +62,9 @@ async def get_db() -> AsyncGenerator[AsyncSession, None]:
             raise
         finally:
             await session.close()
+
+
+async def get_readonly_db() -> AsyncGenerator[AsyncSession, None]:
+    """Dependency for sessions that only read; each statement runs in autocommit mode."""
+    async with readonly_session() as session:
+        yield session
@@ -1,7 +1,7 @@
 from datetime import datetime
 from typing import TYPE_CHECKING, Any
 
-from sqlalchemy import String, Text, Boolean, Integer, ForeignKey, DateTime, Index
+from sqlalchemy import Computed, String, Text, Boolean, Integer, ForeignKey, DateTime, Index, func
 from sqlalchemy.dialects.postgresql import JSONB, TSVECTOR
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
@@ -35,13 +35,21 @@ class Component(Base):
         String(20)
     )  # 'leader', 'follower', 'both', None
 
-    # Search
-    search_vector: Mapped[Any | None] = mapped_column(TSVECTOR)
+    # Search; derived from name/description by Postgres, never written by the application
+    search_vector: Mapped[Any | None] = mapped_column(
+        TSVECTOR,
+        Computed(
+            "to_tsvector('pg_catalog.english', name || ' ' || coalesce(description, ''))",
+            persisted=True,
+        ),
+    )
 
     # Timestamps
-    created_at: Mapped[datetime] = mapped_column(DateTime, default=datetime.utcnow)
+    created_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True), server_default=func.now()
+    )
     updated_at: Mapped[datetime] = mapped_column(
-        DateTime, default=datetime.utcnow, onupdate=datetime.utcnow
+        DateTime(timezone=True), server_default=func.now(), onupdate=func.now()
     )
 
     # Relationships
@@ -54,6 +62,28 @@ class Component(Base):
         Index("ix_components_search_vector", "search_vector", postgresql_using="gin"),
         Index("ix_components_category_id", "category_id"),
         Index("ix_components_is_default", "is_default_for_so101"),
+        Index(
+            "ix_components_cat_arm_default", "category_id", "arm_type", "is_default_for_so101"
+        ),
+        Index(
+            "ix_components_name_trgm",
+            "name",
+            postgresql_using="gin",
+            postgresql_ops={"name": "gin_trgm_ops"},
+        ),
+        Index(
+            "ix_components_description_trgm",
+            "description",
+            postgresql_using="gin",
+            postgresql_ops={"description": "gin_trgm_ops"},
+        ),
+        # Serves specifications @> '{...}' containment filters
+        Index(
+            "ix_components_specs_gin",
+            "specifications",
+            postgresql_using="gin",
+            postgresql_ops={"specifications": "jsonb_path_ops"},
+        ),
     )
 
     def __repr__(self) -> str:
@@ -2,7 +2,7 @@ from datetime import datetime
 from decimal import Decimal
 from typing import TYPE_CHECKING
 
-from sqlalchemy import String, ForeignKey, DateTime, Numeric, Index
+from sqlalchemy import BigInteger, Computed, String, ForeignKey, DateTime, Numeric, Index, func
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from app.db.database import Base
@@ -23,6 +23,10 @@ class ComponentPrice(Base):
 
     # Pricing
     price: Mapped[Decimal] = mapped_column(Numeric(10, 2), nullable=False)
+    # Derived from price by Postgres; use for arithmetic, write price instead
+    price_cents: Mapped[int] = mapped_column(
+        BigInteger, Computed("round(price * 100)::bigint", persisted=True)
+    )
     currency: Mapped[str] = mapped_column(String(3), default="USD")
     original_price: Mapped[Decimal | None] = mapped_column(Numeric(10, 2))  # Before discount
     shipping_cost: Mapped[Decimal | None] = mapped_column(Numeric(10, 2))
@@ -36,10 +40,14 @@ class ComponentPrice(Base):
     stock_quantity: Mapped[int | None] = mapped_column()
 
     # Timestamps
-    price_fetched_at: Mapped[datetime] = mapped_column(DateTime, default=datetime.utcnow)
-    created_at: Mapped[datetime] = mapped_column(DateTime, default=datetime.utcnow)
+    price_fetched_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True), server_default=func.now()
+    )
+    created_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True), server_default=func.now()
+    )
     updated_at: Mapped[datetime] = mapped_column(
-        DateTime, default=datetime.utcnow, onupdate=datetime.utcnow
+        DateTime(timezone=True), server_default=func.now(), onupdate=func.now()
     )
 
     # Relationships
@@ -49,6 +57,14 @@ class ComponentPrice(Base):
     __table_args__ = (
         Index("ix_component_prices_component_vendor", "component_id", "vendor_id"),
         Index("ix_component_prices_price", "price"),
+        # Cheapest-price lookups (min(price), DISTINCT ON ... ORDER BY price) and the
+        # in-stock check are answered from the index alone
+        Index(
+            "ix_component_prices_component_price",
+            "component_id",
+            "price",
+            postgresql_include=["vendor_id", "in_stock", "price_cents"],
+        ),
     )
 
     def __repr__(self) -> str:
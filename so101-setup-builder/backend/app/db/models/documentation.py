@@ -1,7 +1,7 @@
 from datetime import datetime
 from typing import Any
 
-from sqlalchemy import String, Text, DateTime, Index
+from sqlalchemy import Computed, String, Text, DateTime, Index, func
 from sqlalchemy.dialects.postgresql import JSONB, TSVECTOR
 from sqlalchemy.orm import Mapped, mapped_column
 
@@ -19,26 +19,68 @@ class Documentation(Base):
     source_path: Mapped[str] = mapped_column(String(500), nullable=False)  # Original file path
     content: Mapped[str] = mapped_column(Text, nullable=False)
     content_html: Mapped[str | None] = mapped_column(Text)  # Rendered HTML
+    excerpt: Mapped[str | None] = mapped_column(String(220))  # Set at sync, see make_excerpt
+    content_sha256: Mapped[str | None] = mapped_column(String(64))  # Lets sync skip unchanged docs
 
     # Metadata
     category: Mapped[str | None] = mapped_column(String(100))  # guide, reference, tutorial
     tags: Mapped[list[str]] = mapped_column(JSONB, default=list)
     doc_metadata: Mapped[dict[str, Any]] = mapped_column("metadata", JSONB, default=dict)
 
-    # Search
-    search_vector: Mapped[Any | None] = mapped_column(TSVECTOR)
+    # Search; derived from title/content by Postgres, never written by the application
+    search_vector: Mapped[Any | None] = mapped_column(
+        TSVECTOR,
+        Computed(
+            "to_tsvector('pg_catalog.english', title || ' ' || content)",
+            persisted=True,
+        ),
+    )
 
     # Timestamps
     source_updated_at: Mapped[datetime | None] = mapped_column(DateTime)
-    created_at: Mapped[datetime] = mapped_column(DateTime, default=datetime.utcnow)
+    created_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True), server_default=func.now()
+    )
     updated_at: Mapped[datetime] = mapped_column(
-        DateTime, default=datetime.utcnow, onupdate=datetime.utcnow
+        DateTime(timezone=True), server_default=func.now(), onupdate=func.now()
     )
 
     __table_args__ = (
         Index("ix_documentation_search_vector", "search_vector", postgresql_using="gin"),
         Index("ix_documentation_category", "category"),
+        Index(
+            "ix_documentation_title_trgm",
+            "title",
+            postgresql_using="gin",
+            postgresql_ops={"title": "gin_trgm_ops"},
+        ),
+        Index(
+            "ix_documentation_content_trgm",
+            "content",
+            postgresql_using="gin",
+            postgresql_ops={"content": "gin_trgm_ops"},
+        ),
+        # Serve tags/metadata @> containment filters
+        Index(
+            "ix_documentation_tags_gin",
+            "tags",
+            postgresql_using="gin",
+            postgresql_ops={"tags": "jsonb_path_ops"},
+        ),
+        Index(
+            "ix_documentation_metadata_gin",
+            "metadata",
+            postgresql_using="gin",
+            postgresql_ops={"metadata": "jsonb_path_ops"},
+        ),
     )
 
     def __repr__(self) -> str:
         return f"<Documentation {self.slug}>"
+
+
+def make_excerpt(content: str, max_chars: int = 200) -> str:
+    """Listing excerpt for ``content``; stored on the row when docs are synced."""
+    if len(content) > max_chars:
+        return content[:max_chars] + "..."
+    return content
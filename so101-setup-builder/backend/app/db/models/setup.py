@@ -1,12 +1,16 @@
 from datetime import datetime
-from typing import Any
+from typing import TYPE_CHECKING, Any
 import uuid
 
-from sqlalchemy import String, Text, Integer, ForeignKey, DateTime, Index
+from sqlalchemy import String, Text, Integer, ForeignKey, DateTime, Index, text, func
 from sqlalchemy.dialects.postgresql import UUID, JSONB
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from app.db.database import Base
+from app.db.ids import uuid7
+
+if TYPE_CHECKING:
+    from app.db.models.component import Component
 
 
 class Setup(Base):
@@ -15,7 +19,7 @@ class Setup(Base):
     __tablename__ = "setups"
 
     id: Mapped[uuid.UUID] = mapped_column(
-        UUID(as_uuid=True), primary_key=True, default=uuid.uuid4
+        UUID(as_uuid=True), primary_key=True, default=uuid7
     )
     name: Mapped[str | None] = mapped_column(String(200))
     description: Mapped[str | None] = mapped_column(Text)
@@ -33,18 +37,28 @@ class Setup(Base):
     recommendations: Mapped[dict[str, Any] | None] = mapped_column(JSONB)
 
     # Timestamps
-    created_at: Mapped[datetime] = mapped_column(DateTime, default=datetime.utcnow)
+    created_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True), server_default=func.now()
+    )
     updated_at: Mapped[datetime] = mapped_column(
-        DateTime, default=datetime.utcnow, onupdate=datetime.utcnow
+        DateTime(timezone=True), server_default=func.now(), onupdate=func.now()
     )
     expires_at: Mapped[datetime | None] = mapped_column(DateTime)
 
     # Relationships
+    # Rows are removed by the ON DELETE CASCADE foreign key, not loaded and deleted one by one
     components: Mapped[list["SetupComponent"]] = relationship(
-        back_populates="setup", cascade="all, delete-orphan"
+        back_populates="setup", cascade="all, delete-orphan", passive_deletes=True
     )
 
-    __table_args__ = (Index("ix_setups_expires_at", "expires_at"),)
+    __table_args__ = (
+        # Only expiring sessions are ever looked up by expires_at
+        Index(
+            "ix_setups_expires_at_active",
+            "expires_at",
+            postgresql_where=text("expires_at IS NOT NULL"),
+        ),
+    )
 
     def __repr__(self) -> str:
         return f"<Setup {self.id}>"
@@ -57,7 +71,7 @@ class SetupComponent(Base):
 
     id: Mapped[int] = mapped_column(primary_key=True)
     setup_id: Mapped[uuid.UUID] = mapped_column(
-        UUID(as_uuid=True), ForeignKey("setups.id"), nullable=False
+        UUID(as_uuid=True), ForeignKey("setups.id", ondelete="CASCADE"), nullable=False
     )
     component_id: Mapped[int] = mapped_column(ForeignKey("components.id"), nullable=False)
     quantity: Mapped[int] = mapped_column(Integer, default=1)
@@ -67,13 +81,20 @@ class SetupComponent(Base):
     selected_vendor_id: Mapped[int | None] = mapped_column(ForeignKey("vendors.id"))
 
     # Timestamps
-    created_at: Mapped[datetime] = mapped_column(DateTime, default=datetime.utcnow)
+    created_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True), server_default=func.now()
+    )
 
     # Relationships
     setup: Mapped["Setup"] = relationship(back_populates="components")
+    component: Mapped["Component"] = relationship()
 
     __table_args__ = (
-        Index("ix_setup_components_setup_id", "setup_id"),
+        Index(
+            "ix_setup_components_setup_covering",
+            "setup_id",
+            postgresql_include=["id", "component_id", "quantity", "selected_vendor_id", "notes"],
+        ),
         Index("ix_setup_components_component_id", "component_id"),
     )
 
@@ -0,0 +1,201 @@
+"""Reusable SQL fragments shared by API endpoints."""
+
+from collections.abc import Iterable
+from uuid import UUID
+
+from typing import Any
+
+from sqlalchemy import Row, Select, Subquery, case, func, literal, select
+from sqlalchemy.dialects.postgresql import JSONB, JSONPATH
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import defer, selectinload
+
+from app.db.models import Component, ComponentPrice, Setup, SetupComponent, Vendor
+
+
+def lowest_price_subquery(
+    component_ids: Iterable[int] | Select | None = None,
+) -> Subquery:
+    """Lowest vendor price per component, aggregated in SQL.
+
+    Columns: ``component_id``, ``lowest_price``. Outer-join it on ``Component.id`` to get
+    the lowest price alongside each component without loading every price row.
+
+    Pass ``component_ids`` (ids, or a select of ids) to aggregate only those components'
+    prices; Postgres does not push an outer ``Component.id`` filter into the ``GROUP BY``.
+    """
+    query = select(
+        ComponentPrice.component_id,
+        func.min(ComponentPrice.price).label("lowest_price"),
+    )
+    if component_ids is not None:
+        query = query.where(ComponentPrice.component_id.in_(component_ids))
+    return query.group_by(ComponentPrice.component_id).subquery("lowest_price")
+
+
+async def get_setup_with_components(
+    setup_id: UUID,
+    db: AsyncSession,
+    with_recommendations: bool = True,
+) -> Setup | None:
+    """Fetch a setup with its components and their categories.
+
+    Everything is eager-loaded in a fixed number of selectin batches, so callers can walk
+    ``setup.components[i].component`` without issuing a query per component. Prices are
+    not loaded; use :func:`get_best_prices` for those. Pass
+    ``with_recommendations=False`` to leave the recommendations JSONB in the database.
+    """
+    query = select(Setup).options(
+        selectinload(Setup.components)
+        .selectinload(SetupComponent.component)
+        .selectinload(Component.category),
+    ).where(Setup.id == setup_id)
+
+    if not with_recommendations:
+        query = query.options(defer(Setup.recommendations))
+
+    result = await db.execute(query)
+    return result.scalar_one_or_none()
+
+
+async def get_recommended_components(
+    setup_id: UUID,
+    db: AsyncSession,
+) -> list[dict[str, Any]] | None:
+    """The ``components`` array of a setup's recommendations, extracted in SQL.
+
+    Only that array is sent back, not the whole recommendations document. Returns
+    ``None`` if the setup does not exist and ``[]`` if it has no recommendations.
+    """
+    query = select(
+        func.jsonb_path_query_array(
+            Setup.recommendations,
+            literal("$.components[*]", JSONPATH),
+            type_=JSONB,
+        )
+    ).where(Setup.id == setup_id)
+
+    result = await db.execute(query)
+    row = result.one_or_none()
+    if row is None:
+        return None
+    return row[0] or []
+
+
+async def get_best_prices(
+    db: AsyncSession,
+    component_ids: Iterable[int],
+    preferred_vendors: dict[int, int] | None = None,
+) -> dict[int, Row]:
+    """Pick one price row per component with ``DISTINCT ON (component_id)``.
+
+    The cheapest price wins, unless ``preferred_vendors`` maps the component to a vendor
+    that lists it, in which case that vendor's price is used. Rows expose
+    ``component_id``, ``price``, ``price_cents``, ``currency``, ``product_url`` and
+    ``vendor_name``.
+    """
+    component_ids = set(component_ids)
+    if not component_ids:
+        return {}
+
+    order_by = [ComponentPrice.component_id]
+    if preferred_vendors:
+        preferred_vendor_id = case(preferred_vendors, value=ComponentPrice.component_id)
+        order_by.append(func.coalesce(ComponentPrice.vendor_id == preferred_vendor_id, False).desc())
+    order_by.append(ComponentPrice.price.asc())
+
+    query = (
+        select(
+            ComponentPrice.component_id,
+            ComponentPrice.price,
+            ComponentPrice.price_cents,
+            ComponentPrice.currency,
+            ComponentPrice.product_url,
+            Vendor.name.label("vendor_name"),
+        )
+        .join(Vendor, Vendor.id == ComponentPrice.vendor_id)
+        .where(ComponentPrice.component_id.in_(component_ids))
+        .order_by(*order_by)
+        .distinct(ComponentPrice.component_id)
+    )
+
+    result = await db.execute(query)
+    return {row.component_id: row for row in result}
+
+
+async def get_setup_best_prices(
+    setup_id: UUID,
+    db: AsyncSession,
+) -> dict[int, Row]:
+    """:func:`get_best_prices` for every component of a setup, keyed off ``setup_id`` alone.
+
+    The component ids and selected vendors come from ``setup_components`` in the same
+    query, so this does not need the setup loaded first.
+    """
+    query = (
+        select(
+            ComponentPrice.component_id,
+            ComponentPrice.price,
+            ComponentPrice.price_cents,
+            ComponentPrice.currency,
+            ComponentPrice.product_url,
+            Vendor.name.label("vendor_name"),
+        )
+        .join(Vendor, Vendor.id == ComponentPrice.vendor_id)
+        .join(SetupComponent, SetupComponent.component_id == ComponentPrice.component_id)
+        .where(SetupComponent.setup_id == setup_id)
+        .order_by(
+            ComponentPrice.component_id,
+            func.coalesce(ComponentPrice.vendor_id == SetupComponent.selected_vendor_id, False).desc(),
+            ComponentPrice.price.asc(),
+        )
+        .distinct(ComponentPrice.component_id)
+    )
+
+    result = await db.execute(query)
+    return {row.component_id: row for row in result}
+
+
+async def get_shopping_list_rows(
+    setup_id: UUID,
+    db: AsyncSession,
+) -> list[Row]:
+    """Fetch one row per setup component with its cheapest vendor price, in one query.
+
+    Rows expose ``component_name``, ``quantity``, ``notes``, ``vendor_name``, ``price`` and
+    ``product_url``; the price columns are ``None`` when no vendor lists the component.
+    """
+    setup_component_ids = select(SetupComponent.component_id).where(
+        SetupComponent.setup_id == setup_id
+    )
+    best_price = (
+        select(
+            ComponentPrice.component_id,
+            ComponentPrice.price,
+            ComponentPrice.product_url,
+            Vendor.name.label("vendor_name"),
+        )
+        .join(Vendor, Vendor.id == ComponentPrice.vendor_id)
+        .where(ComponentPrice.component_id.in_(setup_component_ids))
+        .order_by(ComponentPrice.component_id, ComponentPrice.price.asc())
+        .distinct(ComponentPrice.component_id)
+        .subquery("best_price")
+    )
+
+    query = (
+        select(
+            Component.name.label("component_name"),
+            SetupComponent.quantity,
+            SetupComponent.notes,
+            best_price.c.vendor_name,
+            best_price.c.price,
+            best_price.c.product_url,
+        )
+        .join(Component, Component.id == SetupComponent.component_id)
+        .outerjoin(best_price, best_price.c.component_id == SetupComponent.component_id)
+        .where(SetupComponent.setup_id == setup_id)
+        .order_by(SetupComponent.id)
+    )
+
+    result = await db.execute(query)
+    return result.all()
@@ -0,0 +1,111 @@
+"""Materialized views maintained alongside the ORM tables."""
+
+from uuid import UUID
+
+from sqlalchemy import DDL, BigInteger, DateTime, Row, String, column, event, select, table, text
+from sqlalchemy.dialects.postgresql import ARRAY, JSONB, UUID as PG_UUID
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.db.database import Base
+from app.db.models import Setup
+
+# Per-setup cost breakdown, priced the same way as get_best_prices: the selected
+# vendor's price when it lists the component, otherwise the cheapest one. Alembic
+# revision 007 creates the view from this same definition.
+SETUP_PRICING_MV_SQL = """
+CREATE MATERIALIZED VIEW IF NOT EXISTS setup_pricing_mv AS
+WITH items AS (
+    SELECT
+        sc.setup_id,
+        sc.id AS setup_component_id,
+        c.id AS component_id,
+        c.name AS component_name,
+        sc.quantity,
+        coalesce(cat.name, 'Other') AS category_name,
+        coalesce(best.price_cents, 0) AS unit_cents,
+        coalesce(best.price_cents, 0) * sc.quantity AS total_cents,
+        v.name AS vendor_name,
+        best.product_url
+    FROM setup_components sc
+    JOIN components c ON c.id = sc.component_id
+    LEFT JOIN categories cat ON cat.id = c.category_id
+    LEFT JOIN LATERAL (
+        SELECT cp.price_cents, cp.vendor_id, cp.product_url
+        FROM component_prices cp
+        WHERE cp.component_id = sc.component_id
+        ORDER BY coalesce(cp.vendor_id = sc.selected_vendor_id, false) DESC, cp.price
+        LIMIT 1
+    ) best ON true
+    LEFT JOIN vendors v ON v.id = best.vendor_id
+),
+by_category AS (
+    SELECT setup_id, jsonb_object_agg(category_name, total_cents) AS cost_by_category
+    FROM (
+        SELECT setup_id, category_name, sum(total_cents)::bigint AS total_cents
+        FROM items
+        GROUP BY setup_id, category_name
+    ) category_totals
+    GROUP BY setup_id
+)
+SELECT
+    items.setup_id,
+    sum(items.total_cents)::bigint AS subtotal_cents,
+    by_category.cost_by_category,
+    coalesce(
+        array_agg(DISTINCT items.vendor_name) FILTER (WHERE items.vendor_name IS NOT NULL),
+        '{}'
+    ) AS vendors_used,
+    jsonb_agg(
+        jsonb_build_object(
+            'component_id', items.component_id,
+            'component_name', items.component_name,
+            'quantity', items.quantity,
+            'unit_cents', items.unit_cents,
+            'total_cents', items.total_cents,
+            'vendor_name', items.vendor_name,
+            'product_url', items.product_url
+        )
+        ORDER BY items.setup_component_id
+    ) AS components,
+    now() AS refreshed_at
+FROM items
+JOIN by_category USING (setup_id)
+GROUP BY items.setup_id, by_category.cost_by_category
+"""
+
+# REFRESH ... CONCURRENTLY needs a unique index on the view
+SETUP_PRICING_MV_INDEX_SQL = (
+    "CREATE UNIQUE INDEX IF NOT EXISTS ix_setup_pricing_mv_setup_id "
+    "ON setup_pricing_mv (setup_id)"
+)
+
+event.listen(Base.metadata, "after_create", DDL(SETUP_PRICING_MV_SQL))
+event.listen(Base.metadata, "after_create", DDL(SETUP_PRICING_MV_INDEX_SQL))
+
+setup_pricing_mv = table(
+    "setup_pricing_mv",
+    column("setup_id", PG_UUID(as_uuid=True)),
+    column("subtotal_cents", BigInteger),
+    column("cost_by_category", JSONB),
+    column("vendors_used", ARRAY(String)),
+    column("components", JSONB),
+    column("refreshed_at", DateTime),
+)
+
+
+async def get_setup_pricing_row(setup_id: UUID, db: AsyncSession) -> Row | None:
+    """Precomputed pricing for a setup, or ``None`` if the view has no row for it.
+
+    Joined to setups so a setup deleted since the last refresh is not returned.
+    """
+    result = await db.execute(
+        select(setup_pricing_mv)
+        .join(Setup, Setup.id == setup_pricing_mv.c.setup_id)
+        .where(setup_pricing_mv.c.setup_id == setup_id)
+    )
+    return result.one_or_none()
+
+
+async def refresh_setup_pricing(db: AsyncSession) -> None:
+    """Rebuild setup_pricing_mv without blocking concurrent readers."""
+    await db.execute(text("REFRESH MATERIALIZED VIEW CONCURRENTLY setup_pricing_mv"))
@@ -1,4 +1,9 @@
 from app.llm.client import GeminiClient
-from app.llm.prompts import RECOMMENDATION_SYSTEM_PROMPT, CHAT_SYSTEM_PROMPT
+from app.llm.prompts import RECOMMENDATION_SYSTEM_PROMPT, CHAT_SYSTEM_PROMPT, render_chat_prompt
 
-__all__ = ["GeminiClient", "RECOMMENDATION_SYSTEM_PROMPT", "CHAT_SYSTEM_PROMPT"]
+__all__ = [
+    "GeminiClient",
+    "RECOMMENDATION_SYSTEM_PROMPT",
+    "CHAT_SYSTEM_PROMPT",
+    "render_chat_prompt",
+]
@@ -0,0 +1,70 @@
+"""Response cache for Gemini calls."""
+
+import asyncio
+from collections.abc import Awaitable, Callable
+
+from redis.exceptions import RedisError
+
+from app.cache import get_redis
+
+
+class LLMResponseCache:
+    """Redis-backed cache of serialized LLM results with request coalescing.
+
+    Concurrent misses for the same key in one worker share a single call instead of
+    each going to the model. ``compute`` may return ``None`` for a result that should
+    not be cached (e.g. an unparseable response); it is still returned to all waiters.
+    Redis is best-effort: if it is unreachable every miss simply computes.
+    """
+
+    def __init__(self, ttl: int):
+        self.ttl = ttl
+        self._inflight: dict[str, asyncio.Future[str | None]] = {}
+
+    async def get_or_set(
+        self,
+        key: str,
+        compute: Callable[[], Awaitable[str | None]],
+    ) -> str | None:
+        redis = get_redis()
+
+        try:
+            cached = await redis.get(key)
+        except RedisError:
+            cached = None
+        if cached is not None:
+            return cached
+
+        inflight = self._inflight.get(key)
+        if inflight is not None:
+            try:
+                return await asyncio.shield(inflight)
+            except asyncio.CancelledError:
+                if not inflight.cancelled():
+                    raise
+                # The request computing it was cancelled; compute it here instead
+
+        future = asyncio.get_running_loop().create_future()
+        self._inflight[key] = future
+        try:
+            value = await compute()
+        except asyncio.CancelledError:
+            future.cancel()
+            raise
+        except Exception as e:
+            future.set_exception(e)
+            # Mark retrieved so a future nobody waited on does not log the error again
+            future.exception()
+            raise
+        else:
+            future.set_result(value)
+        finally:
+            del self._inflight[key]
+
+        if value is not None:
+            try:
+                await redis.setex(key, self.ttl, value)
+            except RedisError:
+                pass
+
+        return value
@@ -1,33 +1,120 @@
+import asyncio
+from functools import lru_cache
 from typing import Any
 
+import httpx
+from tenacity import (
+    retry,
+    retry_if_exception,
+    stop_after_attempt,
+    wait_exponential_jitter,
+)
+
 from app.config import get_settings
 
 settings = get_settings()
 
+GEMINI_API_URL = "https://generativelanguage.googleapis.com/v1beta"
+
+# Caps concurrent Gemini requests per worker to stay inside the API rate limit
+_gemini_slots = asyncio.Semaphore(settings.gemini_max_concurrency)
+
+
+@lru_cache
+def get_gemini_http() -> httpx.AsyncClient:
+    """Shared HTTP client for the Gemini REST API.
+
+    Keeps TLS connections to the API alive across requests instead of opening one per
+    call, and multiplexes concurrent requests over HTTP/2; closed on application
+    shutdown.
+    """
+    return httpx.AsyncClient(
+        base_url=GEMINI_API_URL,
+        http2=True,
+        limits=httpx.Limits(max_connections=200, max_keepalive_connections=100),
+        timeout=httpx.Timeout(60.0, connect=10.0),
+    )
+
+
+def _is_rate_limited(exc: BaseException) -> bool:
+    return isinstance(exc, httpx.HTTPStatusError) and exc.response.status_code == 429
+
+
+@lru_cache(maxsize=32)
+def _system_instruction(system_prompt: str) -> dict[str, Any]:
+    """``systemInstruction`` payload, built once per distinct system prompt.
+
+    Kept separate from the user turn so every request starts with the same prefix,
+    which Gemini's implicit context caching can reuse.
+    """
+    return {"parts": [{"text": system_prompt}]}
+
 
 class GeminiClient:
     """Client for Google Gemini API."""
 
-    def __init__(self, model: str = "gemini-2.0-flash"):
+    def __init__(
+        self,
+        model: str = "gemini-2.0-flash",
+        http: httpx.AsyncClient | None = None,
+    ):
         self.model = model
         self.api_key = settings.gemini_api_key
-        self._client = None
+        # Resolved on first request, like the API key check
+        self.http = http
+
+    async def warm_up(self) -> None:
+        """Open a connection to the API ahead of the first real request (best-effort).
+
+        Fetches the model's metadata, which needs no tokens, so the TLS handshake is
+        done and the connection sits in the shared pool.
+        """
+        if not self.api_key:
+            return
+
+        http = self.http or get_gemini_http()
+        try:
+            await http.get(
+                f"/models/{self.model}",
+                headers={"x-goog-api-key": self.api_key},
+                timeout=5.0,
+            )
+        except httpx.HTTPError:
+            pass
 
-    def _get_client(self):
-        """Lazy initialization of Gemini client."""
-        if self._client is None:
-            if not self.api_key:
-                raise ValueError("GEMINI_API_KEY not configured")
+    async def _generate_content(self, payload: dict[str, Any]) -> dict[str, Any]:
+        """POST a generateContent request and return the first candidate's content."""
+        if not self.api_key:
+            raise ValueError("GEMINI_API_KEY not configured")
 
-            try:
-                import google.generativeai as genai
+        try:
+            response = await self._post(f"/models/{self.model}:generateContent", payload)
+            return response.json()["candidates"][0]["content"]
 
-                genai.configure(api_key=self.api_key)
-                self._client = genai.GenerativeModel(self.model)
-            except ImportError:
-                raise ImportError("google-generativeai package not installed")
+        except (httpx.HTTPError, KeyError, IndexError, ValueError) as e:
+            raise RuntimeError(f"Gemini API error: {str(e)}")
+
+    # Transient 429s are retried with jittered backoff; the slot is released while waiting
+    @retry(
+        retry=retry_if_exception(_is_rate_limited),
+        wait=wait_exponential_jitter(multiplier=0.1, max=2.0),
+        stop=stop_after_attempt(4),
+        reraise=True,
+    )
+    async def _post(self, url: str, payload: dict[str, Any]) -> httpx.Response:
+        http = self.http or get_gemini_http()
+        async with _gemini_slots:
+            response = await http.post(
+                url,
+                json=payload,
+                headers={"x-goog-api-key": self.api_key},
+            )
+        response.raise_for_status()
+        return response
 
-        return self._client
+    @staticmethod
+    def _text(content: dict[str, Any]) -> str:
+        return "".join(part.get("text", "") for part in content.get("parts", []))
 
     async def generate(
         self,
@@ -35,27 +122,29 @@ class GeminiClient:
         system_prompt: str | None = None,
         temperature: float = 0.7,
         max_tokens: int = 2048,
+        response_mime_type: str | None = None,
     ) -> str:
-        """Generate a response from the model."""
-        client = self._get_client()
-
-        # Build full prompt with system context
-        full_prompt = prompt
+        """Generate a response from the model.
+
+        Pass ``response_mime_type="application/json"`` when the prompt asks for JSON; the
+        model then returns only the JSON document, without surrounding prose.
+        """
+        generation_config: dict[str, Any] = {
+            "temperature": temperature,
+            "maxOutputTokens": max_tokens,
+        }
+        if response_mime_type:
+            generation_config["responseMimeType"] = response_mime_type
+
+        payload: dict[str, Any] = {
+            "contents": [{"role": "user", "parts": [{"text": prompt}]}],
+            "generationConfig": generation_config,
+        }
         if system_prompt:
-            full_prompt = f"{system_prompt}\n\n{prompt}"
-
-        try:
-            response = client.generate_content(
-                full_prompt,
-                generation_config={
-                    "temperature": temperature,
-                    "max_output_tokens": max_tokens,
-                },
-            )
-            return response.text
+            payload["systemInstruction"] = _system_instruction(system_prompt)
 
-        except Exception as e:
-            raise RuntimeError(f"Gemini API error: {str(e)}")
+        content = await self._generate_content(payload)
+        return self._text(content)
 
     async def chat(
         self,
@@ -65,24 +154,20 @@ class GeminiClient:
         temperature: float = 0.7,
     ) -> str:
         """Have a conversation with the model."""
-        client = self._get_client()
-
-        try:
-            # Start chat session
-            chat = client.start_chat(history=self._format_history(history))
+        payload: dict[str, Any] = {
+            "contents": [
+                *self._format_history(history),
+                {"role": "user", "parts": [{"text": message}]},
+            ],
+            "generationConfig": {"temperature": temperature},
+        }
+
+        # Sent as a system instruction with the message, not as an extra chat turn
+        if system_prompt:
+            payload["systemInstruction"] = _system_instruction(system_prompt)
 
-            # Add system prompt as first message if provided
-            if system_prompt and not history:
-                chat.send_message(f"System: {system_prompt}")
-
-            response = chat.send_message(
-                message,
-                generation_config={"temperature": temperature},
-            )
-            return response.text
-
-        except Exception as e:
-            raise RuntimeError(f"Gemini API error: {str(e)}")
+        content = await self._generate_content(payload)
+        return self._text(content)
 
     def _format_history(
         self,
@@ -92,14 +177,14 @@ class GeminiClient:
         if not history:
             return []
 
-        formatted = []
-        for msg in history:
-            role = "user" if msg.get("role") == "user" else "model"
-            formatted.append({
-                "role": role,
-                "parts": [msg.get("content", "")],
-            })
-        return formatted
+        # Anything but a user turn is the model's
+        return [
+            {
+                "role": "user" if msg["role"] == "user" else "model",
+                "parts": [{"text": msg["content"]}],
+            }
+            for msg in history
+        ]
 
     async def generate_with_tools(
         self,
@@ -108,32 +193,29 @@ class GeminiClient:
         system_prompt: str | None = None,
     ) -> dict[str, Any]:
         """Generate response with function calling."""
-        client = self._get_client()
-
-        full_prompt = prompt
+        payload: dict[str, Any] = {
+            "contents": [{"role": "user", "parts": [{"text": prompt}]}],
+            "tools": [{"functionDeclarations": tools}],
+        }
         if system_prompt:
-            full_prompt = f"{system_prompt}\n\n{prompt}"
-
-        try:
-            response = client.generate_content(
-                full_prompt,
-                tools=tools,
-            )
-
-            # Check for function calls
-            if response.candidates and response.candidates[0].content.parts:
-                for part in response.candidates[0].content.parts:
-                    if hasattr(part, "function_call"):
-                        return {
-                            "type": "function_call",
-                            "name": part.function_call.name,
-                            "args": dict(part.function_call.args),
-                        }
-
-            return {
-                "type": "text",
-                "content": response.text,
-            }
-
-        except Exception as e:
-            raise RuntimeError(f"Gemini API error: {str(e)}")
+            payload["systemInstruction"] = _system_instruction(system_prompt)
+
+        content = await self._generate_content(payload)
+
+        # Check for function calls, collecting the text parts in the same pass
+        texts = []
+        for part in content.get("parts", []):
+            if "functionCall" in part:
+                return {
+                    "type": "function_call",
+                    "name": part["functionCall"]["name"],
+                    # Already a plain dict decoded from the JSON response
+                    "args": part["functionCall"].get("args", {}),
+                }
+            if "text" in part:
+                texts.append(part["text"])
+
+        return {
+            "type": "text",
+            "content": "".join(texts),
+        }
@@ -87,6 +87,16 @@ If your response includes suggested actions, format as JSON with a "message" fie
 Otherwise, respond with plain text.
 """
 
+# Split once around the only placeholder; the template also holds literal JSON braces,
+# so it cannot go through str.format
+_CHAT_PROMPT_PREFIX, _CHAT_PROMPT_SUFFIX = CHAT_SYSTEM_PROMPT.split("{context}")
+
+
+def render_chat_prompt(context: str) -> str:
+    """CHAT_SYSTEM_PROMPT with ``context`` filled in."""
+    return f"{_CHAT_PROMPT_PREFIX}{context}{_CHAT_PROMPT_SUFFIX}"
+
+
 COMPONENT_SEARCH_PROMPT = """Based on the following criteria, search for and recommend components:
 
 Category: {category}
@@ -91,20 +91,19 @@ SEARCH_WEB_PRICES_TOOL = {
     },
 }
 
-# All tools for easy access
-ALL_TOOLS = [
+# All tools for easy access (a tuple so shared references cannot be appended to)
+ALL_TOOLS = (
     SEARCH_COMPONENTS_TOOL,
     GET_COMPONENT_DETAILS_TOOL,
     CHECK_COMPATIBILITY_TOOL,
     GET_CURRENT_PRICES_TOOL,
     SEARCH_WEB_PRICES_TOOL,
-]
+)
+
+# Built once; the declarations are static
+_TOOLS_FOR_GEMINI = ({"function_declarations": ALL_TOOLS},)
 
 
 def get_tools_for_gemini() -> list[dict[str, Any]]:
     """Get tools formatted for Gemini API."""
-    return [
-        {
-            "function_declarations": ALL_TOOLS,
-        }
-    ]
+    return list(_TOOLS_FOR_GEMINI)
@@ -2,6 +2,7 @@ from contextlib import asynccontextmanager
 
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.middleware.gzip import GZipMiddleware
 
 from app.config import get_settings
 from app.api.v1.endpoints import (
@@ -14,6 +15,8 @@ from app.api.v1.endpoints import (
     docs,
 )
 from app.db.database import engine, Base
+from app.llm.client import GeminiClient, get_gemini_http
+from app.services.http_client import get_http_client
 
 settings = get_settings()
 
@@ -24,9 +27,15 @@ async def lifespan(app: FastAPI):
     # Startup
     async with engine.begin() as conn:
         await conn.run_sync(Base.metadata.create_all)
+    # Spare the first recommendation request the TLS handshake
+    await GeminiClient().warm_up()
     yield
     # Shutdown
     await engine.dispose()
+    if get_gemini_http.cache_info().currsize:
+        await get_gemini_http().aclose()
+    if get_http_client.cache_info().currsize:
+        await get_http_client().aclose()
 
 
 app = FastAPI(
@@ -45,6 +54,9 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+# Compress JSON responses (documentation pages in particular)
+app.add_middleware(GZipMiddleware, minimum_size=512, compresslevel=5)
+
 # Include routers
 app.include_router(wizard.router, prefix="/api/v1/wizard", tags=["Wizard"])
 app.include_router(components.router, prefix="/api/v1/components", tags=["Components"])
@@ -1,3 +1,4 @@
+import asyncio
 from datetime import datetime
 from io import BytesIO
 from typing import Any
@@ -32,7 +33,8 @@ class ExportService:
         html = HTML(string=html_content)
         css = CSS(string=self._get_pdf_styles())
 
-        pdf_bytes = html.write_pdf(stylesheets=[css])
+        # WeasyPrint renders synchronously; keep it off the event loop
+        pdf_bytes = await asyncio.to_thread(html.write_pdf, stylesheets=[css])
         return pdf_bytes
 
     async def _generate_simple_pdf(
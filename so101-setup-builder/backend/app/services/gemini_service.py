@@ -1,16 +1,136 @@
-import json
+import hashlib
+from collections.abc import Hashable
+from functools import lru_cache
 from typing import Any
 
+import orjson
+from pydantic import ValidationError
+
+from app.cache import TTLCache, hash_key
 from app.config import get_settings
 from app.api.v1.schemas.recommendation import ComponentRecommendation, ChatMessage
+from app.llm.cache import LLMResponseCache
 from app.llm.client import GeminiClient
 from app.llm.prompts import (
     RECOMMENDATION_SYSTEM_PROMPT,
-    CHAT_SYSTEM_PROMPT,
+    render_chat_prompt,
 )
 
 settings = get_settings()
 
+_responses = LLMResponseCache(ttl=settings.llm_cache_ttl_seconds)
+
+# (context, digest) per setup version, so follow-up chat turns skip re-serializing
+# the profile and recommendations
+_chat_contexts = TTLCache(ttl=300, maxsize=1024)
+
+# The only profile fields the recommendation prompt uses
+RECOMMENDATION_PROFILE_FIELDS = (
+    "experience",
+    "budget",
+    "use_case",
+    "compute_platform",
+    "camera_preference",
+)
+
+
+@lru_cache(maxsize=512)
+def _load_recommendations(
+    cached: str,
+) -> tuple[dict[str, Any], tuple[ComponentRecommendation, ...]]:
+    """Decode a cached recommendations entry into (fields, components).
+
+    Memoized because cache hits replay the same JSON for every matching wizard; callers
+    build a fresh dict from the result instead of mutating it. Entries were validated
+    before they were stored, so the components are not validated again.
+    """
+    data = orjson.loads(cached)
+    components = tuple(
+        ComponentRecommendation.model_construct(**comp) for comp in data.pop("components")
+    )
+    return data, components
+
+
+def _prompt_json(value: Any) -> str:
+    """Compact JSON with sorted keys for prompt text, identical for equal inputs."""
+    return orjson.dumps(value, option=orjson.OPT_SORT_KEYS).decode()
+
+
+def _extract_json(response: str) -> dict[str, Any] | None:
+    """The JSON object embedded in a model response (first ``{`` to last ``}``).
+
+    ``str.find``/``rfind`` run in C, so locating the span is cheap next to the parse.
+    """
+    json_start = response.find("{")
+    json_end = response.rfind("}") + 1
+    if json_start < 0 or json_end <= json_start:
+        return None
+    try:
+        return orjson.loads(response[json_start:json_end])
+    except orjson.JSONDecodeError:
+        return None
+
+
+@lru_cache(maxsize=4)
+def _default_components(arm_type: str) -> tuple[ComponentRecommendation, ...]:
+    """Default component list for an arm type, built once per arm type.
+
+    The values are fixed and known-good, so the models skip validation.
+    """
+    components = []
+
+    if arm_type == "dual":
+        components.extend([
+            ComponentRecommendation.model_construct(
+                component_id=1,
+                component_name="Feetech STS3215 (1/345)",
+                category="motors",
+                reason="Follower arm motors",
+                priority="required",
+                quantity=6,
+            ),
+            ComponentRecommendation.model_construct(
+                component_id=2,
+                component_name="Feetech STS3215 (Mixed ratios)",
+                category="motors",
+                reason="Leader arm motors",
+                priority="required",
+                quantity=6,
+            ),
+        ])
+    else:
+        components.append(
+            ComponentRecommendation.model_construct(
+                component_id=1,
+                component_name="Feetech STS3215 (1/345)",
+                category="motors",
+                reason="All joints use same motor",
+                priority="required",
+                quantity=6,
+            )
+        )
+
+    components.extend([
+        ComponentRecommendation.model_construct(
+            component_id=5,
+            component_name="Waveshare Servo Driver",
+            category="electronics",
+            reason="Motor controller",
+            priority="required",
+            quantity=2 if arm_type == "dual" else 1,
+        ),
+        ComponentRecommendation.model_construct(
+            component_id=6,
+            component_name="12V 5A Power Supply",
+            category="power",
+            reason="Powers motors",
+            priority="required",
+            quantity=2 if arm_type == "dual" else 1,
+        ),
+    ])
+
+    return tuple(components)
+
 
 class GeminiService:
     """Service for AI-powered recommendations using Gemini."""
@@ -28,13 +148,36 @@ class GeminiService:
         # Build prompt with profile context
         prompt = self._build_recommendation_prompt(profile, focus_areas, constraints)
 
-        response = await self.client.generate(
-            prompt=prompt,
-            system_prompt=RECOMMENDATION_SYSTEM_PROMPT,
+        # Keyed on what the prompt is built from, so profiles that differ only in
+        # unused fields or in the order/case of focus areas share an entry
+        cache_key = hash_key(
+            "gemini:recommendations",
+            {
+                "profile": {field: profile.get(field) for field in RECOMMENDATION_PROFILE_FIELDS},
+                "arm_type": profile.get("arm_type", "single"),
+                "focus": sorted({area.strip().lower() for area in focus_areas or []}),
+                "constraints": constraints,
+            },
         )
 
-        # Parse response into structured recommendations
-        return self._parse_recommendations(response, profile)
+        async def generate() -> str | None:
+            # JSON mode: no prose or code fences around the document, so fewer tokens
+            # to generate and nothing to strip before parsing
+            response = await self.client.generate(
+                prompt=prompt,
+                system_prompt=RECOMMENDATION_SYSTEM_PROMPT,
+                response_mime_type="application/json",
+            )
+            # Cache the parsed result, not the raw text; unusable responses are not cached
+            data = self._parse_recommendations(response)
+            return orjson.dumps(data).decode() if data is not None else None
+
+        cached = await _responses.get_or_set(cache_key, generate)
+        if cached is None:
+            return self._get_default_recommendations(profile)
+
+        data, components = _load_recommendations(cached)
+        return {**data, "components": list(components)}
 
     async def chat(
         self,
@@ -42,18 +185,34 @@ class GeminiService:
         history: list[ChatMessage],
         profile: dict[str, Any] | None = None,
         current_recommendations: dict[str, Any] | None = None,
+        context_version: Hashable | None = None,
     ) -> dict[str, Any]:
-        """Interactive chat for Q&A about the setup."""
+        """Interactive chat for Q&A about the setup.
+
+        ``context_version`` identifies the state of ``profile`` and
+        ``current_recommendations`` (e.g. the setup's id and ``updated_at``); when given,
+        the serialized context is reused until it changes.
+        """
         # Build context from history and profile
-        context = self._build_chat_context(profile, current_recommendations)
+        context, context_digest = self._chat_context(
+            profile, current_recommendations, context_version
+        )
 
         # Format history for Gemini
         messages = [{"role": m.role, "content": m.content} for m in history]
 
-        response = await self.client.chat(
-            message=message,
-            history=messages,
-            system_prompt=CHAT_SYSTEM_PROMPT.format(context=context),
+        cache_key = hash_key(
+            "gemini:chat",
+            {"message": message, "recent": messages[-3:], "context": context_digest},
+        )
+
+        response = await _responses.get_or_set(
+            cache_key,
+            lambda: self.client.chat(
+                message=message,
+                history=messages,
+                system_prompt=render_chat_prompt(context),
+            ),
         )
 
         return self._parse_chat_response(response)
@@ -81,7 +240,7 @@ Based on the following user profile, recommend components for an SO-101 robot ar
             prompt += f"\n**Focus Areas:** {', '.join(focus_areas)}"
 
         if constraints:
-            prompt += f"\n**Additional Constraints:** {json.dumps(constraints)}"
+            prompt += f"\n**Additional Constraints:** {_prompt_json(constraints)}"
 
         prompt += """
 
@@ -114,69 +273,68 @@ Format your response as JSON with this structure:
 """
         return prompt
 
-    def _parse_recommendations(
-        self,
-        response: str,
-        profile: dict[str, Any],
-    ) -> dict[str, Any]:
-        """Parse Gemini response into structured recommendations."""
+    def _parse_recommendations(self, response: str) -> dict[str, Any] | None:
+        """Parse Gemini response into JSON-ready recommendations, ``None`` if unusable."""
+        data = _extract_json(response)
+        if data is None:
+            return None
+
         try:
-            # Try to extract JSON from response
-            json_start = response.find("{")
-            json_end = response.rfind("}") + 1
-            if json_start >= 0 and json_end > json_start:
-                json_str = response[json_start:json_end]
-                data = json.loads(json_str)
-
-                # Convert to ComponentRecommendation objects
-                components = []
-                for comp in data.get("components", []):
-                    components.append(
-                        ComponentRecommendation(
-                            component_id=comp.get("component_id", 0),
-                            component_name=comp.get("component_name", "Unknown"),
-                            category=comp.get("category", "other"),
-                            reason=comp.get("reason", ""),
-                            priority=comp.get("priority", "recommended"),
-                            quantity=comp.get("quantity", 1),
-                            alternatives=comp.get("alternatives", []),
-                        )
-                    )
-
-                return {
-                    "components": components,
-                    "summary": data.get("summary", ""),
-                    "estimated_total": data.get("estimated_total"),
-                    "notes": data.get("notes", []),
-                    "experience_notes": data.get("experience_notes"),
-                    "budget_notes": data.get("budget_notes"),
-                    "use_case_notes": data.get("use_case_notes"),
-                }
-
-        except (json.JSONDecodeError, KeyError, TypeError):
-            pass
-
-        # Return default if parsing fails
-        return self._get_default_recommendations(profile)
+            # Validate through ComponentRecommendation, keep plain dicts
+            components = []
+            for comp in data.get("components", []):
+                components.append(
+                    ComponentRecommendation(
+                        component_id=comp.get("component_id", 0),
+                        component_name=comp.get("component_name", "Unknown"),
+                        category=comp.get("category", "other"),
+                        reason=comp.get("reason", ""),
+                        priority=comp.get("priority", "recommended"),
+                        quantity=comp.get("quantity", 1),
+                        alternatives=comp.get("alternatives", []),
+                    ).model_dump()
+                )
+
+            return {
+                "components": components,
+                "summary": data.get("summary", ""),
+                "estimated_total": data.get("estimated_total"),
+                "notes": data.get("notes", []),
+                "experience_notes": data.get("experience_notes"),
+                "budget_notes": data.get("budget_notes"),
+                "use_case_notes": data.get("use_case_notes"),
+            }
+
+        except (AttributeError, KeyError, TypeError, ValidationError):
+            return None
 
     def _parse_chat_response(self, response: str) -> dict[str, Any]:
         """Parse chat response."""
         # Check if response contains JSON for actions
-        try:
-            json_start = response.find("{")
-            json_end = response.rfind("}") + 1
-            if json_start >= 0 and json_end > json_start:
-                json_str = response[json_start:json_end]
-                data = json.loads(json_str)
-                return {
-                    "message": data.get("message", response),
-                    "suggested_actions": data.get("suggested_actions"),
-                    "updated_recommendations": data.get("updated_recommendations"),
-                }
-        except (json.JSONDecodeError, KeyError):
-            pass
-
-        return {"message": response}
+        data = _extract_json(response)
+        if data is None:
+            return {"message": response}
+
+        return {
+            "message": data.get("message", response),
+            "suggested_actions": data.get("suggested_actions"),
+            "updated_recommendations": data.get("updated_recommendations"),
+        }
+
+    def _chat_context(
+        self,
+        profile: dict[str, Any] | None,
+        recommendations: dict[str, Any] | None,
+        version: Hashable | None,
+    ) -> tuple[str, str]:
+        """Chat context and a digest of it for cache keys."""
+        cached = _chat_contexts.get(version) if version is not None else None
+        if cached is None:
+            context = self._build_chat_context(profile, recommendations)
+            cached = (context, hashlib.blake2b(context.encode(), digest_size=16).hexdigest())
+            if version is not None:
+                _chat_contexts.set(version, cached)
+        return cached
 
     def _build_chat_context(
         self,
@@ -187,10 +345,10 @@ Format your response as JSON with this structure:
         context_parts = []
 
         if profile:
-            context_parts.append(f"User Profile: {json.dumps(profile)}")
+            context_parts.append(f"User Profile: {_prompt_json(profile)}")
 
         if recommendations:
-            context_parts.append(f"Current Recommendations: {json.dumps(recommendations)}")
+            context_parts.append(f"Current Recommendations: {_prompt_json(recommendations)}")
 
         return "\n".join(context_parts) if context_parts else "No context available."
 
@@ -199,62 +357,10 @@ Format your response as JSON with this structure:
         profile: dict[str, Any],
     ) -> dict[str, Any]:
         """Return default SO-101 recommendations."""
-        arm_type = profile.get("arm_type", "single")
-
-        components = []
-
-        if arm_type == "dual":
-            components.extend([
-                ComponentRecommendation(
-                    component_id=1,
-                    component_name="Feetech STS3215 (1/345)",
-                    category="motors",
-                    reason="Follower arm motors",
-                    priority="required",
-                    quantity=6,
-                ),
-                ComponentRecommendation(
-                    component_id=2,
-                    component_name="Feetech STS3215 (Mixed ratios)",
-                    category="motors",
-                    reason="Leader arm motors",
-                    priority="required",
-                    quantity=6,
-                ),
-            ])
-        else:
-            components.append(
-                ComponentRecommendation(
-                    component_id=1,
-                    component_name="Feetech STS3215 (1/345)",
-                    category="motors",
-                    reason="All joints use same motor",
-                    priority="required",
-                    quantity=6,
-                )
-            )
-
-        components.extend([
-            ComponentRecommendation(
-                component_id=5,
-                component_name="Waveshare Servo Driver",
-                category="electronics",
-                reason="Motor controller",
-                priority="required",
-                quantity=2 if arm_type == "dual" else 1,
-            ),
-            ComponentRecommendation(
-                component_id=6,
-                component_name="12V 5A Power Supply",
-                category="power",
-                reason="Powers motors",
-                priority="required",
-                quantity=2 if arm_type == "dual" else 1,
-            ),
-        ])
+        arm_type = str(profile.get("arm_type", "single"))
 
         return {
-            "components": components,
+            "components": list(_default_components(arm_type)),
             "summary": f"Default SO-101 {arm_type}-arm build",
             "notes": ["Default configuration based on LeRobot documentation"],
         }
@@ -0,0 +1,22 @@
+from functools import lru_cache
+
+import httpx
+
+
+@lru_cache
+def get_http_client() -> httpx.AsyncClient:
+    """Shared HTTP client for the search APIs (Tavily, SerpAPI).
+
+    Reuses keep-alive connections across requests instead of a TCP and TLS handshake
+    per search; closed on application shutdown. Pass ``timeout=`` per request where a
+    call needs a different one.
+    """
+    return httpx.AsyncClient(
+        http2=True,
+        limits=httpx.Limits(
+            max_connections=100,
+            max_keepalive_connections=20,
+            keepalive_expiry=300,
+        ),
+        timeout=httpx.Timeout(30.0),
+    )
@@ -1,17 +1,61 @@
-from datetime import datetime
+import asyncio
+import re
+from datetime import datetime, timezone
 from decimal import Decimal
+from functools import lru_cache
 from typing import Any
 
-import httpx
-from sqlalchemy import select
+import orjson
+from sqlalchemy import select, update
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.cache import TTLCache
 from app.config import get_settings
 from app.api.v1.schemas.pricing import PricingSearchResult
 from app.db.models import ComponentPrice, Vendor
+from app.services.http_client import get_http_client
 
 settings = get_settings()
 
+# Common price patterns in search result text, as one alternation so the text is
+# scanned once; whichever pattern matches first in the text wins
+_PRICE_RE = re.compile(
+    r"\$(?P<dollar>\d+(?:\.\d{2})?)"
+    r"|USD\s*(?P<usd>\d+(?:\.\d{2})?)"
+    r"|(?P<plain>\d+(?:\.\d{2})?)\s*(?:USD|dollars?)",
+    re.IGNORECASE,
+)
+
+# Thousands separators are matched inside the number and stripped from it afterwards
+_PRICE_STRING_RE = re.compile(r"\$?(\d[\d,]*(?:\.\d{2})?)")
+
+# URL substrings identifying a seller, checked in order
+_SELLER_SIGNS = (
+    ("aliexpress", "AliExpress"),
+    ("amazon", "Amazon"),
+    ("waveshare", "Waveshare"),
+    ("robotshop", "RobotShop"),
+)
+
+_VENDOR_DOMAINS = {
+    "aliexpress": "aliexpress.com",
+    "amazon": "amazon.com",
+    "waveshare": "waveshare.com",
+    "robotshop": "robotshop.com",
+}
+
+# Price search results per query, shared by the requests a worker serves
+_search_results = TTLCache(ttl=300, maxsize=512)
+
+# Product pages fetched at once per price refresh
+REFRESH_CONCURRENCY = 10
+
+
+@lru_cache(maxsize=4096)
+def _to_decimal(amount: str) -> Decimal:
+    """Decimal for a matched price; the same prices recur across search results."""
+    return Decimal(amount)
+
 
 class PricingService:
     """Service for price fetching and comparison."""
@@ -27,24 +71,40 @@ class PricingService:
         include_shipping: bool = True,
     ) -> list[PricingSearchResult]:
         """Search for real-time prices using web search APIs."""
-        results = []
-
         # Build search query
         query = f"{component_name} buy price"
         if vendor_preference:
             query += f" site:{self._get_vendor_domain(vendor_preference)}"
 
-        # Try Tavily first
-        if self.tavily_api_key:
-            tavily_results = await self._search_tavily(query)
-            results.extend(tavily_results)
+        # Repeat lookups of the same component (the builder UI re-queries) are served
+        # from memory; empty results are not cached so a failed search is retried
+        cached = _search_results.get(query)
+        if cached is None:
+            cached = await self._search(query)
+            if cached:
+                _search_results.set(query, cached)
+        return list(cached)
 
-        # Fall back to SerpAPI if available and needed
-        if not results and self.serpapi_key:
-            serp_results = await self._search_serpapi(query)
-            results.extend(serp_results)
+    async def _search(self, query: str) -> list[PricingSearchResult]:
+        """Query the search APIs, preferring Tavily over SerpAPI."""
+        # Start the SerpAPI fallback alongside Tavily, so an empty Tavily answer does
+        # not add a second round-trip; it is cancelled if Tavily has results
+        serp_task = (
+            asyncio.create_task(self._search_serpapi(query)) if self.serpapi_key else None
+        )
+
+        try:
+            # Try Tavily first
+            if self.tavily_api_key:
+                results = await self._search_tavily(query)
+                if results:
+                    return results
 
-        return results
+            # Fall back to SerpAPI if available
+            return await serp_task if serp_task else []
+        finally:
+            if serp_task and not serp_task.done():
+                serp_task.cancel()
 
     async def refresh_prices(
         self,
@@ -52,24 +112,47 @@ class PricingService:
         db: AsyncSession,
     ) -> list[dict[str, Any]]:
         """Refresh prices for a component from all vendors."""
-        # Get existing prices for component
-        query = select(ComponentPrice).where(ComponentPrice.component_id == component_id)
-        result = await db.execute(query)
-        existing_prices = result.scalars().all()
+        # Get existing prices for component; only rows with a product URL can be refreshed
+        result = await db.execute(
+            select(
+                ComponentPrice.id,
+                ComponentPrice.vendor_id,
+                ComponentPrice.price,
+                ComponentPrice.product_url,
+            ).where(
+                ComponentPrice.component_id == component_id,
+                ComponentPrice.product_url.is_not(None),
+            )
+        )
+        existing_prices = result.all()
+
+        # Try to fetch updated prices from the product URLs, a bounded number at a time;
+        # each vendor page is independent I/O
+        fetch_slots = asyncio.Semaphore(REFRESH_CONCURRENCY)
+
+        async def fetch(url: str) -> Decimal | None:
+            async with fetch_slots:
+                return await self._fetch_price_from_url(url)
+
+        new_prices = await asyncio.gather(
+            *(fetch(price.product_url) for price in existing_prices)
+        )
 
         updated = []
-        for price in existing_prices:
-            if price.product_url:
-                # Try to fetch updated price from URL
-                new_price = await self._fetch_price_from_url(price.product_url)
-                if new_price:
-                    price.price = new_price
-                    price.price_fetched_at = datetime.utcnow()
-                    updated.append({
-                        "vendor_id": price.vendor_id,
-                        "old_price": float(price.price),
-                        "new_price": float(new_price),
-                    })
+        rows = []
+        fetched_at = datetime.now(timezone.utc)
+        for price, new_price in zip(existing_prices, new_prices):
+            if new_price:
+                updated.append({
+                    "vendor_id": price.vendor_id,
+                    "old_price": float(price.price),
+                    "new_price": float(new_price),
+                })
+                rows.append({"id": price.id, "price": new_price, "price_fetched_at": fetched_at})
+
+        # ORM bulk UPDATE by primary key: one executemany instead of per-object flushes
+        if rows:
+            await db.execute(update(ComponentPrice), rows)
 
         await db.commit()
         return updated
@@ -80,43 +163,42 @@ class PricingService:
             return []
 
         try:
-            async with httpx.AsyncClient() as client:
-                response = await client.post(
-                    "https://api.tavily.com/search",
-                    json={
-                        "api_key": self.tavily_api_key,
-                        "query": query,
-                        "search_depth": "basic",
-                        "include_domains": [
-                            "aliexpress.com",
-                            "amazon.com",
-                            "waveshare.com",
-                            "robotshop.com",
-                        ],
-                        "max_results": 5,
-                    },
-                    timeout=30.0,
-                )
-                response.raise_for_status()
-                data = response.json()
-
-                results = []
-                for item in data.get("results", []):
-                    price = self._extract_price(item.get("content", ""))
-                    if price:
-                        results.append(
-                            PricingSearchResult(
-                                source="tavily",
-                                title=item.get("title", "Unknown"),
-                                price=price,
-                                currency="USD",
-                                url=item.get("url", ""),
-                                seller=self._extract_seller(item.get("url", "")),
-                                shipping=None,
-                                fetched_at=datetime.utcnow(),
-                            )
+            response = await get_http_client().post(
+                "https://api.tavily.com/search",
+                json={
+                    "api_key": self.tavily_api_key,
+                    "query": query,
+                    "search_depth": "basic",
+                    "include_domains": [
+                        "aliexpress.com",
+                        "amazon.com",
+                        "waveshare.com",
+                        "robotshop.com",
+                    ],
+                    "max_results": 5,
+                },
+                timeout=30.0,
+            )
+            response.raise_for_status()
+            data = orjson.loads(response.content)
+
+            results = []
+            for item in data.get("results", []):
+                price = self._extract_price(item.get("content", ""))
+                if price:
+                    results.append(
+                        PricingSearchResult(
+                            source="tavily",
+                            title=item.get("title", "Unknown"),
+                            price=price,
+                            currency="USD",
+                            url=item.get("url", ""),
+                            seller=self._extract_seller(item.get("url", "")),
+                            shipping=None,
+                            fetched_at=datetime.now(timezone.utc),
                         )
-                return results
+                    )
+            return results
 
         except Exception:
             return []
@@ -127,38 +209,37 @@ class PricingService:
             return []
 
         try:
-            async with httpx.AsyncClient() as client:
-                response = await client.get(
-                    "https://serpapi.com/search",
-                    params={
-                        "api_key": self.serpapi_key,
-                        "engine": "google_shopping",
-                        "q": query,
-                        "num": 5,
-                    },
-                    timeout=30.0,
-                )
-                response.raise_for_status()
-                data = response.json()
-
-                results = []
-                for item in data.get("shopping_results", []):
-                    price_str = item.get("price", "")
-                    price = self._parse_price_string(price_str)
-                    if price:
-                        results.append(
-                            PricingSearchResult(
-                                source="serpapi",
-                                title=item.get("title", "Unknown"),
-                                price=price,
-                                currency="USD",
-                                url=item.get("link", ""),
-                                seller=item.get("source", None),
-                                shipping=item.get("delivery", None),
-                                fetched_at=datetime.utcnow(),
-                            )
+            response = await get_http_client().get(
+                "https://serpapi.com/search",
+                params={
+                    "api_key": self.serpapi_key,
+                    "engine": "google_shopping",
+                    "q": query,
+                    "num": 5,
+                },
+                timeout=30.0,
+            )
+            response.raise_for_status()
+            data = orjson.loads(response.content)
+
+            results = []
+            for item in data.get("shopping_results", []):
+                price_str = item.get("price", "")
+                price = self._parse_price_string(price_str)
+                if price:
+                    results.append(
+                        PricingSearchResult(
+                            source="serpapi",
+                            title=item.get("title", "Unknown"),
+                            price=price,
+                            currency="USD",
+                            url=item.get("link", ""),
+                            seller=item.get("source", None),
+                            shipping=item.get("delivery", None),
+                            fetched_at=datetime.now(timezone.utc),
                         )
-                return results
+                    )
+            return results
 
         except Exception:
             return []
@@ -171,55 +252,24 @@ class PricingService:
 
     def _extract_price(self, text: str) -> Decimal | None:
         """Extract price from text content."""
-        import re
-
-        # Match common price patterns
-        patterns = [
-            r"\$(\d+(?:\.\d{2})?)",
-            r"USD\s*(\d+(?:\.\d{2})?)",
-            r"(\d+(?:\.\d{2})?)\s*(?:USD|dollars?)",
-        ]
-
-        for pattern in patterns:
-            match = re.search(pattern, text, re.IGNORECASE)
-            if match:
-                try:
-                    return Decimal(match.group(1))
-                except (ValueError, decimal.InvalidOperation):
-                    continue
-
-        return None
+        match = _PRICE_RE.search(text)
+        if not match:
+            return None
+        # The groups only match digits with an optional two-place fraction
+        return _to_decimal(match["dollar"] or match["usd"] or match["plain"])
 
     def _parse_price_string(self, price_str: str) -> Decimal | None:
         """Parse a price string like '$19.99'."""
-        import re
-
-        match = re.search(r"[\$]?([\d,]+(?:\.\d{2})?)", price_str.replace(",", ""))
-        if match:
-            try:
-                return Decimal(match.group(1))
-            except Exception:
-                pass
-        return None
+        match = _PRICE_STRING_RE.search(price_str)
+        if not match:
+            return None
+        return _to_decimal(match.group(1).replace(",", ""))
 
     def _extract_seller(self, url: str) -> str | None:
         """Extract seller/vendor from URL."""
-        if "aliexpress" in url.lower():
-            return "AliExpress"
-        elif "amazon" in url.lower():
-            return "Amazon"
-        elif "waveshare" in url.lower():
-            return "Waveshare"
-        elif "robotshop" in url.lower():
-            return "RobotShop"
-        return None
+        url = url.lower()
+        return next((name for key, name in _SELLER_SIGNS if key in url), None)
 
     def _get_vendor_domain(self, vendor: str) -> str:
         """Get domain for vendor filtering."""
-        domains = {
-            "aliexpress": "aliexpress.com",
-            "amazon": "amazon.com",
-            "waveshare": "waveshare.com",
-            "robotshop": "robotshop.com",
-        }
-        return domains.get(vendor.lower(), "")
+        return _VENDOR_DOMAINS.get(vendor.lower(), "")
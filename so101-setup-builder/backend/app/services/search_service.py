@@ -1,11 +1,17 @@
 from typing import Any
 
 import httpx
+import orjson
 
+from app.cache import TTLCache
 from app.config import get_settings
+from app.services.http_client import get_http_client
 
 settings = get_settings()
 
+# Component info search results per query; specs and reviews change slowly
+_component_info = TTLCache(ttl=300, maxsize=512)
+
 
 class SearchService:
     """Service for web search functionality."""
@@ -29,26 +35,25 @@ class SearchService:
             }
 
         try:
-            async with httpx.AsyncClient() as client:
-                payload = {
-                    "api_key": self.tavily_api_key,
-                    "query": query,
-                    "search_depth": search_depth,
-                    "max_results": max_results,
-                }
-
-                if include_domains:
-                    payload["include_domains"] = include_domains
-                if exclude_domains:
-                    payload["exclude_domains"] = exclude_domains
-
-                response = await client.post(
-                    "https://api.tavily.com/search",
-                    json=payload,
-                    timeout=30.0,
-                )
-                response.raise_for_status()
-                return response.json()
+            payload = {
+                "api_key": self.tavily_api_key,
+                "query": query,
+                "search_depth": search_depth,
+                "max_results": max_results,
+            }
+
+            if include_domains:
+                payload["include_domains"] = include_domains
+            if exclude_domains:
+                payload["exclude_domains"] = exclude_domains
+
+            response = await get_http_client().post(
+                "https://api.tavily.com/search",
+                json=payload,
+                timeout=30.0,
+            )
+            response.raise_for_status()
+            return orjson.loads(response.content)
 
         except httpx.HTTPError as e:
             return {
@@ -76,11 +81,17 @@ class SearchService:
 
         query = queries.get(info_type, f"{component_name} {info_type}")
 
-        return await self.search(
-            query=query,
-            search_depth="advanced",
-            max_results=5,
-        )
+        # Failed searches come back with an "error" key and are not cached
+        cached = _component_info.get(query)
+        if cached is None:
+            cached = await self.search(
+                query=query,
+                search_depth="advanced",
+                max_results=5,
+            )
+            if "error" not in cached:
+                _component_info.set(query, cached)
+        return cached
 
     async def search_lerobot_docs(
         self,
@@ -0,0 +1,80 @@
+import pytest
+from redis.exceptions import ConnectionError as RedisConnectionError
+
+
+class FakeRedis:
+    """In-memory stand-in for the few ``redis.asyncio.Redis`` commands the app uses.
+
+    Values are kept as ``decode_responses=True`` returns them; expiry is recorded but
+    never enforced.
+    """
+
+    def __init__(self):
+        self.data: dict[str, str] = {}
+        self.ttls: dict[str, int] = {}
+
+    async def get(self, key):
+        return self.data.get(key)
+
+    async def set(self, key, value, ex=None):
+        self.data[key] = value
+        if ex is not None:
+            self.ttls[key] = ex
+        return True
+
+    async def setex(self, key, ttl, value):
+        return await self.set(key, value, ex=ttl)
+
+    async def delete(self, *keys):
+        return sum(self.data.pop(key, None) is not None for key in keys)
+
+    async def incr(self, key):
+        value = int(self.data.get(key, 0)) + 1
+        self.data[key] = str(value)
+        return value
+
+    async def hset(self, key, mapping):
+        self.data.setdefault(key, {}).update(mapping)
+        return len(mapping)
+
+    async def hmget(self, key, fields):
+        hash_ = self.data.get(key, {})
+        return [hash_.get(field) for field in fields]
+
+    async def expire(self, key, ttl):
+        self.ttls[key] = ttl
+        return key in self.data
+
+
+class UnreachableRedis:
+    """Redis client whose every command fails as if the server were down."""
+
+    def __getattr__(self, name):
+        async def command(*args, **kwargs):
+            raise RedisConnectionError("Redis is unreachable")
+
+        return command
+
+
+def _patch_get_redis(monkeypatch, client) -> None:
+    # Modules bind get_redis at import, so patch each reference
+    from app import cache
+    from app.api.v1.endpoints import export, wizard
+    from app.llm import cache as llm_cache
+
+    for module in (cache, export, llm_cache, wizard):
+        monkeypatch.setattr(module, "get_redis", lambda decode_responses=True: client)
+
+
+@pytest.fixture
+def fake_redis(monkeypatch) -> FakeRedis:
+    client = FakeRedis()
+    _patch_get_redis(monkeypatch, client)
+    return client
+
+
+@pytest.fixture
+def unreachable_redis(monkeypatch) -> UnreachableRedis:
+    client = UnreachableRedis()
+    _patch_get_redis(monkeypatch, client)
+    return client
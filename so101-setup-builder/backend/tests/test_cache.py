@@ -0,0 +1,163 @@
+import pytest
+
+from app import cache as cache_module
+from app.cache import RedisResponseCache, TTLCache
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+@pytest.fixture
+def clock(monkeypatch) -> FakeClock:
+    clock = FakeClock()
+    monkeypatch.setattr(cache_module.time, "monotonic", clock)
+    return clock
+
+
+def test_ttl_cache_get_set(clock):
+    cache = TTLCache(ttl=60)
+
+    assert cache.get("a") is None
+    assert cache.get("a", default="missing") == "missing"
+
+    cache.set("a", 1)
+    assert cache.get("a") == 1
+
+
+def test_ttl_cache_default_key(clock):
+    cache = TTLCache(ttl=60)
+
+    cache.set(None, ["payload"])
+
+    assert cache.get() == ["payload"]
+
+
+def test_ttl_cache_expiry(clock):
+    cache = TTLCache(ttl=60)
+    cache.set("a", 1)
+
+    clock.now += 59.9
+    assert cache.get("a") == 1
+
+    clock.now += 0.1
+    assert cache.get("a") is None
+    assert "a" not in cache._data
+
+
+def test_ttl_cache_set_refreshes_expiry(clock):
+    cache = TTLCache(ttl=60)
+    cache.set("a", 1)
+
+    clock.now += 30
+    cache.set("a", 2)
+    clock.now += 45
+
+    assert cache.get("a") == 2
+
+
+def test_ttl_cache_evicts_oldest(clock):
+    cache = TTLCache(ttl=60, maxsize=2)
+    cache.set("a", 1)
+    cache.set("b", 2)
+
+    # Overwriting an existing key does not evict
+    cache.set("a", 3)
+    assert cache.get("b") == 2
+
+    cache.set("c", 4)
+    assert cache.get("a") is None
+    assert cache.get("b") == 2
+    assert cache.get("c") == 4
+
+
+def test_ttl_cache_invalidate_and_clear(clock):
+    cache = TTLCache(ttl=60)
+    cache.set("a", 1)
+    cache.set("b", 2)
+
+    cache.invalidate("a")
+    cache.invalidate("missing")
+    assert cache.get("a") is None
+    assert cache.get("b") == 2
+
+    cache.clear()
+    assert cache.get("b") is None
+
+
+async def test_response_cache_round_trip(fake_redis):
+    cache = RedisResponseCache("test", ttl=30)
+
+    generation = await cache.generation()
+    assert generation == "0"
+    assert await cache.get(generation, "key") is None
+
+    await cache.set(generation, "key", '{"a": 1}')
+
+    assert await cache.get(generation, "key") == '{"a": 1}'
+    assert fake_redis.ttls["test:v0:key"] == 30
+
+
+async def test_response_cache_invalidate_all_bumps_generation(fake_redis):
+    cache = RedisResponseCache("test", ttl=30)
+    old = await cache.generation()
+    await cache.set(old, "key", "stale")
+
+    await cache.invalidate_all()
+
+    new = await cache.generation()
+    assert new != old
+    assert await cache.get(new, "key") is None
+    # Old entries are left to expire rather than deleted
+    assert fake_redis.data["test:v0:key"] == "stale"
+
+
+async def test_response_cache_set_under_read_generation(fake_redis):
+    cache = RedisResponseCache("test", ttl=30)
+
+    # A response built before an invalidation is stored under the generation it read...
+    generation = await cache.generation()
+    await cache.invalidate_all()
+    await cache.set(generation, "key", "stale")
+
+    # ...so it is never served from the new one
+    assert await cache.get(await cache.generation(), "key") is None
+
+
+async def test_response_cache_invalidate_one(fake_redis):
+    cache = RedisResponseCache("test", ttl=30)
+    generation = await cache.generation()
+    await cache.set(generation, "a", "1")
+    await cache.set(generation, "b", "2")
+
+    await cache.invalidate("a")
+
+    assert await cache.get(generation, "a") is None
+    assert await cache.get(generation, "b") == "2"
+
+
+async def test_response_cache_namespaces_are_independent(fake_redis):
+    first = RedisResponseCache("first", ttl=30)
+    second = RedisResponseCache("second", ttl=30)
+    await second.set(await second.generation(), "key", "kept")
+
+    await first.invalidate_all()
+
+    assert await second.get(await second.generation(), "key") == "kept"
+
+
+async def test_response_cache_redis_errors_are_misses(unreachable_redis):
+    cache = RedisResponseCache("test", ttl=30)
+
+    generation = await cache.generation()
+    assert generation is None
+    assert await cache.get(generation, "key") is None
+
+    # None of these raise
+    await cache.set(generation, "key", "value")
+    await cache.invalidate("key")
+    await cache.invalidate_all()
@@ -0,0 +1,89 @@
+import sqlite3
+
+import pytest
+from sqlalchemy import create_engine, func, literal, select
+
+from app.api.v1.endpoints.docs import head_excerpt, query_excerpt
+from app.db.models.documentation import make_excerpt
+
+
+def extract_excerpt(content: str, query: str, context_chars: int = 100) -> str:
+    """The Python excerpt builder the SQL expressions replaced, kept as the reference."""
+    lower_content = content.lower()
+    lower_query = query.lower()
+
+    pos = lower_content.find(lower_query)
+    if pos == -1:
+        return content[:200] + "..." if len(content) > 200 else content
+
+    start = max(0, pos - context_chars)
+    end = min(len(content), pos + len(query) + context_chars)
+
+    excerpt = content[start:end]
+    if start > 0:
+        excerpt = "..." + excerpt
+    if end < len(content):
+        excerpt = excerpt + "..."
+
+    return excerpt
+
+
+def _strpos(string: str, substring: str) -> int:
+    return string.find(substring) + 1
+
+
+def _connect() -> sqlite3.Connection:
+    # SQLite stand-ins for the Postgres functions the expressions use
+    conn = sqlite3.connect(":memory:")
+    conn.create_function("greatest", -1, max, deterministic=True)
+    conn.create_function("least", -1, min, deterministic=True)
+    conn.create_function("concat", -1, lambda *args: "".join(args), deterministic=True)
+    conn.create_function("strpos", 2, _strpos, deterministic=True)
+    conn.create_function("lower", 1, str.lower, deterministic=True)
+    return conn
+
+
+@pytest.fixture(scope="module")
+def engine():
+    return create_engine("sqlite://", creator=_connect)
+
+
+def _sql_excerpt(engine, content: str, query: str) -> str:
+    # Same column expressions as _search_documentation
+    content_col = literal(content)
+    pos = func.strpos(func.lower(content_col), func.lower(literal(query)))
+    excerpt = query_excerpt(content_col, pos, func.length(content_col), len(query))
+    with engine.connect() as conn:
+        return conn.execute(select(excerpt)).scalar_one()
+
+
+LONG = "servo " * 60 + "The calibration step needs the Feetech bus adapter. " + "arm " * 80
+
+CASES = [
+    ("short text", "missing"),
+    ("short text", "short"),
+    ("short text", "TEXT"),
+    ("x" * 200, "missing"),
+    ("x" * 201, "missing"),
+    (LONG, "Feetech"),
+    (LONG, "feetech bus"),
+    (LONG, "servo"),
+    (LONG, "arm arm"),
+    (LONG, "nowhere"),
+    ("a" * 100 + "needle" + "b" * 100, "needle"),
+    ("a" * 101 + "needle" + "b" * 101, "needle"),
+]
+
+
+@pytest.mark.parametrize(("content", "query"), CASES)
+def test_query_excerpt_matches_python(engine, content, query):
+    assert _sql_excerpt(engine, content, query) == extract_excerpt(content, query)
+
+
+@pytest.mark.parametrize("content", ["", "short text", "x" * 200, "x" * 201, LONG])
+def test_head_excerpt_matches_python(engine, content):
+    with engine.connect() as conn:
+        sql = conn.execute(select(head_excerpt(literal(content)))).scalar_one()
+
+    assert sql == extract_excerpt(content, "\0")
+    assert make_excerpt(content) == sql
@@ -0,0 +1,35 @@
+from app.api.v1.endpoints.export import get_pdf_export_status
+from app.api.v1.schemas.export import ExportJobStatus
+from app.main import app
+
+# The frontend axios instance's baseURL, which job URLs are requested against
+CLIENT_BASE_PATH = "/api/v1"
+
+
+def _route_path(url: str) -> str:
+    """Path the frontend requests for a job URL, resolved against its base URL."""
+    return CLIENT_BASE_PATH + url
+
+
+async def test_job_urls_resolve_against_client_base(fake_redis):
+    fake_redis.data["export:pdf:abc"] = {"status": b"done"}
+
+    job = await get_pdf_export_status("abc")
+
+    assert job.status == ExportJobStatus.DONE
+    assert _route_path(job.poll_url) == app.url_path_for(
+        "get_pdf_export_status", job_id="abc"
+    )
+    assert _route_path(job.download_url) == app.url_path_for(
+        "download_pdf_export", job_id="abc"
+    )
+
+
+async def test_pending_job_has_no_download_url(fake_redis):
+    fake_redis.data["export:pdf:abc"] = {"status": b"pending"}
+
+    job = await get_pdf_export_status("abc")
+
+    assert job.status == ExportJobStatus.PENDING
+    assert job.download_url is None
+    assert _route_path(job.poll_url) == "/api/v1/export/pdf/status/abc"
@@ -0,0 +1,35 @@
+import time
+import uuid
+
+from app.db.ids import uuid7
+
+
+def test_uuid7_version_and_variant():
+    value = uuid7()
+
+    assert isinstance(value, uuid.UUID)
+    assert value.version == 7
+    assert value.variant == uuid.RFC_4122
+
+
+def test_uuid7_embeds_unix_time_ms():
+    before = time.time_ns() // 1_000_000
+    value = uuid7()
+    after = time.time_ns() // 1_000_000
+
+    assert before <= value.int >> 80 <= after
+
+
+def test_uuid7_ordered_across_milliseconds():
+    first = uuid7()
+    time.sleep(0.002)
+    second = uuid7()
+
+    assert first < second
+    assert str(first) < str(second)
+
+
+def test_uuid7_unique():
+    values = {uuid7() for _ in range(10_000)}
+
+    assert len(values) == 10_000
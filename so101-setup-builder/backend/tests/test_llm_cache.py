@@ -0,0 +1,142 @@
+import asyncio
+
+import pytest
+
+from app.llm.cache import LLMResponseCache
+
+
+class Compute:
+    """``compute`` callback that counts calls and blocks until released."""
+
+    def __init__(self, value: str | None = "result"):
+        self.value = value
+        self.calls = 0
+        self.started = asyncio.Event()
+        self.release = asyncio.Event()
+
+    async def __call__(self) -> str | None:
+        self.calls += 1
+        self.started.set()
+        await self.release.wait()
+        return self.value
+
+
+async def test_miss_computes_and_stores(fake_redis):
+    cache = LLMResponseCache(ttl=3600)
+    compute = Compute()
+    compute.release.set()
+
+    assert await cache.get_or_set("key", compute) == "result"
+
+    assert compute.calls == 1
+    assert fake_redis.data["key"] == "result"
+    assert fake_redis.ttls["key"] == 3600
+
+
+async def test_hit_skips_compute(fake_redis):
+    cache = LLMResponseCache(ttl=3600)
+    fake_redis.data["key"] = "cached"
+    compute = Compute()
+
+    assert await cache.get_or_set("key", compute) == "cached"
+    assert compute.calls == 0
+
+
+async def test_none_is_returned_but_not_stored(fake_redis):
+    cache = LLMResponseCache(ttl=3600)
+    compute = Compute(value=None)
+    compute.release.set()
+
+    assert await cache.get_or_set("key", compute) is None
+    assert "key" not in fake_redis.data
+
+
+async def test_concurrent_misses_share_one_call(fake_redis):
+    cache = LLMResponseCache(ttl=3600)
+    compute = Compute()
+
+    tasks = [asyncio.create_task(cache.get_or_set("key", compute)) for _ in range(5)]
+    await compute.started.wait()
+    compute.release.set()
+
+    assert await asyncio.gather(*tasks) == ["result"] * 5
+    assert compute.calls == 1
+    assert cache._inflight == {}
+
+
+async def test_different_keys_are_not_coalesced(fake_redis):
+    cache = LLMResponseCache(ttl=3600)
+    compute = Compute()
+    compute.release.set()
+
+    await asyncio.gather(
+        cache.get_or_set("a", compute),
+        cache.get_or_set("b", compute),
+    )
+
+    assert compute.calls == 2
+
+
+async def test_error_reaches_every_waiter(fake_redis):
+    cache = LLMResponseCache(ttl=3600)
+    release = asyncio.Event()
+
+    async def failing() -> str:
+        await release.wait()
+        raise RuntimeError("Gemini API error")
+
+    tasks = [asyncio.create_task(cache.get_or_set("key", failing)) for _ in range(3)]
+    await asyncio.sleep(0)
+    release.set()
+
+    results = await asyncio.gather(*tasks, return_exceptions=True)
+    assert all(isinstance(r, RuntimeError) for r in results)
+    assert cache._inflight == {}
+    assert "key" not in fake_redis.data
+
+
+async def test_cancelled_owner_hands_over_to_waiter(fake_redis):
+    cache = LLMResponseCache(ttl=3600)
+    owner_compute = Compute(value="owner")
+    waiter_compute = Compute(value="waiter")
+    waiter_compute.release.set()
+
+    owner = asyncio.create_task(cache.get_or_set("key", owner_compute))
+    await owner_compute.started.wait()
+    waiter = asyncio.create_task(cache.get_or_set("key", waiter_compute))
+    await asyncio.sleep(0)
+
+    owner.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await owner
+
+    # The waiter was not cancelled with the owner; it computes the value itself
+    assert await waiter == "waiter"
+    assert waiter_compute.calls == 1
+    assert fake_redis.data["key"] == "waiter"
+
+
+async def test_cancelled_waiter_leaves_owner_running(fake_redis):
+    cache = LLMResponseCache(ttl=3600)
+    compute = Compute()
+
+    owner = asyncio.create_task(cache.get_or_set("key", compute))
+    await compute.started.wait()
+    waiter = asyncio.create_task(cache.get_or_set("key", compute))
+    await asyncio.sleep(0)
+
+    waiter.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await waiter
+
+    compute.release.set()
+    assert await owner == "result"
+    assert compute.calls == 1
+
+
+async def test_unreachable_redis_still_computes(unreachable_redis):
+    cache = LLMResponseCache(ttl=3600)
+    compute = Compute()
+    compute.release.set()
+
+    assert await cache.get_or_set("key", compute) == "result"
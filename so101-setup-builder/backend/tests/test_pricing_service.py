@@ -0,0 +1,113 @@
+import re
+from datetime import timedelta
+from decimal import Decimal
+
+import httpx
+import orjson
+import pytest
+
+from app.services import pricing_service
+from app.services.pricing_service import PricingService
+
+
+def extract_price(text: str) -> Decimal | None:
+    """The pattern-by-pattern matcher the single alternation replaced."""
+    patterns = [
+        r"\$(\d+(?:\.\d{2})?)",
+        r"USD\s*(\d+(?:\.\d{2})?)",
+        r"(\d+(?:\.\d{2})?)\s*(?:USD|dollars?)",
+    ]
+    for pattern in patterns:
+        match = re.search(pattern, text, re.IGNORECASE)
+        if match:
+            return Decimal(match.group(1))
+    return None
+
+
+@pytest.fixture(scope="module")
+def service() -> PricingService:
+    return PricingService()
+
+
+@pytest.mark.parametrize(
+    "text",
+    [
+        "Only $19.99 today",
+        "$5",
+        "Price: USD 42.50",
+        "usd12",
+        "Costs 13.45 USD shipped",
+        "about 30 dollars",
+        "1 dollar",
+        "no price here",
+        "$19.9 rounded",
+        "",
+    ],
+)
+def test_extract_price_matches_pattern_list(service, text):
+    assert service._extract_price(text) == extract_price(text)
+
+
+@pytest.mark.parametrize(
+    ("text", "expected"),
+    [
+        ("Only $19.99 today", Decimal("19.99")),
+        ("Price: USD 42.50", Decimal("42.50")),
+        ("about 30 dollars", Decimal("30")),
+        ("no price here", None),
+    ],
+)
+def test_extract_price(service, text, expected):
+    assert service._extract_price(text) == expected
+
+
+@pytest.mark.parametrize(
+    ("text", "expected"),
+    [
+        ("$19.99", Decimal("19.99")),
+        ("19.99", Decimal("19.99")),
+        ("$1,299.00", Decimal("1299.00")),
+        ("$12,345,678", Decimal("12345678")),
+        ("From $7 each", Decimal("7")),
+        ("$0.50", Decimal("0.50")),
+        ("free", None),
+        ("", None),
+    ],
+)
+def test_parse_price_string(service, text, expected):
+    assert service._parse_price_string(text) == expected
+
+
+def test_parse_price_string_ignores_separator_only(service):
+    # A lone comma is not a number
+    assert service._parse_price_string("$, call for price") is None
+
+
+SEARCH_RESPONSES = {
+    "api.tavily.com": {
+        "results": [{"title": "STS3215", "content": "Only $19.99", "url": "https://amazon.com/x"}]
+    },
+    "serpapi.com": {
+        "shopping_results": [{"title": "STS3215", "price": "$18.50", "link": "https://a.com"}]
+    },
+}
+
+
+@pytest.fixture
+def search_apis(monkeypatch):
+    def handler(request: httpx.Request) -> httpx.Response:
+        return httpx.Response(200, content=orjson.dumps(SEARCH_RESPONSES[request.url.host]))
+
+    client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+    monkeypatch.setattr(pricing_service, "get_http_client", lambda: client)
+
+
+@pytest.mark.parametrize("search", ["_search_tavily", "_search_serpapi"])
+async def test_search_results_are_stamped_in_utc(search_apis, search):
+    service = PricingService()
+    service.tavily_api_key = service.serpapi_key = "key"
+
+    (result,) = await getattr(service, search)("STS3215")
+
+    # Comparable with the timestamptz price_fetched_at written by refresh_prices
+    assert result.fetched_at.utcoffset() == timedelta(0)
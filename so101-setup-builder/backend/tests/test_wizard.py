@@ -0,0 +1,130 @@
+import uuid
+from datetime import datetime
+
+import orjson
+from starlette.requests import Request
+
+from app.api.v1.endpoints.wizard import (
+    WizardStep,
+    get_wizard_summary,
+    update_wizard_step,
+)
+from app.api.v1.schemas.wizard import WizardStepUpdate
+from app.db.models import Setup
+
+
+class FakeResult:
+    def __init__(self, row):
+        self.row = row
+
+    def scalar_one_or_none(self):
+        return self.row
+
+
+class FakeSession:
+    """Just enough of ``AsyncSession`` for the wizard step and summary endpoints.
+
+    The UPDATE ... RETURNING in ``update_wizard_step`` is applied by merging the bound
+    profile into the stored one and advancing the step by one.
+    """
+
+    def __init__(self, setup: Setup):
+        self.setup = setup
+        self.gets = 0
+        self.updates: list[dict] = []
+
+    async def get(self, model, ident):
+        self.gets += 1
+        return self.setup if ident == self.setup.id else None
+
+    async def execute(self, statement):
+        params = statement.compile().params
+        # The step data is the last JSONB literal, merged with ||
+        step_data = [value for value in params.values() if isinstance(value, dict)][-1]
+        self.updates.append(params)
+        self.setup = _setup(
+            self.setup.id,
+            {**self.setup.wizard_profile, **step_data},
+            self.setup.current_step + 1,
+        )
+        if "arm_type" in params:
+            self.setup.arm_type = params["arm_type"]
+        return FakeResult(self.setup)
+
+    async def commit(self):
+        pass
+
+
+def _setup(setup_id: uuid.UUID, profile: dict, current_step: int) -> Setup:
+    now = datetime(2026, 10, 15, 12, 0)
+    return Setup(
+        id=setup_id,
+        wizard_profile=profile,
+        current_step=current_step,
+        wizard_completed=False,
+        created_at=now,
+        updated_at=now,
+    )
+
+
+def _request() -> Request:
+    return Request({"type": "http", "method": "GET", "path": "/", "headers": []})
+
+
+async def test_summary_is_cached(fake_redis):
+    setup_id = uuid.uuid4()
+    db = FakeSession(_setup(setup_id, {}, 1))
+
+    first = await get_wizard_summary(_request(), setup_id, db)
+    second = await get_wizard_summary(_request(), setup_id, db)
+
+    assert db.gets == 1
+    assert first.body == second.body
+    assert fake_redis.data[f"wiz:sum:{setup_id}"] == first.body.decode()
+
+
+async def test_step_update_invalidates_summary(fake_redis):
+    setup_id = uuid.uuid4()
+    db = FakeSession(_setup(setup_id, {}, 1))
+    await get_wizard_summary(_request(), setup_id, db)
+    assert f"wiz:sum:{setup_id}" in fake_redis.data
+
+    await update_wizard_step(
+        setup_id,
+        WizardStepUpdate(step_data={"experience": "beginner"}),
+        WizardStep.EXPERIENCE,
+        db,
+    )
+    assert f"wiz:sum:{setup_id}" not in fake_redis.data
+
+    response = await get_wizard_summary(_request(), setup_id, db)
+    summary = orjson.loads(response.body)
+    assert db.gets == 2
+    assert summary["current_step"] == 2
+    assert summary["profile"]["experience"] == "beginner"
+
+
+async def test_step_update_stores_validated_values(fake_redis):
+    setup_id = uuid.uuid4()
+    db = FakeSession(_setup(setup_id, {"experience": "beginner"}, 2))
+
+    response = await update_wizard_step(
+        setup_id,
+        WizardStepUpdate(step_data={"budget": "500", "arm_type": "dual", "unknown": 1}),
+        WizardStep.BUDGET,
+        db,
+    )
+
+    # The coerced value is stored, not the raw string; unknown keys are dropped
+    (update,) = db.updates
+    assert update["arm_type"] == "dual"
+    assert db.setup.wizard_profile == {
+        "experience": "beginner",
+        "budget": 500,
+        "arm_type": "dual",
+    }
+
+    profile = orjson.loads(response.body)["profile"]
+    assert profile["budget"] == 500
+    assert profile["experience"] == "beginner"
+    assert profile["arm_type"] == "dual"
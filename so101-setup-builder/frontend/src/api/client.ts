@@ -63,8 +63,18 @@ export const comparisonApi = {
 
 // Export API
 export const exportApi = {
-  pdf: (setupId: string, options?: Record<string, unknown>) =>
-    api.post('/export/pdf', { setup_id: setupId, ...options }, { responseType: 'blob' }),
+  // PDFs render in the background: start a job, poll it, then download the file
+  pdf: async (setupId: string, options?: Record<string, unknown>) => {
+    let { data: job } = await api.post('/export/pdf', { setup_id: setupId, ...options })
+    while (job.status === 'pending') {
+      await new Promise((resolve) => setTimeout(resolve, 1000))
+      job = (await api.get(job.poll_url)).data
+    }
+    if (job.status !== 'done') {
+      throw new Error(job.error || 'PDF export failed')
+    }
+    return api.get(job.download_url, { responseType: 'blob' })
+  },
   json: (setupId: string, options?: Record<string, unknown>) =>
     api.post('/export/json', { setup_id: setupId, ...options }),
   shoppingList: (setupId: string) => api.post(`/export/shopping-list?setup_id=${setupId}`),
@@ -2,12 +2,13 @@
 """Seed the database with initial component and vendor data."""
 
 import asyncio
-import json
-from datetime import datetime
+import os
 from decimal import Decimal
 from pathlib import Path
 
+import orjson
 from sqlalchemy import select
+from sqlalchemy.dialects.postgresql import insert as pg_insert
 from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine, async_sessionmaker
 
 import sys
@@ -20,11 +21,37 @@ from app.db.models import Category, Component, Vendor, ComponentPrice
 settings = get_settings()
 
 
+async def existing_slugs(session: AsyncSession, model, slugs: list[str]) -> dict[str, int]:
+    """Map each of ``slugs`` already in ``model``'s table to its id, in one query."""
+    result = await session.execute(
+        select(model.slug, model.id).where(model.slug.in_(slugs))
+    )
+    return dict(result.all())
+
+
+async def insert_new(session: AsyncSession, model, rows: list[dict]) -> dict[str, int]:
+    """Insert ``rows`` with one multi-row INSERT and map the created slugs to their ids.
+
+    Rows that would violate a unique constraint (e.g. added by a concurrent run since
+    ``existing_slugs``) are skipped by Postgres instead of failing the seed.
+    """
+    if not rows:
+        return {}
+    result = await session.execute(
+        pg_insert(model)
+        .values(rows)
+        .on_conflict_do_nothing()
+        .returning(model.slug, model.id)
+    )
+    return dict(result.all())
+
+
 async def seed_database():
     """Main seeding function."""
     # Create engine
     database_url = settings.database_url.replace("postgresql://", "postgresql+asyncpg://")
-    engine = create_async_engine(database_url, echo=True)
+    # SQL logging formats every statement (large batched INSERTs included); opt in
+    engine = create_async_engine(database_url, echo=os.getenv("SQL_ECHO") == "1")
 
     async with engine.begin() as conn:
         await conn.run_sync(Base.metadata.create_all)
@@ -35,81 +62,70 @@ async def seed_database():
         # Load seed data
         data_dir = Path(__file__).parent.parent / "data" / "seed"
 
-        with open(data_dir / "components.json") as f:
-            components_data = json.load(f)
-
-        with open(data_dir / "vendors.json") as f:
-            vendors_data = json.load(f)
+        components_data = orjson.loads((data_dir / "components.json").read_bytes())
+        vendors_data = orjson.loads((data_dir / "vendors.json").read_bytes())
 
         # Seed categories
         print("Seeding categories...")
-        category_map = {}
+        # Check which already exist up front instead of one query per row
+        category_map = await existing_slugs(
+            session, Category, [c["slug"] for c in components_data["categories"]]
+        )
+        new_categories = []
         for cat_data in components_data["categories"]:
-            # Check if exists
-            result = await session.execute(
-                select(Category).where(Category.slug == cat_data["slug"])
-            )
-            existing = result.scalar_one_or_none()
-
-            if existing:
-                category_map[cat_data["slug"]] = existing.id
+            if cat_data["slug"] in category_map:
                 print(f"  Category '{cat_data['name']}' already exists")
             else:
-                category = Category(
-                    name=cat_data["name"],
-                    slug=cat_data["slug"],
-                    description=cat_data.get("description"),
-                    icon=cat_data.get("icon"),
-                    sort_order=cat_data.get("sort_order", 0),
-                    created_at=datetime.utcnow(),
-                    updated_at=datetime.utcnow(),
-                )
-                session.add(category)
-                await session.flush()
-                category_map[cat_data["slug"]] = category.id
+                new_categories.append({
+                    "name": cat_data["name"],
+                    "slug": cat_data["slug"],
+                    "description": cat_data.get("description"),
+                    "icon": cat_data.get("icon"),
+                    "sort_order": cat_data.get("sort_order", 0),
+                })
+
+        # One INSERT ... RETURNING per entity type gives the ids of all new rows
+        created = await insert_new(session, Category, new_categories)
+        category_map.update(created)
+        for cat_data in new_categories:
+            if cat_data["slug"] in created:
                 print(f"  Created category: {cat_data['name']}")
 
         # Seed vendors
         print("\nSeeding vendors...")
-        vendor_map = {}
+        vendor_map = await existing_slugs(
+            session, Vendor, [v["slug"] for v in vendors_data["vendors"]]
+        )
+        new_vendors = []
         for vendor_data in vendors_data["vendors"]:
-            result = await session.execute(
-                select(Vendor).where(Vendor.slug == vendor_data["slug"])
-            )
-            existing = result.scalar_one_or_none()
-
-            if existing:
-                vendor_map[vendor_data["slug"]] = existing.id
+            if vendor_data["slug"] in vendor_map:
                 print(f"  Vendor '{vendor_data['name']}' already exists")
             else:
-                vendor = Vendor(
-                    name=vendor_data["name"],
-                    slug=vendor_data["slug"],
-                    website_url=vendor_data.get("website_url"),
-                    description=vendor_data.get("description"),
-                    is_active=vendor_data.get("is_active", True),
-                    ships_to_us=vendor_data.get("ships_to_us", True),
-                    ships_to_eu=vendor_data.get("ships_to_eu", True),
-                    typical_shipping_days=vendor_data.get("typical_shipping_days"),
-                    created_at=datetime.utcnow(),
-                    updated_at=datetime.utcnow(),
-                )
-                session.add(vendor)
-                await session.flush()
-                vendor_map[vendor_data["slug"]] = vendor.id
+                new_vendors.append({
+                    "name": vendor_data["name"],
+                    "slug": vendor_data["slug"],
+                    "website_url": vendor_data.get("website_url"),
+                    "description": vendor_data.get("description"),
+                    "is_active": vendor_data.get("is_active", True),
+                    "ships_to_us": vendor_data.get("ships_to_us", True),
+                    "ships_to_eu": vendor_data.get("ships_to_eu", True),
+                    "typical_shipping_days": vendor_data.get("typical_shipping_days"),
+                })
+
+        created = await insert_new(session, Vendor, new_vendors)
+        vendor_map.update(created)
+        for vendor_data in new_vendors:
+            if vendor_data["slug"] in created:
                 print(f"  Created vendor: {vendor_data['name']}")
 
         # Seed components
         print("\nSeeding components...")
-        component_map = {}
+        component_map = await existing_slugs(
+            session, Component, [c["slug"] for c in components_data["components"]]
+        )
+        new_components = []
         for comp_data in components_data["components"]:
-            result = await session.execute(
-                select(Component).where(Component.slug == comp_data["slug"])
-            )
-            existing = result.scalar_one_or_none()
-
-            if existing:
-                component_map[comp_data["slug"]] = existing.id
+            if comp_data["slug"] in component_map:
                 print(f"  Component '{comp_data['name']}' already exists")
             else:
                 category_id = category_map.get(comp_data["category_slug"])
@@ -117,25 +133,32 @@ async def seed_database():
                     print(f"  Warning: Category '{comp_data['category_slug']}' not found for component '{comp_data['name']}'")
                     continue
 
-                component = Component(
-                    name=comp_data["name"],
-                    slug=comp_data["slug"],
-                    category_id=category_id,
-                    description=comp_data.get("description"),
-                    specifications=comp_data.get("specifications", {}),
-                    is_default_for_so101=comp_data.get("is_default_for_so101", False),
-                    quantity_per_arm=comp_data.get("quantity_per_arm", 1),
-                    arm_type=comp_data.get("arm_type"),
-                    created_at=datetime.utcnow(),
-                    updated_at=datetime.utcnow(),
-                )
-                session.add(component)
-                await session.flush()
-                component_map[comp_data["slug"]] = component.id
+                new_components.append({
+                    "name": comp_data["name"],
+                    "slug": comp_data["slug"],
+                    "category_id": category_id,
+                    "description": comp_data.get("description"),
+                    "specifications": comp_data.get("specifications", {}),
+                    "is_default_for_so101": comp_data.get("is_default_for_so101", False),
+                    "quantity_per_arm": comp_data.get("quantity_per_arm", 1),
+                    "arm_type": comp_data.get("arm_type"),
+                })
+
+        created = await insert_new(session, Component, new_components)
+        component_map.update(created)
+        for comp_data in new_components:
+            if comp_data["slug"] in created:
                 print(f"  Created component: {comp_data['name']}")
 
         # Seed sample prices
         print("\nSeeding sample prices...")
+        result = await session.execute(
+            select(ComponentPrice.component_id, ComponentPrice.vendor_id).where(
+                ComponentPrice.component_id.in_(list(component_map.values()))
+            )
+        )
+        existing_prices = set(result.all())
+        new_prices = []
         for price_data in vendors_data.get("sample_prices", []):
             component_id = component_map.get(price_data["component_slug"])
             vendor_id = vendor_map.get(price_data["vendor_slug"])
@@ -144,32 +167,31 @@ async def seed_database():
                 print(f"  Skipping price for {price_data['component_slug']} @ {price_data['vendor_slug']}")
                 continue
 
-            # Check if price exists
-            result = await session.execute(
-                select(ComponentPrice).where(
-                    ComponentPrice.component_id == component_id,
-                    ComponentPrice.vendor_id == vendor_id,
-                )
-            )
-            existing = result.scalar_one_or_none()
-
-            if existing:
+            if (component_id, vendor_id) in existing_prices:
                 print(f"  Price already exists for {price_data['component_slug']} @ {price_data['vendor_slug']}")
             else:
-                price = ComponentPrice(
-                    component_id=component_id,
-                    vendor_id=vendor_id,
-                    price=Decimal(str(price_data["price"])),
-                    currency="USD",
-                    product_url=price_data.get("product_url"),
-                    in_stock=True,
-                    price_fetched_at=datetime.utcnow(),
-                    created_at=datetime.utcnow(),
-                    updated_at=datetime.utcnow(),
-                )
-                session.add(price)
+                new_prices.append({
+                    "component_id": component_id,
+                    "vendor_id": vendor_id,
+                    "price": Decimal(str(price_data["price"])),
+                    "currency": "USD",
+                    "product_url": price_data.get("product_url"),
+                    "in_stock": True,
+                })
                 print(f"  Created price: ${price_data['price']} for {price_data['component_slug']} @ {price_data['vendor_slug']}")
 
+        # Nothing reads the price ids back, so stream them in with binary COPY on the
+        # session's connection (same transaction); omitted columns get their defaults
+        if new_prices:
+            conn = await session.connection()
+            raw = await conn.get_raw_connection()
+            columns = list(new_prices[0])
+            await raw.driver_connection.copy_records_to_table(
+                ComponentPrice.__tablename__,
+                records=[tuple(row[c] for c in columns) for row in new_prices],
+                columns=columns,
+            )
+
         await session.commit()
         print("\nSeeding complete!")
 
@@ -2,6 +2,8 @@
 """Sync documentation from LeRobot repository."""
 
 import asyncio
+import hashlib
+import os
 import re
 from datetime import datetime
 from pathlib import Path
@@ -15,6 +17,7 @@ sys.path.insert(0, str(Path(__file__).parent.parent / "backend"))
 from app.config import get_settings
 from app.db.database import Base
 from app.db.models import Documentation
+from app.db.models.documentation import make_excerpt
 
 settings = get_settings()
 
@@ -35,11 +38,15 @@ DOC_FILES = [
 ]
 
 
+_SLUG_NONWORD = re.compile(r"[^\w\s-]")
+_SLUG_DASH = re.compile(r"[-\s]+")
+
+
 def slugify(text: str) -> str:
     """Convert text to URL-friendly slug."""
     text = text.lower()
-    text = re.sub(r"[^\w\s-]", "", text)
-    text = re.sub(r"[-\s]+", "-", text).strip("-")
+    text = _SLUG_NONWORD.sub("", text)
+    text = _SLUG_DASH.sub("-", text).strip("-")
     return text
 
 
@@ -47,7 +54,8 @@ async def sync_documentation():
     """Sync documentation files to database."""
     # Create engine
     database_url = settings.database_url.replace("postgresql://", "postgresql+asyncpg://")
-    engine = create_async_engine(database_url, echo=True)
+    # SQL logging would print every statement with its document bodies; opt in
+    engine = create_async_engine(database_url, echo=os.getenv("SQL_ECHO") == "1")
 
     async with engine.begin() as conn:
         await conn.run_sync(Base.metadata.create_all)
@@ -59,7 +67,17 @@ async def sync_documentation():
     print(f"LeRobot root: {lerobot_root}")
 
     async with async_session() as session:
-        for doc_info in DOC_FILES:
+        # Load the already-synced docs in one query instead of one per file
+        slugs = [slugify(doc_info["title"]) for doc_info in DOC_FILES]
+        result = await session.execute(
+            select(Documentation).where(Documentation.slug.in_(slugs))
+        )
+        existing_docs = {doc.slug: doc for doc in result.scalars()}
+
+        # One sync time for every document in this run
+        synced_at = datetime.utcnow()
+
+        for doc_info, slug in zip(DOC_FILES, slugs):
             doc_path = lerobot_root / doc_info["path"]
 
             if not doc_path.exists():
@@ -69,23 +87,31 @@ async def sync_documentation():
             print(f"Processing {doc_info['path']}...")
 
             # Read content
-            content = doc_path.read_text(encoding="utf-8")
-            slug = slugify(doc_info["title"])
-
-            # Check if exists
-            result = await session.execute(
-                select(Documentation).where(Documentation.slug == slug)
-            )
-            existing = result.scalar_one_or_none()
-
-            if existing:
+            # Off the event loop, and without text-mode newline translation
+            raw = await asyncio.to_thread(doc_path.read_bytes)
+            content = raw.decode("utf-8")
+            content_sha256 = hashlib.sha256(raw).hexdigest()
+
+            existing = existing_docs.get(slug)
+
+            if existing and (
+                existing.content_sha256 == content_sha256
+                and existing.title == doc_info["title"]
+                and existing.category == doc_info.get("category")
+                and existing.tags == doc_info.get("tags", [])
+            ):
+                # Nothing to write; leaving the row alone also keeps its updated_at, and
+                # with it the docs ETag, unchanged
+                print(f"  Unchanged: {doc_info['title']}")
+            elif existing:
                 # Update
                 existing.content = content
+                existing.content_sha256 = content_sha256
+                existing.excerpt = make_excerpt(content)
                 existing.title = doc_info["title"]
                 existing.category = doc_info.get("category")
                 existing.tags = doc_info.get("tags", [])
-                existing.source_updated_at = datetime.utcnow()
-                existing.updated_at = datetime.utcnow()
+                existing.source_updated_at = synced_at
                 print(f"  Updated: {doc_info['title']}")
             else:
                 # Create
@@ -94,11 +120,11 @@ async def sync_documentation():
                     slug=slug,
                     source_path=doc_info["path"],
                     content=content,
+                    content_sha256=content_sha256,
+                    excerpt=make_excerpt(content),
                     category=doc_info.get("category"),
                     tags=doc_info.get("tags", []),
-                    source_updated_at=datetime.utcnow(),
-                    created_at=datetime.utcnow(),
-                    updated_at=datetime.utcnow(),
+                    source_updated_at=synced_at,
                 )
                 session.add(doc)
                 print(f"  Created: {doc_info['title']}")